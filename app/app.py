@@ -191,7 +191,44 @@ if 'target_word' not in st.session_state:
 
 from models.lifecycle_engine import LifecycleEngine
 from models.analyzer import SlangAnalyzer
-lifecycle = LifecycleEngine()
+from models.change_detector import ALERTS_PATH, load_alerts
+from models.forecast import forecast_crossings
+
+
+# Streamlit re-executes this whole script on every interaction, so anything
+# with setup cost is a process-wide resource built on the first run only:
+# constructing LifecycleEngine creates and re-seeds the vault DB from the
+# archive CSV. Data freshness is handled inside each object (versioned
+# caches keyed on the archive/history files), not by rebuilding it.
+@st.cache_resource(show_spinner=False)
+def get_lifecycle_engine() -> LifecycleEngine:
+    return LifecycleEngine()
+
+
+@st.cache_resource(show_spinner=False)
+def get_analyzer() -> SlangAnalyzer:
+    return SlangAnalyzer()
+
+
+@st.cache_data(show_spinner=False)
+def _cached_alerts(signature) -> dict:
+    return load_alerts()
+
+
+def cringe_alerts() -> dict:
+    """
+    The change detector's alerts from data/cringe_alerts.csv, keyed by its
+    (mtime, size) so the CSV is re-read only when the auto-updater rewrote it.
+    """
+    try:
+        stat = os.stat(ALERTS_PATH)
+        signature = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        signature = None
+    return _cached_alerts(signature)
+
+
+lifecycle = get_lifecycle_engine()
 
 def validate_slang_word(word: str) -> tuple[bool, str]:
     """
@@ -232,6 +269,12 @@ with st.sidebar:
         else:
             st.error(error_msg)
 
+    # Growth metrics can be fitted over recent history only, so a word that
+    # peaked months ago and is collapsing now isn't shown as still growing.
+    growth_window_options = {"All history": None, "Last 30 days": 30, "Last 7 days": 7}
+    growth_window_label = st.selectbox("Growth window", list(growth_window_options))
+    growth_window = growth_window_options[growth_window_label]
+
     st.markdown("---")
     st.caption("From the 1600s to 2026\nTracking Linguistic Evolution")
 
@@ -247,10 +290,16 @@ if st.session_state.searched:
         # Make sure today's mention counts are recorded so the line chart
         # has fresh data even for a brand-new search. This is on-demand,
         # supplementing the daily history the scheduled auto-updater builds.
-        try:
-            scrape_word(target_word)
-        except Exception:
-            pass  # Network may be unavailable; fall back to whatever history exists.
+        # Once per word per day and session: reruns (e.g. changing the
+        # growth window) reuse what's already been scraped.
+        scrape_key = (target_word, time.strftime("%Y-%m-%d"))
+        scraped = st.session_state.setdefault("scraped", set())
+        if scrape_key not in scraped:
+            try:
+                scrape_word(target_word)
+                scraped.add(scrape_key)
+            except Exception:
+                pass  # Network may be unavailable; fall back to whatever history exists.
 
         if data:
             st.title(f" {data['word']}")
@@ -330,8 +379,16 @@ if st.session_state.searched:
             st.markdown("---")
             st.subheader("Niche vs. Mainstream Popularity")
 
-            analyzer = SlangAnalyzer()
-            analysis = analyzer.analyze_word(target_word)
+            analyzer = get_analyzer()
+            if growth_window is None:
+                # Full-history growth and the cringe alert come from the
+                # running trend statistics in O(1) (models/trend_stats.py);
+                # only the chart needs the daily series.
+                analysis = analyzer.trend_snapshot(target_word)
+                if analysis is not None:
+                    analysis['historical'] = analyzer.get_daily_series(target_word)
+            else:
+                analysis = analyzer.analyze_word(target_word, window=growth_window)
 
             if analysis is not None:
                 hist_df = analysis['historical']
@@ -379,6 +436,23 @@ if st.session_state.searched:
                     st.metric("Mainstream Growth", f"{metrics['mainstream_growth']*100:.1f}%")
                 with col3:
                     st.metric("Niche Growth", f"{metrics['niche_growth']*100:.1f}%")
+                st.caption(f"Growth fitted over: {growth_window_label.lower()}")
+
+                # Forward projection from the damped-trend forecaster (fitted
+                # once per history version for the whole archive, then cached).
+                projection = forecast_crossings(analyzer)
+                projected = projection[projection['word'] == target_word]
+                if not projected.empty and projected.iloc[0]['days_to_cringe'] > 0:
+                    st.caption(f"Projected to reach Cringe status around {projected.iloc[0]['cringe_date']}.")
+
+                # Shift flagged by the daily streaming detector (precomputed by
+                # the auto-updater; nothing is recomputed here).
+                detector_alert = cringe_alerts().get(target_word)
+                if detector_alert:
+                    st.warning(
+                        f"Daily tracker flagged a jump toward mainstream on {detector_alert['date']} "
+                        f"(mainstream/niche ratio {float(detector_alert['ratio']):.2f})."
+                    )
             else:
                 st.info(
                     "No usage history yet for this word — mention tracking just started. "
@@ -0,0 +1,50 @@
+"""
+Benchmark: fitting the damped-trend Holt forecaster (models/forecast.py) to
+a synthetic archive and projecting cringe-crossing dates for every word.
+
+    python benchmarks/bench_forecast.py --words 10000 --days 365
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.forecast import ALPHAS, BETAS, forecast_matrix  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--words", type=int, default=10000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--horizon", type=int, default=90)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    t = np.arange(args.days)
+    drift = rng.uniform(-0.02, 0.05, (args.words, 1))
+    matrix = {
+        "words": np.array([f"word{i:06d}" for i in range(args.words)]),
+        "first_day": np.full(args.words, 20000),
+        "last_day": np.full(args.words, 20000 + args.days - 1),
+        "lengths": np.full(args.words, args.days),
+        "niche": rng.poisson(8, (args.words, args.days)).astype(float),
+        "mainstream": rng.poisson(np.maximum(1 + drift * t, 0)).astype(float),
+    }
+
+    start = time.perf_counter()
+    result = forecast_matrix(matrix, args.horizon)
+    elapsed = time.perf_counter() - start
+
+    fits = 2 * len(ALPHAS) * len(BETAS)
+    print(f"archive:          {args.words:,} words x {args.days} days, {fits} parameter fits per word")
+    print(f"fit + project:    {elapsed:.2f} s ({elapsed / args.words * 1e6:.0f} us / word)")
+    print(f"projected to cross within {args.horizon} days: {int((result['days_to_cringe'] > 0).sum()):,} words")
+
+
+if __name__ == "__main__":
+    main()
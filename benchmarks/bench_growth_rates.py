@@ -0,0 +1,71 @@
+"""
+Benchmark: growth-rate estimation for the whole archive, the original
+per-word pure-Python least-squares loop vs. the batched NumPy
+`growth_rates` in models/trends.py.
+
+    python benchmarks/bench_growth_rates.py --words 10000 --days 365
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.trends import growth_rates, linear_growth_rate  # noqa: E402
+
+
+def reference_growth_rate(y) -> float:
+    """The original SlangAnalyzer._linear_growth_rate, kept as the baseline."""
+    n = len(y)
+    if n < 2:
+        return 0.0
+    x = list(range(n))
+    y = list(y)
+    mean_x = sum(x) / n
+    mean_y = sum(y) / n
+    denom = sum((xi - mean_x) ** 2 for xi in x)
+    if denom == 0:
+        return 0.0
+    slope = sum((xi - mean_x) * (yi - mean_y) for xi, yi in zip(x, y)) / denom
+    start_value = mean_y - slope * mean_x
+    if start_value <= 0:
+        return 0.0
+    end_value = start_value + slope * (n - 1)
+    return (end_value - start_value) / start_value
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--words", type=int, default=10000)
+    parser.add_argument("--days", type=int, default=365)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    trend = np.linspace(0, 5, args.days)
+    matrix = rng.poisson(5 + trend * rng.uniform(-1, 1, (args.words, 1))).astype(np.float64)
+
+    start = time.perf_counter()
+    expected = np.array([reference_growth_rate(row.tolist()) for row in matrix])
+    t_loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = np.array([linear_growth_rate(row) for row in matrix])
+    t_single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = growth_rates(matrix)
+    t_batch = time.perf_counter() - start
+
+    print(f"matrix:               {args.words:,} words x {args.days} days")
+    print(f"python loop:          {t_loop:.2f} s")
+    print(f"numpy, per word:      {t_single:.2f} s ({t_loop / t_single:.0f}x)")
+    print(f"numpy, batched:       {t_batch:.3f} s ({t_loop / t_batch:.0f}x)")
+    print(f"max abs difference:   {max(np.abs(single - expected).max(), np.abs(batched - expected).max()):.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: per-word history lookup, CSV (pd.read_csv + filter) vs. the
+memory-mapped binary format in data/history_binary.py.
+
+    python benchmarks/bench_history_binary.py --words 5000 --days 365
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.history_binary import BinaryHistory, csv_to_binary  # noqa: E402
+
+
+def make_history(n_words: int, n_days: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2025-01-01", periods=n_days).strftime("%Y-%m-%d")
+    words = [f"word{i:06d}" for i in range(n_words)]
+    return pd.DataFrame({
+        "date": np.repeat(dates, n_words),
+        "word": np.tile(words, n_days),
+        "niche_count": rng.poisson(3, n_words * n_days),
+        "mainstream_count": rng.poisson(2, n_words * n_days),
+    })
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--words", type=int, default=5000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "mentions_history.csv")
+        bin_path = os.path.join(tmp, "mentions_history.bin")
+        make_history(args.words, args.days).to_csv(csv_path, index=False)
+        csv_to_binary(csv_path, bin_path)
+        target = f"word{args.words // 2:06d}"
+
+        def csv_lookup():
+            df = pd.read_csv(csv_path)
+            return df[df["word"].str.lower() == target]
+
+        def binary_lookup():
+            with BinaryHistory(bin_path) as history:
+                return history.series(target)["mainstream"].sum()
+
+        t_csv = timed(csv_lookup, args.repeat)
+        t_bin = timed(binary_lookup, args.repeat)
+
+        print(f"records:        {args.words * args.days:,}")
+        print(f"csv size:       {os.path.getsize(csv_path) / 1e6:.1f} MB")
+        print(f"binary size:    {os.path.getsize(bin_path) / 1e6:.1f} MB")
+        print(f"pd.read_csv:    {t_csv * 1000:.1f} ms / lookup")
+        print(f"mmap binary:    {t_bin * 1000:.2f} ms / lookup")
+        print(f"speedup:        {t_csv / t_bin:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Indexed slang archive
+---------------------
+One process-wide, in-memory view of each slang archive CSV
+(data/slang_master_2026.csv, data/slang_2026_master.csv). Every consumer
+(SlangAnalyzer, LifecycleEngine, SearchEngine, DataLoader, the
+auto-updater) used to parse its CSV on its own, some of them on every
+lookup; they now share one parse per file.
+
+`load(path)` returns an `Archive` with:
+
+    get(word)            O(1) lookup by normalized (stripped, lowercased) word
+    get_last(word)       the same, but the word's last row rather than its first
+    with_prefix(prefix)  words starting with `prefix`, via bisect on sorted keys
+    in_category(name)    words in a `category` (case-insensitive)
+    rows / frame()       every raw row, in file order, for bulk consumers
+
+The file's (mtime, size) is checked on each `load`, and the archive is
+re-read only when it changed, e.g. after the auto-updater appends rows.
+A missing file loads as an empty archive.
+"""
+
+import csv
+import os
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MASTER_CSV_PATH = os.path.join(_PROJECT_ROOT, "data", "slang_master_2026.csv")
+SEARCH_CSV_PATH = os.path.join(_PROJECT_ROOT, "data", "slang_2026_master.csv")
+
+_lock = threading.Lock()
+_archives: Dict[str, "Archive"] = {}
+
+
+def normalize(word: str) -> str:
+    return (word or "").strip().lower()
+
+
+def _signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class Archive:
+    """Parsed rows of one archive CSV plus word, prefix and category indexes."""
+
+    def __init__(self, path: str, signature: Optional[Tuple[int, int]] = None) -> None:
+        self.path = path
+        self.signature = signature
+        self.fieldnames: List[str] = []
+        self.rows: List[Dict[str, str]] = []
+        if signature is not None:
+            with open(path, newline="", encoding="utf-8") as f:
+                reader = csv.DictReader(f)
+                self.fieldnames = list(reader.fieldnames or [])
+                self.rows = list(reader)
+
+        # get() is first-row-wins for duplicate words, as the analyzer's and
+        # engine's old linear scans were; get_last() is last-row-wins, as
+        # SearchEngine's old dict was.
+        self._entries: Dict[str, Dict[str, str]] = {}
+        self._last: Dict[str, Dict[str, str]] = {}
+        for row in self.rows:
+            word = normalize(row.get("word"))
+            if word:
+                self._entries.setdefault(word, row)
+                self._last[word] = row
+        self._sorted = sorted(self._entries)
+        self._by_category: Dict[str, List[str]] = {}
+        for word in self._sorted:
+            category = normalize(self._entries[word].get("category"))
+            if category:
+                self._by_category.setdefault(category, []).append(word)
+        self._frame: Optional[pd.DataFrame] = None
+
+    def __contains__(self, word: str) -> bool:
+        return normalize(word) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, word: str) -> Optional[Dict[str, str]]:
+        """The archive row for `word`, or None."""
+        return self._entries.get(normalize(word))
+
+    def get_last(self, word: str) -> Optional[Dict[str, str]]:
+        """The last archive row for `word`, or None."""
+        return self._last.get(normalize(word))
+
+    def words(self) -> List[str]:
+        """Every normalized word, sorted."""
+        return list(self._sorted)
+
+    def with_prefix(self, prefix: str) -> List[str]:
+        prefix = normalize(prefix)
+        start = bisect_left(self._sorted, prefix)
+        end = bisect_left(self._sorted, prefix + "\uffff")
+        return self._sorted[start:end]
+
+    def categories(self) -> List[str]:
+        return sorted(self._by_category)
+
+    def in_category(self, category: str) -> List[str]:
+        return list(self._by_category.get(normalize(category), []))
+
+    def frame(self) -> pd.DataFrame:
+        """All rows as a string-typed DataFrame (built once, shared: don't mutate)."""
+        if self._frame is None:
+            self._frame = pd.DataFrame(self.rows, columns=self.fieldnames, dtype=str)
+        return self._frame
+
+
+def load(path: str = MASTER_CSV_PATH) -> Archive:
+    """The shared `Archive` for `path`, re-read only if the file changed."""
+    key = os.path.abspath(path)
+    signature = _signature(key)
+    with _lock:
+        archive = _archives.get(key)
+        if archive is None or archive.signature != signature:
+            archive = _archives[key] = Archive(key, signature)
+        return archive
@@ -14,7 +14,9 @@ It deliberately never *removes* or *overwrites* existing rows — only
 appends new, deduplicated entries — so it's safe to re-run repeatedly.
 """
 
+import argparse
 import csv
+import json
 import os
 import re
 import sys
@@ -24,41 +26,26 @@ from datetime import datetime
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, _PROJECT_ROOT)
 
-from data.no_api_scraper import fetch_reddit_data, SUBREDDITS, PENDING_WORDS_PATH  # noqa: E402
-from data.urban_dictionary import fetch_definition as fetch_ud_definition  # noqa: E402
-from models.slang_detector import is_slang  # noqa: E402
+from data.no_api_scraper import (  # noqa: E402
+    REDDIT_LIMITER, REQUEST_INTERVAL, SUBREDDITS, FetchError, fetch_reddit_data,
+)
+from data.urban_dictionary import fetch_definition as fetch_ud_definition, fetch_definitions  # noqa: E402
+from data import archive, history_store, refresh_scheduler  # noqa: E402
+from data.pending_queue import Batch, PendingQueue  # noqa: E402
+from data.discovery import MAX_WORD_LEN, MIN_WORD_LEN, STOPWORDS, CandidateCounter  # noqa: E402
+from models.slang_detector import is_slang_batch  # noqa: E402
 from models.analyzer import SlangAnalyzer  # noqa: E402
+from models import change_detector  # noqa: E402
 
 CSV_PATH = os.path.join(_PROJECT_ROOT, "data", "slang_master_2026.csv")
 
-# Common English words / Reddit boilerplate to never flag as "new slang",
-# even if they pass the heuristic (keeps noise out of the CSV).
-STOPWORDS = {
-    "the", "and", "for", "are", "but", "not", "you", "all", "can", "her",
-    "was", "one", "our", "out", "day", "get", "has", "him", "his", "how",
-    "man", "new", "now", "old", "see", "two", "way", "who", "boy", "did",
-    "its", "let", "put", "say", "she", "too", "use", "this", "that", "with",
-    "have", "from", "they", "will", "what", "when", "your", "just", "into",
-    "post", "comment", "reddit", "thread", "deleted", "removed", "edit",
-    "https", "http", "www", "com",
-}
-
-MIN_WORD_LEN = 3
-MAX_WORD_LEN = 20
 MIN_MENTIONS_TO_QUALIFY = 2  # how many times a word must appear before we consider it
+MAX_PENDING_PER_RUN = 50     # most-searched pending words retried per run (5 requests each)
 
 
 def load_known_words() -> set:
     """Read the existing CSV and return the set of already-known words (lowercased)."""
-    known = set()
-    if not os.path.exists(CSV_PATH):
-        return known
-    with open(CSV_PATH, newline="", encoding="utf-8") as f:
-        for row in csv.DictReader(f):
-            w = row.get("word", "").strip().lower()
-            if w:
-                known.add(w)
-    return known
+    return set(archive.load(CSV_PATH).words())
 
 
 def extract_candidate_words(text: str) -> list:
@@ -73,88 +60,114 @@ def extract_candidate_words(text: str) -> list:
 
 
 def load_pending_words() -> list:
-    """Words real users searched for that Deep Search couldn't resolve live."""
-    if not os.path.exists(PENDING_WORDS_PATH):
-        return []
-    with open(PENDING_WORDS_PATH, encoding="utf-8") as f:
-        return [line.strip() for line in f if line.strip()]
+    """Words real users searched for that Deep Search couldn't resolve live, most-searched first."""
+    return PendingQueue().peek()
 
 
-def clear_pending_words():
-    if os.path.exists(PENDING_WORDS_PATH):
-        os.remove(PENDING_WORDS_PATH)
+def clear_pending_words(resolved=None):
+    """
+    Drop `resolved` words from the pending queue (all of them if None).
+    Words logged by live searches since the run loaded the queue are kept.
+    """
+    PendingQueue().remove(resolved)
 
 
-def resolve_pending_words(known_words: set) -> list:
+def make_entry(word: str, niche_count: int, mainstream_count: int, sample_context: str,
+               analyzer: SlangAnalyzer, define=fetch_ud_definition) -> dict:
+    """
+    Archive row for a word that passed the slang check: lifecycle status
+    from its counts, meaning from `define` (Urban Dictionary) or else the
+    Reddit context it was found in.
+    """
+    cringe_score = analyzer.calculate_cringe_score(
+        niche_usage=niche_count, mainstream_usage=mainstream_count
+    )
+    status = analyzer.detect_lifecycle_status(cringe_score)
+
+    ud_definition = define(word)
+    if ud_definition:
+        meaning = ud_definition
+        category = "Slang (Urban Dictionary)"
+    else:
+        context = sample_context.replace("\n", " ").strip()
+        if len(context) > 150:
+            context = context[:147] + "..."
+        meaning = f"Auto-detected from Reddit usage. Context: \"{context}\""
+        category = "Auto-Detected"
+
+    return {
+        "word": word,
+        "meaning": meaning,
+        "origin_era": f"{datetime.now().year} (Auto-Detected)",
+        "category": category,
+        "2026_status": status,
+    }
+
+
+def resolve_pending_words(known_words: set, workers: int = 1, pending=None, unsearched=None) -> list:
     """
     Specifically (re)search every word a live user looked up but Deep Search
     couldn't find anything for. This runs with full internet access and no
     UI timeout pressure, so it can afford to be much more thorough than a
     live request — checking every configured subreddit individually.
+
+    Words with a failed search are skipped and appended to `unsearched`
+    (if given), so the caller can leave them queued.
     """
-    pending = load_pending_words()
+    if pending is None:
+        pending = load_pending_words()
     if not pending:
         return []
 
     print(f"Found {len(pending)} pending word(s) from failed live searches: {pending}")
     analyzer = SlangAnalyzer()
-    current_year = datetime.now().year
     new_entries = []
+    found = []
 
     for word in pending:
         if word in known_words:
             continue
 
         niche_count, mainstream_count, sample_context, sample_sub = 0, 0, "", ""
-        for sub in SUBREDDITS["niche"]:
-            results = fetch_reddit_data(sub, word, is_mainstream=False)
-            niche_count += len(results)
-            if results and not sample_context:
-                sample_context, sample_sub = results[0][3], sub
-        for sub in SUBREDDITS["mainstream"]:
-            results = fetch_reddit_data(sub, word, is_mainstream=True)
-            mainstream_count += len(results)
-            if results and not sample_context:
-                sample_context, sample_sub = results[0][3], sub
+        try:
+            for sub in SUBREDDITS["niche"]:
+                results = fetch_reddit_data(sub, word, is_mainstream=False, raise_errors=True)
+                niche_count += len(results)
+                if results and not sample_context:
+                    sample_context, sample_sub = results[0][3], sub
+            for sub in SUBREDDITS["mainstream"]:
+                results = fetch_reddit_data(sub, word, is_mainstream=True, raise_errors=True)
+                mainstream_count += len(results)
+                if results and not sample_context:
+                    sample_context, sample_sub = results[0][3], sub
+        except FetchError as e:
+            print(f"  Leaving '{word}' queued: {e}")
+            if unsearched is not None:
+                unsearched.append(word)
+            continue
 
         total_mentions = niche_count + mainstream_count
         if total_mentions < MIN_MENTIONS_TO_QUALIFY or not sample_context:
             continue
+        found.append((word, niche_count, mainstream_count, sample_context, sample_sub))
 
-        verdict = is_slang(word, sample_context, sample_sub)
-        if not verdict["is_slang"]:
-            continue
+    verdicts = is_slang_batch(((w, ctx, sub) for w, _n, _m, ctx, sub in found), workers=workers)
+    accepted = [f for f, verdict in zip(found, verdicts) if verdict["is_slang"]]
+    definitions = fetch_definitions(word for word, *_rest in accepted)
+    for word, niche_count, mainstream_count, sample_context, _sub in accepted:
+        new_entries.append(make_entry(word, niche_count, mainstream_count, sample_context, analyzer,
+                                      define=definitions.get))
 
-        cringe_score = analyzer.calculate_cringe_score(
-            niche_usage=niche_count, mainstream_usage=mainstream_count
-        )
-        status = analyzer.detect_lifecycle_status(cringe_score)
+    return new_entries
 
-        ud_definition = fetch_ud_definition(word)
-        if ud_definition:
-            meaning = ud_definition
-            category = "Slang (Urban Dictionary)"
-        else:
-            context = sample_context.replace("\n", " ").strip()
-            if len(context) > 150:
-                context = context[:147] + "..."
-            meaning = f"Auto-detected from Reddit usage. Context: \"{context}\""
-            category = "Auto-Detected"
 
-        new_entries.append({
-            "word": word,
-            "meaning": meaning,
-            "origin_era": f"{current_year} (Auto-Detected)",
-            "category": category,
-            "2026_status": status,
-        })
-
-    return new_entries
+SEED_TERMS = ["slang", "trend", "vibe", "viral"]
 
 
 def discover_candidates(sample_words=None, max_posts_per_sub=50):
     """
-    Scan configured niche/mainstream subreddits for trending terms.
+    Scan configured niche/mainstream subreddits for trending terms, single
+    words and two-word phrases, in bounded memory (see data/discovery.py).
 
     Args:
         sample_words: optional seed list of words to specifically search for
@@ -163,27 +176,17 @@ def discover_candidates(sample_words=None, max_posts_per_sub=50):
         max_posts_per_sub: cap on posts fetched per subreddit/search call.
 
     Returns:
-        dict: word -> {
+        dict: word or phrase -> {
             'niche_count': int, 'mainstream_count': int,
             'sample_context': str, 'sample_subreddit': str
         }
     """
-    seed_terms = sample_words or ["slang", "trend", "vibe", "viral"]
-    stats = {}
+    seed_terms = sample_words or SEED_TERMS
+    counter = CandidateCounter()
 
     def scan(sub, keyword, is_mainstream):
         results = fetch_reddit_data(sub, keyword, is_mainstream=is_mainstream)
-        for _id, _kw, subreddit, content, _ts, mainstream in results[:max_posts_per_sub]:
-            for word in extract_candidate_words(content):
-                entry = stats.setdefault(
-                    word,
-                    {"niche_count": 0, "mainstream_count": 0,
-                     "sample_context": content, "sample_subreddit": subreddit},
-                )
-                if mainstream:
-                    entry["mainstream_count"] += 1
-                else:
-                    entry["niche_count"] += 1
+        counter.add_results(results[:max_posts_per_sub])
 
     for term in seed_terms:
         for sub in SUBREDDITS["niche"]:
@@ -191,157 +194,283 @@ def discover_candidates(sample_words=None, max_posts_per_sub=50):
         for sub in SUBREDDITS["mainstream"]:
             scan(sub, term, is_mainstream=True)
 
-    return stats
+    return counter.stats()
 
 
-def build_new_entries(stats: dict, known_words: set) -> list:
-    """Filter discovered candidates down to genuinely new, slang-like entries."""
+def build_new_entries(stats: dict, known_words: set, workers: int = 1) -> list:
+    """
+    Filter discovered candidates down to genuinely new, slang-like entries.
+    `workers` > 1 scores the candidates in a process pool (same result).
+    """
     analyzer = SlangAnalyzer()
     new_entries = []
-    current_year = datetime.now().year
-
-    for word, info in stats.items():
-        if word in known_words:
-            continue
 
-        total_mentions = info["niche_count"] + info["mainstream_count"]
-        if total_mentions < MIN_MENTIONS_TO_QUALIFY:
-            continue
-
-        verdict = is_slang(word, info["sample_context"], info["sample_subreddit"])
-        if not verdict["is_slang"]:
-            continue
-
-        cringe_score = analyzer.calculate_cringe_score(
-            niche_usage=info["niche_count"], mainstream_usage=info["mainstream_count"]
-        )
-        status = analyzer.detect_lifecycle_status(cringe_score)
-
-        ud_definition = fetch_ud_definition(word)
-        if ud_definition:
-            meaning = ud_definition
-            category = "Slang (Urban Dictionary)"
-        else:
-            context = info["sample_context"].replace("\n", " ").strip()
-            if len(context) > 150:
-                context = context[:147] + "..."
-            meaning = f"Auto-detected from Reddit usage. Context: \"{context}\""
-            category = "Auto-Detected"
-
-        new_entries.append({
-            "word": word,
-            "meaning": meaning,
-            "origin_era": f"{current_year} (Auto-Detected)",
-            "category": category,
-            "2026_status": status,
-        })
+    candidates = [
+        (word, info) for word, info in stats.items()
+        if word not in known_words
+        and info["niche_count"] + info["mainstream_count"] >= MIN_MENTIONS_TO_QUALIFY
+    ]
+    # Words from the same post share a sample_context, so score them together.
+    verdicts = is_slang_batch(
+        ((word, info["sample_context"], info["sample_subreddit"]) for word, info in candidates),
+        workers=workers,
+    )
+
+    accepted = [c for c, verdict in zip(candidates, verdicts) if verdict["is_slang"]]
+    # Definitions are looked up together, under one deadline (see
+    # data/urban_dictionary.py); a miss falls back to the Reddit context.
+    definitions = fetch_definitions(word for word, _info in accepted)
+    for word, info in accepted:
+        new_entries.append(make_entry(word, info["niche_count"], info["mainstream_count"],
+                                      info["sample_context"], analyzer, define=definitions.get))
 
     return new_entries
 
 
-def append_to_csv(new_entries: list):
+def append_to_csv(new_entries: list, csv_path: str = CSV_PATH):
     """Append new rows to the CSV, creating it with headers if it doesn't exist."""
     if not new_entries:
         print("No new slang words to add. Database is up to date.")
         return
 
-    file_exists = os.path.exists(CSV_PATH)
+    file_exists = os.path.exists(csv_path)
     fieldnames = ["word", "meaning", "origin_era", "category", "2026_status"]
 
-    with open(CSV_PATH, mode="a", newline="", encoding="utf-8") as f:
+    with open(csv_path, mode="a", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         if not file_exists:
             writer.writeheader()
         for entry in new_entries:
             writer.writerow(entry)
+        # Durable before the run moves on (and clears the pending words).
+        f.flush()
+        os.fsync(f.fileno())
 
-    print(f"Added {len(new_entries)} new word(s) to {CSV_PATH}:")
+    print(f"Added {len(new_entries)} new word(s) to {csv_path}:")
     for e in new_entries:
         print(f"  - {e['word']} ({e['2026_status']})")
 
 
-MENTIONS_HISTORY_PATH = os.path.join(_PROJECT_ROOT, "data", "mentions_history.csv")
 MAX_WORDS_PER_RUN = 150  # cap daily request volume to stay well within rate limits
 
 
-def collect_daily_mentions(known_words: set):
+def collect_daily_mentions(known_words: set, today: str = None):
     """
     Record today's niche/mainstream mention counts for every known word into
-    a git-tracked history CSV.
+    the git-tracked, month-sharded history (data/mentions_history/, see
+    data/history_store.py). Only the current month's shard and the manifest
+    are read or written, so the daily commit stays small.
 
-    Why a CSV and not the SQLite 'mentions' table: *.db files are gitignored
+    Why CSV and not the SQLite 'mentions' table: *.db files are gitignored
     (regenerated fresh on each container/run), and both Streamlit Cloud and
     GitHub Actions start from a clean checkout every time. Without a
     git-committed file, "today's" counts would be silently discarded and the
     niche-vs-mainstream line chart could never build real history over time.
     This function is what actually makes that chart meaningful day over day.
-    """
-    today = datetime.now().strftime("%Y-%m-%d")
 
-    already_done_today = set()
-    if os.path.exists(MENTIONS_HISTORY_PATH):
-        with open(MENTIONS_HISTORY_PATH, newline="", encoding="utf-8") as f:
-            for row in csv.DictReader(f):
-                if row.get("date") == today:
-                    already_done_today.add(row.get("word", "").strip().lower())
-
-    words_to_scan = sorted(w for w in known_words if w not in already_done_today)[:MAX_WORDS_PER_RUN]
+    `today` (YYYY-MM-DD) is the date the rows are recorded under; it
+    defaults to the current date.
+    """
+    today = today or datetime.now().strftime("%Y-%m-%d")
+    words_to_scan = select_words_to_scan(known_words, today)
     if not words_to_scan:
         print("Mention history already up to date for today.")
         return
 
     print(f"Collecting today's mention counts for {len(words_to_scan)} word(s)...")
-    file_exists = os.path.exists(MENTIONS_HISTORY_PATH)
-    fieldnames = ["date", "word", "niche_count", "mainstream_count"]
+    rows = []
+    for word in words_to_scan:
+        niche_count = sum(
+            len(fetch_reddit_data(sub, word, is_mainstream=False))
+            for sub in SUBREDDITS["niche"]
+        )
+        mainstream_count = sum(
+            len(fetch_reddit_data(sub, word, is_mainstream=True))
+            for sub in SUBREDDITS["mainstream"]
+        )
+        rows.append({
+            "date": today,
+            "word": word,
+            "niche_count": niche_count,
+            "mainstream_count": mainstream_count,
+        })
+
+    record_mentions(rows)
 
-    with open(MENTIONS_HISTORY_PATH, mode="a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        if not file_exists:
-            writer.writeheader()
 
-        for word in words_to_scan:
-            niche_count = sum(
-                len(fetch_reddit_data(sub, word, is_mainstream=False))
-                for sub in SUBREDDITS["niche"]
-            )
-            mainstream_count = sum(
-                len(fetch_reddit_data(sub, word, is_mainstream=True))
-                for sub in SUBREDDITS["mainstream"]
-            )
-            writer.writerow({
-                "date": today,
-                "word": word,
-                "niche_count": niche_count,
-                "mainstream_count": mainstream_count,
-            })
-
-    print(f"Recorded mention history for {len(words_to_scan)} word(s) on {today}.")
-
-
-def main():
+def select_words_to_scan(known_words: set, today: str) -> list:
+    """
+    Words whose counts to fetch today, at most MAX_WORDS_PER_RUN: ranked by
+    staleness, volatility and search demand with a maximum-staleness
+    guarantee (see data/refresh_scheduler.py).
+    """
+    words = refresh_scheduler.plan(known_words, today, MAX_WORDS_PER_RUN)
+    print(refresh_scheduler.report(words, known_words, MAX_WORDS_PER_RUN))
+    return words
+
+
+def record_mentions(rows: list, data_dir: str = None) -> None:
+    """
+    Persist one run's history rows (date, word, niche_count,
+    mainstream_count): the month shard, the running trend statistics and
+    the cringe-shift detector. `data_dir` redirects all of it from data/
+    to another directory (the offline benchmark uses a temporary one).
+    """
+    if not rows:
+        return
+    if data_dir is None:
+        analyzer, history_dir = SlangAnalyzer(), history_store.HISTORY_DIR
+        detector_paths = (change_detector.STATE_PATH, change_detector.ALERTS_PATH)
+    else:
+        analyzer = SlangAnalyzer(os.path.join(data_dir, "slang_data.db"))
+        history_dir = os.path.join(data_dir, "mentions_history")
+        detector_paths = (os.path.join(data_dir, "changepoint_state.csv"),
+                          os.path.join(data_dir, "cringe_alerts.csv"))
+    # Bring the running trend statistics up to date *before* appending, so
+    # today's rows can be folded in incrementally rather than triggering a
+    # rebuild of the whole table later.
+    stats_store = analyzer.sync_trend_stats()
+    history_store.append_rows(rows, history_dir=history_dir)
+    stats_store.add_counts(
+        [(r["word"], r["date"], r["niche_count"], r["mainstream_count"]) for r in rows],
+        history_version=history_store.history_version(history_dir),
+    )
+    # Commit-able copy for fresh checkouts; only when the table holds
+    # exactly the history (no live mentions folded in).
+    if not analyzer.has_live_mentions():
+        stats_store.export_snapshot()
+    raised = change_detector.update(rows, *detector_paths)
+    for alert in raised:
+        print(f"  ! Cringe-threshold shift detected for '{alert['word']}' (ratio {alert['ratio']})")
+    print(f"Recorded mention history for {len(rows)} word(s) on {rows[0]['date']}.")
+
+
+def _run_date(value: str) -> str:
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM-DD, got {value!r}")
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Discover new slang and record today's mention counts.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes for candidate scoring (default: 1, serial)")
+    parser.add_argument("--fetch-workers", type=int, default=4,
+                        help="concurrent Reddit fetchers in the pipelined run (default: 4)")
+    parser.add_argument("--request-interval", type=float,
+                        help=f"minimum seconds between Reddit requests (default: {REQUEST_INTERVAL}); "
+                        "caps throughput at 1/interval requests per second. With --benchmark the "
+                        "default is no limit")
+    parser.add_argument("--serial", action="store_true",
+                        help="run each step to completion before the next, without pipelining")
+    parser.add_argument("--fresh", action="store_true",
+                        help="ignore today's run journal instead of resuming from it")
+    parser.add_argument("--date", type=_run_date, help="run date, YYYY-MM-DD (default: today) that mention counts "
+                        "are recorded under; a retry of an interrupted run passes its date to "
+                        "resume from the journal")
+    bench = parser.add_argument_group("offline benchmark (see data/updater_benchmark.py)")
+    bench.add_argument("--benchmark", action="store_true",
+                       help="time a run against fixtures in a temporary data directory and print JSON")
+    bench.add_argument("--archive-size", type=int, default=1000, help="synthetic archive words")
+    bench.add_argument("--fixtures", help="JSON fixtures: keyword or 'subreddit/keyword' -> post texts")
+    bench.add_argument("--latency", type=float, default=0.0, help="simulated seconds per Reddit request")
+    bench.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        from data import updater_benchmark
+
+        report = updater_benchmark.run_benchmark(
+            archive_size=args.archive_size,
+            fixtures=updater_benchmark.load_fixtures(args.fixtures) if args.fixtures else None,
+            latency=args.latency, request_interval=args.request_interval or 0.0,
+            fetch_workers=args.fetch_workers, score_workers=args.workers,
+        )
+        text = json.dumps(report, indent=2)
+        print(text)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        return
+
+    if args.request_interval is not None:
+        REDDIT_LIMITER.interval = args.request_interval
+
     print(">>> AUTO UPDATER: Discovering new slang candidates...")
     known_words = load_known_words()
     print(f"Loaded {len(known_words)} known words from archive.")
 
+    # A legacy single-file history is split into month shards first, since
+    # both paths check which words were already recorded today.
+    if history_store.migrate_legacy():
+        print(f"Migrated legacy mention history into {history_store.HISTORY_DIR}.")
+
+    today = args.date or datetime.now().strftime("%Y-%m-%d")
+    if not args.serial:
+        from data.update_pipeline import UpdatePipeline
+        from data.run_journal import JOURNAL_PATH, RunJournal
+
+        pending_queue = PendingQueue()
+        journal = RunJournal(today, JOURNAL_PATH)
+        if args.fresh:
+            if journal.lease:
+                pending_queue.release(Batch(journal.lease, []))
+            journal.discard()
+            journal = RunJournal(today, JOURNAL_PATH)
+        if journal.lease:
+            # A killed run never released its lease; take the same words back.
+            batch = pending_queue.reclaim(journal.lease)
+        else:
+            batch = pending_queue.dequeue(MAX_PENDING_PER_RUN)
+            journal.record_lease(batch.token)
+        pending = batch.words
+        if pending:
+            print(f"Found {len(pending)} pending word(s) from failed live searches: {pending}")
+        if journal.resumed:
+            print(f"Resuming today's interrupted run: {journal.resumed} fetch(es) already journaled.")
+        try:
+            run = UpdatePipeline(known_words, pending, fetch_workers=args.fetch_workers,
+                                 score_workers=args.workers, today=today, journal=journal).run()
+        except BaseException:
+            pending_queue.release(batch)
+            raise
+        # Entries and history are written by now; only then let go of the
+        # pending words that were actually searched, and of the journal.
+        # Words whose searches failed go back to the queue for the next run.
+        failed = set(run.unsearched)
+        pending_queue.ack(batch, [w for w in batch.words if w not in failed])
+        pending_queue.release(batch)
+        journal.discard()
+        print(f"Scanned {run.candidates_scanned} candidate words across configured subreddits.")
+        print(f"Added {len(run.pending_entries)} pending and {len(run.new_entries)} discovered word(s).")
+        print(run.report())
+        print(">>> AUTO UPDATER: Done.")
+        return
+
     # Step 1: resolve words that live users searched for but Deep Search
     # couldn't find anything on (the highest-value, demand-driven entries).
-    pending_entries = resolve_pending_words(known_words)
+    pending = load_pending_words()[:MAX_PENDING_PER_RUN]
+    unsearched = []
+    pending_entries = resolve_pending_words(known_words, workers=args.workers, pending=pending,
+                                            unsearched=unsearched)
     if pending_entries:
         append_to_csv(pending_entries)
         known_words.update(e["word"] for e in pending_entries)
-    clear_pending_words()
+    clear_pending_words([w for w in pending if w not in set(unsearched)])
 
     # Step 2: general discovery scan across seed terms for organic trends.
     stats = discover_candidates()
     print(f"Scanned {len(stats)} candidate words across configured subreddits.")
 
-    new_entries = build_new_entries(stats, known_words)
+    new_entries = build_new_entries(stats, known_words, workers=args.workers)
     append_to_csv(new_entries)
     known_words.update(e["word"] for e in new_entries)
 
     # Step 3: record today's niche/mainstream counts for every known word,
     # building the persistent history the line chart depends on.
-    collect_daily_mentions(known_words)
+    collect_daily_mentions(known_words, today)
 
     print(">>> AUTO UPDATER: Done.")
 
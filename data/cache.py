@@ -1,7 +1,9 @@
 import functools
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Hashable, Optional, Tuple
 
 class CacheEntry:
     def __init__(self, value: Any, ttl: int):
@@ -43,6 +45,56 @@ class SimpleCache:
         """Clear entire cache."""
         self.cache.clear()
 
+class VersionedLRUCache:
+    """
+    Bounded LRU cache whose entries are only valid for the data version they
+    were computed from. A lookup with a newer version is a miss, and the
+    stale entry is replaced on the next `set`. Thread-safe, since Streamlit
+    serves concurrent sessions from one process.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (version, value)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, version: Hashable) -> Tuple[bool, Any]:
+        """Return (found, value) for `key` at `version`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, version: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key: Hashable, version: Hashable, compute: Callable[[], Any]) -> Any:
+        found, value = self.get(key, version)
+        if not found:
+            value = compute()
+            self.set(key, version, value)
+        return value
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "size": len(self._entries), "maxsize": self.maxsize}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
 # Global cache instance
 _cache = SimpleCache(maxsize=256, ttl=3600)
 
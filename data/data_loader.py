@@ -2,6 +2,7 @@ import pandas as pd
 import sqlite3
 from pathlib import Path
 from app.logger import get_logger
+from data import archive
 
 logger = get_logger(__name__)
 
@@ -37,8 +38,8 @@ class DataLoader:
                 logger.warning(f"CSV not found at {csv_path}")
                 return pd.DataFrame()
             
-            # Load with error handling
-            df = pd.read_csv(csv_path, encoding='utf-8')
+            # Shared, already-parsed archive (copied: callers may mutate it)
+            df = archive.load(str(csv_path)).frame().copy()
             
             # Validate
             if df.empty:
@@ -0,0 +1,171 @@
+"""
+Streaming candidate discovery
+-----------------------------
+Bounded-memory replacement for the per-token dict discover_candidates used
+to build. That dict kept a full post as sample context for every distinct
+token it ever saw, and it only knew unigrams, so multi-word slang like
+"aura farming" or "404 coded" could never be discovered.
+
+Posts are tokenized as they arrive, and two Space-Saving summaries
+(Metwally et al.) count unigram and bigram candidates:
+
+  - Each summary monitors at most `capacity` terms. A new term evicts the
+    current minimum and inherits its count as its error bound.
+  - Any term occurring more than N / capacity times (N = tokens seen) is
+    guaranteed to stay monitored.
+  - Each monitored term keeps its niche/mainstream counts since it was
+    monitored (a lower bound) and a sample context of at most
+    CONTEXT_CHARS characters: a window of the post centred on the term's
+    first monitored occurrence, always containing the whole term.
+
+Memory is therefore O(capacity) however many posts are scanned.
+
+A bigram only becomes a candidate if its two words are cohesive: their
+Dice coefficient, 2 * count(bigram) / (count(first) + count(second)), is
+at least MIN_COHESION. Words that mostly occur together ("aura farming")
+pass; a phrase built on a word that is common on its own ("best friend")
+doesn't.
+"""
+
+import heapq
+import re
+from typing import Dict, List, Optional, Tuple
+
+CAPACITY = 10000
+CONTEXT_CHARS = 280
+MIN_COHESION = 0.5
+
+MIN_WORD_LEN = 3
+MAX_WORD_LEN = 20
+
+# Common English words / Reddit boilerplate to never flag as "new slang",
+# even if they pass the heuristic (keeps noise out of the CSV).
+STOPWORDS = {
+    "the", "and", "for", "are", "but", "not", "you", "all", "can", "her",
+    "was", "one", "our", "out", "day", "get", "has", "him", "his", "how",
+    "man", "new", "now", "old", "see", "two", "way", "who", "boy", "did",
+    "its", "let", "put", "say", "she", "too", "use", "this", "that", "with",
+    "have", "from", "they", "will", "what", "when", "your", "just", "into",
+    "post", "comment", "reddit", "thread", "deleted", "removed", "edit",
+    "https", "http", "www", "com",
+}
+# Short function words that never start or end a slang bigram.
+BIGRAM_STOPWORDS = STOPWORDS | {"is", "to", "of", "in", "it", "on", "at", "be", "as", "an", "or", "if", "by"}
+
+_UNIGRAM_RE = re.compile(r"[a-z']+")
+_BIGRAM_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+
+class SpaceSaving:
+    """
+    Top-`capacity` heavy hitters. Each monitored term maps to
+    [count, error, niche, mainstream, context, subreddit]; `count` is an
+    overestimate by at most `error`.
+    """
+
+    def __init__(self, capacity: int = CAPACITY) -> None:
+        self.capacity = capacity
+        self.items: Dict[str, list] = {}
+        # (count, seq, term) entries, invalidated lazily: an entry is live
+        # only while the term is monitored with exactly that count.
+        self._heap: List[Tuple[int, int, str]] = []
+        self._seq = 0
+
+    def __contains__(self, term: str) -> bool:
+        return term in self.items
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def count(self, term: str) -> Optional[int]:
+        item = self.items.get(term)
+        return item[0] if item else None
+
+    def add(self, term: str, is_mainstream: bool, context: str, subreddit: str) -> None:
+        item = self.items.get(term)
+        if item is None:
+            floor = self._evict_min() if len(self.items) >= self.capacity else 0
+            item = self.items[term] = [floor, floor, 0, 0, context, subreddit]
+        item[0] += 1
+        item[3 if is_mainstream else 2] += 1
+        self._push(item[0], term)
+
+    def _push(self, count: int, term: str) -> None:
+        heapq.heappush(self._heap, (count, self._seq, term))
+        self._seq += 1
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(item[0], i, t) for i, (t, item) in enumerate(self.items.items())]
+            heapq.heapify(self._heap)
+            self._seq = len(self._heap)
+
+    def _evict_min(self) -> int:
+        while True:
+            count, _seq, term = heapq.heappop(self._heap)
+            item = self.items.get(term)
+            if item is not None and item[0] == count:
+                del self.items[term]
+                return count
+
+
+class CandidateCounter:
+    """Unigram and bigram Space-Saving summaries fed one Reddit result at a time."""
+
+    def __init__(self, capacity: int = CAPACITY, context_chars: int = CONTEXT_CHARS) -> None:
+        self.unigrams = SpaceSaving(capacity)
+        self.bigrams = SpaceSaving(capacity)
+        self.context_chars = context_chars
+        self.posts = 0
+
+    def add_results(self, results: list) -> None:
+        """Fold no_api_scraper.fetch_reddit_data result tuples in."""
+        for _id, _kw, subreddit, content, _ts, mainstream in results:
+            self.add_post(content, subreddit, bool(mainstream))
+
+    def add_post(self, content: str, subreddit: str, is_mainstream: bool) -> None:
+        self.posts += 1
+        text = content.lower()
+
+        def context(start: int, end: int) -> str:
+            # Centre the window on the term, keep it inside the post, and
+            # never cut the term itself.
+            width = max(self.context_chars, end - start)
+            left = max(0, min((start + end - width) // 2, len(content) - width))
+            return content[left:left + width].strip()
+
+        for m in _UNIGRAM_RE.finditer(text):
+            tok = m.group().strip("'")
+            if MIN_WORD_LEN <= len(tok) <= MAX_WORD_LEN and tok not in STOPWORDS:
+                self.unigrams.add(tok, is_mainstream, context(m.start(), m.end()), subreddit)
+
+        prev = None
+        for m in _BIGRAM_TOKEN_RE.finditer(text):
+            tok = m.group().strip("'")
+            usable = (2 <= len(tok) <= MAX_WORD_LEN and tok not in BIGRAM_STOPWORDS)
+            if usable and prev is not None and text[prev[1]:m.start()].isspace():
+                first = prev[0]
+                if not (first.isdigit() and tok.isdigit()):
+                    self.bigrams.add(f"{first} {tok}", is_mainstream, context(prev[2], m.end()), subreddit)
+            prev = (tok, m.end(), m.start()) if usable else None
+
+    def _cohesive(self, bigram: str, count: int) -> bool:
+        # Words the unigram summary doesn't track (digits, 2-letter words)
+        # count as always occurring in the bigram.
+        parts = [self.unigrams.count(p) or count for p in bigram.split(" ")]
+        return 2 * count >= MIN_COHESION * sum(parts)
+
+    def stats(self) -> Dict[str, Dict]:
+        """
+        Candidates in discover_candidates' format: term -> {niche_count,
+        mainstream_count, sample_context, sample_subreddit}. Unigrams
+        first, then cohesive bigrams, each in the order they were first
+        monitored.
+        """
+        out = {}
+        for term, (_count, _error, niche, mainstream, ctx, sub) in self.unigrams.items.items():
+            out[term] = {"niche_count": niche, "mainstream_count": mainstream,
+                         "sample_context": ctx, "sample_subreddit": sub}
+        for term, (count, _error, niche, mainstream, ctx, sub) in self.bigrams.items.items():
+            if self._cohesive(term, count):
+                out[term] = {"niche_count": niche, "mainstream_count": mainstream,
+                             "sample_context": ctx, "sample_subreddit": sub}
+        return out
@@ -0,0 +1,247 @@
+"""
+Binary mention-history format
+------------------------------
+An optional, read-optimised alternative to the CSV mention history
+(data/mentions_history/, see data/history_store.py) for large word sets.
+The file is a word-id dictionary followed by fixed-width records sorted by
+word, so one word's daily series is a contiguous block that can be sliced
+straight out of a memory map without parsing anything.
+
+Layout (all little-endian):
+
+    header    <4sHHIQQ   magic b"SLMH", version, flags (unused),
+                         n_words, n_records, words_nbytes
+    words     utf-8      lowercased words joined by "\\n", zero-padded
+                         to an 8-byte boundary; line i is word id i
+    offsets   int64      n_words + 1 entries; records of word i live in
+                         records[offsets[i]:offsets[i + 1]]
+    records   RECORD_DTYPE x n_records, sorted by (word_id, day)
+
+`day` is the number of days since 1970-01-01.
+
+Usage:
+    python data/history_binary.py to-bin data/mentions_history data/mentions_history.bin
+    python data/history_binary.py to-csv data/mentions_history.bin out.csv
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+MAGIC = b"SLMH"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHIQQ")
+
+RECORD_DTYPE = np.dtype([
+    ("day", "<i4"),
+    ("word_id", "<u4"),
+    ("niche", "<u4"),
+    ("mainstream", "<u4"),
+])
+
+_EPOCH = np.datetime64("1970-01-01", "D")
+
+
+def _pad8(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def dates_to_days(dates) -> np.ndarray:
+    """Convert an iterable of YYYY-MM-DD strings/dates to int32 day numbers."""
+    return (pd.to_datetime(pd.Series(dates)).to_numpy().astype("datetime64[D]") - _EPOCH).astype(np.int32)
+
+
+def days_to_dates(days: np.ndarray) -> np.ndarray:
+    """Inverse of `dates_to_days`; returns a datetime64[D] array."""
+    return _EPOCH + np.asarray(days, dtype="timedelta64[D]")
+
+
+def write_binary(df: pd.DataFrame, path: str) -> None:
+    """
+    Write a history frame (columns: date, word, niche_count,
+    mainstream_count) to `path` in the binary format.
+    """
+    words_col = df["word"].astype(str).str.strip().str.lower()
+    vocab = sorted(set(words_col))
+    word_ids = pd.Categorical(words_col, categories=vocab).codes.astype(np.uint32)
+
+    records = np.empty(len(df), dtype=RECORD_DTYPE)
+    records["day"] = dates_to_days(df["date"]) if len(df) else np.empty(0, np.int32)
+    records["word_id"] = word_ids
+    records["niche"] = df["niche_count"].to_numpy(dtype=np.uint32)
+    records["mainstream"] = df["mainstream_count"].to_numpy(dtype=np.uint32)
+    records = records[np.lexsort((records["day"], records["word_id"]))]
+
+    offsets = np.zeros(len(vocab) + 1, dtype="<i8")
+    np.cumsum(np.bincount(records["word_id"], minlength=len(vocab)), out=offsets[1:])
+
+    words_blob = "\n".join(vocab).encode("utf-8")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(vocab), len(records), len(words_blob)))
+        f.write(words_blob.ljust(_pad8(len(words_blob)), b"\0"))
+        f.write(offsets.tobytes())
+        f.write(records.tobytes())
+    # Atomic swap so a reader never maps a half-written file.
+    os.replace(tmp_path, path)
+
+
+class BinaryHistory:
+    """
+    Read-only, memory-mapped view of a binary history file.
+
+    `series(word)` returns a zero-copy NumPy slice of RECORD_DTYPE; slices
+    stay valid until `close()` (or the end of a `with` block).
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _flags, n_words, n_records, words_nbytes = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version-{VERSION} mention history file")
+
+        pos = _HEADER.size
+        blob = self._mmap[pos:pos + words_nbytes].decode("utf-8")
+        self.words: List[str] = blob.split("\n") if n_words else []
+        self._word_ids: Dict[str, int] = {w: i for i, w in enumerate(self.words)}
+        pos += _pad8(words_nbytes)
+
+        self.offsets = np.frombuffer(self._mmap, dtype="<i8", count=n_words + 1, offset=pos)
+        pos += self.offsets.nbytes
+        self.records = np.frombuffer(self._mmap, dtype=RECORD_DTYPE, count=n_records, offset=pos)
+
+    def __enter__(self) -> "BinaryHistory":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __contains__(self, word: str) -> bool:
+        return word.strip().lower() in self._word_ids
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def series(self, word: str) -> np.ndarray:
+        """All records for `word`, ordered by day (empty if unknown)."""
+        word_id = self._word_ids.get(word.strip().lower())
+        if word_id is None:
+            return self.records[:0]
+        return self.records[self.offsets[word_id]:self.offsets[word_id + 1]]
+
+    def word_frame(self, word: str) -> pd.DataFrame:
+        """One word's history in the same columns as the CSV."""
+        recs = self.series(word)
+        return pd.DataFrame({
+            "date": np.datetime_as_string(days_to_dates(recs["day"]), unit="D"),
+            "word": word.strip().lower(),
+            "niche_count": recs["niche"].astype(np.int64),
+            "mainstream_count": recs["mainstream"].astype(np.int64),
+        })
+
+    def to_frame(self) -> pd.DataFrame:
+        """The whole file as a CSV-shaped frame, ordered by (date, word)."""
+        recs = self.records[np.lexsort((self.records["word_id"], self.records["day"]))]
+        words = np.asarray(self.words, dtype=object)
+        return pd.DataFrame({
+            "date": np.datetime_as_string(days_to_dates(recs["day"]), unit="D"),
+            "word": words[recs["word_id"]] if len(recs) else np.empty(0, dtype=object),
+            "niche_count": recs["niche"].astype(np.int64),
+            "mainstream_count": recs["mainstream"].astype(np.int64),
+        })
+
+    def close(self) -> None:
+        self.offsets = self.records = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # A caller still holds a series() slice; the map is released
+                # when the last view is garbage-collected.
+                pass
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+_shared_lock = threading.Lock()
+_shared: Dict[str, Tuple[Tuple[int, int], BinaryHistory]] = {}
+
+
+def shared(path: str) -> BinaryHistory:
+    """
+    One process-wide `BinaryHistory` per file, reopened only when the file's
+    (mtime, size) changes, so repeated reads (every Streamlit rerun) skip
+    re-mapping the file and rebuilding the word index. Callers must not
+    close it; a replaced instance is released once nothing references it.
+    """
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _shared_lock:
+        cached = _shared.get(key)
+        if cached is None or cached[0] != signature:
+            cached = _shared[key] = (signature, BinaryHistory(key))
+        return cached[1]
+
+
+def csv_to_binary(csv_path: str, bin_path: str) -> int:
+    """
+    Convert a history CSV, or a month-sharded history directory, to the
+    binary format. Returns the record count.
+    """
+    if os.path.isdir(csv_path):
+        from data.history_store import read_history
+        df = read_history(history_dir=csv_path)
+    else:
+        df = pd.read_csv(csv_path, dtype={"word": str})
+    write_binary(df, bin_path)
+    return len(df)
+
+
+def binary_to_csv(bin_path: str, csv_path: str) -> int:
+    """Convert a binary history file back to CSV. Returns the record count."""
+    with BinaryHistory(bin_path) as history:
+        df = history.to_frame()
+    df.to_csv(csv_path, index=False)
+    return len(df)
+
+
+def is_fresh(bin_path: str, csv_path: Optional[str]) -> bool:
+    """True if `bin_path` exists and isn't older than its source CSV."""
+    if not os.path.exists(bin_path):
+        return False
+    if csv_path and os.path.exists(csv_path):
+        return os.path.getmtime(bin_path) >= os.path.getmtime(csv_path)
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert mention history between CSV and binary.")
+    parser.add_argument("direction", choices=["to-bin", "to-csv"])
+    parser.add_argument("src")
+    parser.add_argument("dst")
+    args = parser.parse_args(argv)
+
+    if args.direction == "to-bin":
+        n = csv_to_binary(args.src, args.dst)
+    else:
+        n = binary_to_csv(args.src, args.dst)
+    print(f"Wrote {n} record(s) to {args.dst}.")
+
+
+if __name__ == "__main__":
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    main()
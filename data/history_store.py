@@ -0,0 +1,192 @@
+"""
+Month-sharded mention history
+------------------------------
+The daily niche/mainstream counts used to live in one ever-growing
+data/mentions_history.csv, which every reader had to parse in full and the
+scheduled workflow re-committed every day. They are now split into one CSV
+per calendar month:
+
+    data/mentions_history/
+        manifest.json     {"shards": {"2026-07": {"path": "2026-07.csv",
+                                                  "start": "2026-07-01",
+                                                  "end": "2026-07-31",
+                                                  "rows": 2511}}}
+        2026-06.csv
+        2026-07.csv
+        ...
+
+The manifest records each shard's first/last date, so a reader asking for
+a date range only opens the shards that overlap it, and a daily append only
+touches (and commits) the current month's file.
+
+A legacy single-file data/mentions_history.csv is still read if present;
+`migrate_legacy()` splits it into shards.
+"""
+
+import csv
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY_DIR = os.path.join(_PROJECT_ROOT, "data", "mentions_history")
+LEGACY_HISTORY_PATH = os.path.join(_PROJECT_ROOT, "data", "mentions_history.csv")
+MANIFEST_NAME = "manifest.json"
+FIELDNAMES = ["date", "word", "niche_count", "mainstream_count"]
+
+
+def shard_key(date_str: str) -> str:
+    """'2026-07-14' -> '2026-07'."""
+    return date_str[:7]
+
+
+def manifest_path(history_dir: str = HISTORY_DIR) -> str:
+    return os.path.join(history_dir, MANIFEST_NAME)
+
+
+def legacy_path_for(history_dir: str) -> str:
+    """The single-file CSV that sits next to a shard directory."""
+    return history_dir.rstrip(os.sep) + ".csv"
+
+
+def load_manifest(history_dir: str = HISTORY_DIR) -> Dict[str, Dict]:
+    path = manifest_path(history_dir)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("shards", {})
+
+
+def save_manifest(shards: Dict[str, Dict], history_dir: str = HISTORY_DIR) -> None:
+    os.makedirs(history_dir, exist_ok=True)
+    path = manifest_path(history_dir)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"shards": shards}, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def history_version(history_dir: str = HISTORY_DIR) -> str:
+    """
+    Short content hash of the manifest (plus the legacy file's size, if one
+    is still around). Changes whenever any shard is appended to, so it can
+    key caches of anything derived from the history.
+    """
+    h = hashlib.sha1()
+    path = manifest_path(history_dir)
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            h.update(f.read())
+    legacy = legacy_path_for(history_dir)
+    if os.path.exists(legacy):
+        h.update(str(os.path.getsize(legacy)).encode())
+    return h.hexdigest()[:12]
+
+
+def shards_for_range(start: Optional[str] = None, end: Optional[str] = None,
+                     history_dir: str = HISTORY_DIR) -> List[str]:
+    """Paths of the shards whose [start, end] overlaps the requested range."""
+    paths = []
+    for key, info in sorted(load_manifest(history_dir).items()):
+        if start and info["end"] < start:
+            continue
+        if end and info["start"] > end:
+            continue
+        paths.append(os.path.join(history_dir, info["path"]))
+    return paths
+
+
+def read_history(start: Optional[str] = None, end: Optional[str] = None,
+                 words: Optional[Iterable[str]] = None,
+                 history_dir: str = HISTORY_DIR) -> pd.DataFrame:
+    """
+    History rows between `start` and `end` (inclusive, YYYY-MM-DD) for the
+    given words (all words if None), reading only overlapping shards.
+    """
+    paths = shards_for_range(start, end, history_dir)
+    legacy = legacy_path_for(history_dir)
+    if os.path.exists(legacy):
+        paths.insert(0, legacy)
+
+    frames = [pd.read_csv(p, dtype={"word": str}) for p in paths if os.path.exists(p)]
+    if not frames:
+        return pd.DataFrame(columns=FIELDNAMES)
+
+    df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    mask = pd.Series(True, index=df.index)
+    if start:
+        mask &= df["date"] >= start
+    if end:
+        mask &= df["date"] <= end
+    if words is not None:
+        wanted = {w.strip().lower() for w in words}
+        mask &= df["word"].str.lower().isin(wanted)
+    return df[mask] if not mask.all() else df
+
+
+def words_recorded_on(date_str: str, history_dir: str = HISTORY_DIR) -> set:
+    """Lowercased words that already have a row for `date_str` (current shard only)."""
+    info = load_manifest(history_dir).get(shard_key(date_str))
+    if not info:
+        return set()
+    done = set()
+    with open(os.path.join(history_dir, info["path"]), newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if row.get("date") == date_str:
+                done.add(row.get("word", "").strip().lower())
+    return done
+
+
+def append_rows(rows: List[Dict], history_dir: str = HISTORY_DIR) -> None:
+    """Append history rows to their month's shard and update the manifest."""
+    if not rows:
+        return
+    os.makedirs(history_dir, exist_ok=True)
+    shards = load_manifest(history_dir)
+
+    by_shard: Dict[str, List[Dict]] = {}
+    for row in rows:
+        by_shard.setdefault(shard_key(row["date"]), []).append(row)
+
+    for key, shard_rows in by_shard.items():
+        info = shards.setdefault(key, {"path": f"{key}.csv", "start": shard_rows[0]["date"],
+                                       "end": shard_rows[0]["date"], "rows": 0})
+        path = os.path.join(history_dir, info["path"])
+        file_exists = os.path.exists(path)
+        with open(path, mode="a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+            if not file_exists:
+                writer.writeheader()
+            for row in shard_rows:
+                writer.writerow({k: row[k] for k in FIELDNAMES})
+        dates = [r["date"] for r in shard_rows]
+        info["start"] = min([info["start"]] + dates)
+        info["end"] = max([info["end"]] + dates)
+        info["rows"] += len(shard_rows)
+
+    save_manifest(shards, history_dir)
+
+
+def migrate_legacy(history_dir: str = HISTORY_DIR, remove: bool = True) -> int:
+    """
+    Split the legacy single-file history into month shards. Returns the
+    number of rows migrated (0 if there was nothing to migrate).
+    """
+    legacy = legacy_path_for(history_dir)
+    if not os.path.exists(legacy):
+        return 0
+    with open(legacy, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    append_rows(rows, history_dir)
+    if remove:
+        os.remove(legacy)
+    return len(rows)
+
+
+if __name__ == "__main__":
+    n = migrate_legacy()
+    print(f"Migrated {n} row(s) into {HISTORY_DIR}.")
@@ -0,0 +1,350 @@
+"""
+Sharded updater job queue
+-------------------------
+One updater process can only make so many rate-limited Reddit requests per
+run (auto_updater.MAX_WORDS_PER_RUN). This splits a day's run into shards
+in a local SQLite file that any number of workers can share. The workers
+may run as separate matrix jobs or egress identities, provided they reach
+the same file.
+
+    plan    words to refresh (from the refresh scheduler, with --budget
+            sized to the number of workers) are cut into shards of
+            --shard-size. Pending words are dealt round-robin across the
+            shards, and all discovery seed terms go to shard 0 so discovery
+            sees exactly what a single run would.
+    work    claims one shard at a time under a lease and runs an
+            UpdatePipeline over it. The entries and history rows are
+            written to the `shard_results` table instead of the archive.
+            The lease is renewed while the shard runs. If a worker dies,
+            the lease expires and another worker reclaims the shard. A
+            worker whose lease was taken over can't commit its results.
+    merge   once every shard is done, appends the entries to
+            slang_master_2026.csv and records the history rows, skipping
+            words already in the archive or already recorded for the day,
+            so it's safe to re-run. The output depends only on the plan:
+            entries in (shard, position) order, first one wins per word,
+            and rows sorted by word.
+
+Usage:
+    python data/job_queue.py plan  [--budget N] [--shard-size N]
+    python data/job_queue.py work  [--worker NAME] [--fetch-workers N]
+    python data/job_queue.py merge
+    python data/job_queue.py status
+"""
+
+import argparse
+import json
+import math
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _PROJECT_ROOT)
+
+from data import auto_updater, history_store, refresh_scheduler  # noqa: E402
+
+QUEUE_DB_PATH = os.path.join(_PROJECT_ROOT, "data", ".cache", "updater_queue.db")
+
+SHARD_SIZE = 50
+LEASE_SECONDS = 600
+
+
+class JobQueue:
+    """Shards of one or more days' runs, their leases and their results."""
+
+    def __init__(self, db_path: str = QUEUE_DB_PATH) -> None:
+        self.db_path = db_path
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        # Autocommit; claims and commits open their own write transactions.
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_date TEXT PRIMARY KEY,
+                pending TEXT NOT NULL,
+                merged INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS shards (
+                run_date TEXT NOT NULL,
+                shard INTEGER NOT NULL,
+                spec TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                worker TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (run_date, shard)
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS shard_results (
+                run_date TEXT NOT NULL,
+                shard INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (run_date, shard, kind, seq)
+            )
+        """)
+        return conn
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+    def plan(self, run_date: str, mention_words: List[str], pending: List[str],
+             seed_terms: List[str], shard_size: int = SHARD_SIZE) -> int:
+        """
+        Create the day's shards. Does nothing if the day is already planned,
+        so every worker can call it. Returns the number of shards.
+        """
+        n_shards = max(1, math.ceil(len(mention_words) / shard_size))
+        specs = [{"mentions": mention_words[i * shard_size:(i + 1) * shard_size],
+                  "pending": pending[i::n_shards],
+                  "seeds": seed_terms if i == 0 else []}
+                 for i in range(n_shards)]
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT COUNT(*) FROM shards WHERE run_date = ?", (run_date,)).fetchone()
+            if row[0]:
+                conn.execute("ROLLBACK")
+                return row[0]
+            conn.execute("INSERT OR REPLACE INTO runs (run_date, pending, merged) VALUES (?, ?, 0)",
+                         (run_date, json.dumps(pending)))
+            conn.executemany("INSERT INTO shards (run_date, shard, spec) VALUES (?, ?, ?)",
+                             [(run_date, i, json.dumps(spec)) for i, spec in enumerate(specs)])
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        return n_shards
+
+    # ------------------------------------------------------------------
+    # Leases
+    # ------------------------------------------------------------------
+    def claim(self, run_date: str, worker: str, lease_seconds: float = LEASE_SECONDS,
+              now: Optional[float] = None) -> Optional[Dict]:
+        """Lease the lowest unclaimed (or expired) shard: {'shard', 'spec'}, or None."""
+        now = time.time() if now is None else now
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT shard, spec FROM shards WHERE run_date = ? "
+                "AND (status = 'pending' OR (status = 'leased' AND lease_expires < ?)) "
+                "ORDER BY shard LIMIT 1",
+                (run_date, now),
+            ).fetchone()
+            if row is None:
+                conn.execute("ROLLBACK")
+                return None
+            conn.execute(
+                "UPDATE shards SET status = 'leased', worker = ?, lease_expires = ?, attempts = attempts + 1 "
+                "WHERE run_date = ? AND shard = ?",
+                (worker, now + lease_seconds, run_date, row[0]),
+            )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        return {"shard": row[0], "spec": json.loads(row[1])}
+
+    def renew(self, run_date: str, shard: int, worker: str,
+              lease_seconds: float = LEASE_SECONDS, now: Optional[float] = None) -> bool:
+        """Extend a held lease. False if it has been lost to another worker."""
+        now = time.time() if now is None else now
+        conn = self._connect()
+        try:
+            cur = conn.execute(
+                "UPDATE shards SET lease_expires = ? "
+                "WHERE run_date = ? AND shard = ? AND status = 'leased' AND worker = ?",
+                (now + lease_seconds, run_date, shard, worker),
+            )
+            return cur.rowcount == 1
+        finally:
+            conn.close()
+
+    def complete(self, run_date: str, shard: int, worker: str,
+                 entries: List[Dict], rows: List[Dict]) -> bool:
+        """
+        Store a shard's results and mark it done, if `worker` still holds
+        its lease. False (nothing written) if the lease was lost.
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            held = conn.execute(
+                "SELECT 1 FROM shards WHERE run_date = ? AND shard = ? AND status = 'leased' AND worker = ?",
+                (run_date, shard, worker),
+            ).fetchone()
+            if not held:
+                conn.execute("ROLLBACK")
+                return False
+            conn.execute("DELETE FROM shard_results WHERE run_date = ? AND shard = ?", (run_date, shard))
+            conn.executemany(
+                "INSERT INTO shard_results (run_date, shard, kind, seq, payload) VALUES (?, ?, ?, ?, ?)",
+                [(run_date, shard, "entry", i, json.dumps(e)) for i, e in enumerate(entries)]
+                + [(run_date, shard, "row", i, json.dumps(r)) for i, r in enumerate(rows)],
+            )
+            conn.execute("UPDATE shards SET status = 'done', lease_expires = NULL "
+                         "WHERE run_date = ? AND shard = ?", (run_date, shard))
+            conn.execute("COMMIT")
+            return True
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Merge
+    # ------------------------------------------------------------------
+    def status(self, run_date: str) -> Dict[str, int]:
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT status, COUNT(*) FROM shards WHERE run_date = ? GROUP BY status",
+                                (run_date,)).fetchall()
+        finally:
+            conn.close()
+        return dict(rows)
+
+    def results(self, run_date: str):
+        """
+        (entries, rows, pending words) of a fully worked run, or None while
+        shards are outstanding. Entries keep plan order with the first one
+        winning per word; rows are one per word, sorted.
+        """
+        conn = self._connect()
+        try:
+            outstanding = conn.execute("SELECT COUNT(*) FROM shards WHERE run_date = ? AND status != 'done'",
+                                       (run_date,)).fetchone()[0]
+            run = conn.execute("SELECT pending FROM runs WHERE run_date = ?", (run_date,)).fetchone()
+            if outstanding or run is None:
+                return None
+            stored = conn.execute(
+                "SELECT kind, payload FROM shard_results WHERE run_date = ? ORDER BY shard, kind, seq",
+                (run_date,),
+            ).fetchall()
+        finally:
+            conn.close()
+
+        entries: Dict[str, Dict] = {}
+        rows: Dict[str, Dict] = {}
+        for kind, payload in stored:
+            item = json.loads(payload)
+            (entries if kind == "entry" else rows).setdefault(item["word"], item)
+        return list(entries.values()), [rows[w] for w in sorted(rows)], json.loads(run[0])
+
+    def mark_merged(self, run_date: str) -> bool:
+        """Flag the run as merged. False if it already was (so merge runs once)."""
+        conn = self._connect()
+        try:
+            cur = conn.execute("UPDATE runs SET merged = 1 WHERE run_date = ? AND merged = 0", (run_date,))
+            return cur.rowcount == 1
+        finally:
+            conn.close()
+
+
+class _LeaseKeeper(threading.Thread):
+    """Renews a shard's lease in the background while the worker runs it."""
+
+    def __init__(self, queue: JobQueue, run_date: str, shard: int, worker: str,
+                 lease_seconds: float) -> None:
+        super().__init__(daemon=True)
+        self.args = (queue, run_date, shard, worker, lease_seconds)
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        queue, run_date, shard, worker, lease_seconds = self.args
+        while not self.stopped.wait(lease_seconds / 3):
+            if not queue.renew(run_date, shard, worker, lease_seconds):
+                return
+
+
+def work(queue: JobQueue, run_date: str, worker: str, lease_seconds: float = LEASE_SECONDS,
+         **pipeline_kwargs) -> int:
+    """Claim and run shards until none are left. Returns how many this worker completed."""
+    from data.update_pipeline import UpdatePipeline
+
+    known_words = auto_updater.load_known_words()
+    done = 0
+    while True:
+        claimed = queue.claim(run_date, worker, lease_seconds)
+        if claimed is None:
+            return done
+        shard, spec = claimed["shard"], claimed["spec"]
+        print(f"[{worker}] shard {shard}: {len(spec['mentions'])} word(s), "
+              f"{len(spec['pending'])} pending, {len(spec['seeds'])} seed term(s)")
+
+        entries, rows = [], []
+        keeper = _LeaseKeeper(queue, run_date, shard, worker, lease_seconds)
+        keeper.start()
+        try:
+            UpdatePipeline(set(known_words), spec["pending"], append=entries.extend, record=rows.extend,
+                           seed_terms=spec["seeds"], mention_words=spec["mentions"], today=run_date,
+                           **pipeline_kwargs).run()
+        finally:
+            keeper.stopped.set()
+        if queue.complete(run_date, shard, worker, entries, rows):
+            done += 1
+        else:
+            print(f"[{worker}] lost the lease on shard {shard}; its results were discarded.")
+
+
+def merge(queue: JobQueue, run_date: str) -> bool:
+    """Write a fully worked run into the archive and history. False if not ready or already merged."""
+    results = queue.results(run_date)
+    if results is None:
+        print(f"Run {run_date} still has outstanding shards: {queue.status(run_date)}")
+        return False
+    entries, rows, pending = results
+    # Every write skips what's already there, so a merge that died partway
+    # can simply be run again.
+    known_words = auto_updater.load_known_words()
+    auto_updater.append_to_csv([e for e in entries if e["word"] not in known_words])
+    recorded = history_store.read_history(start=run_date, end=run_date, words=[r["word"] for r in rows])
+    recorded = set(recorded["word"]) if not recorded.empty else set()
+    auto_updater.record_mentions([r for r in rows if r["word"] not in recorded])
+    auto_updater.clear_pending_words(pending)
+    if not queue.mark_merged(run_date):
+        print(f"Run {run_date} was already merged.")
+        return False
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Share one day's updater run across several workers.")
+    parser.add_argument("command", choices=["plan", "work", "merge", "status"])
+    parser.add_argument("--db", default=QUEUE_DB_PATH, help="queue database shared by the workers")
+    parser.add_argument("--date", default=datetime.now().strftime("%Y-%m-%d"))
+    parser.add_argument("--budget", type=int, default=auto_updater.MAX_WORDS_PER_RUN,
+                        help="words to refresh across all workers (plan)")
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE, help="words per shard (plan)")
+    parser.add_argument("--worker", default=f"{socket.gethostname()}-{os.getpid()}")
+    parser.add_argument("--lease", type=float, default=LEASE_SECONDS, help="lease length in seconds")
+    parser.add_argument("--fetch-workers", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=1, help="processes for candidate scoring")
+    args = parser.parse_args(argv)
+    queue = JobQueue(args.db)
+
+    if args.command == "plan":
+        known_words = auto_updater.load_known_words()
+        words = refresh_scheduler.plan(known_words, args.date, args.budget)
+        n = queue.plan(args.date, words, auto_updater.load_pending_words(), auto_updater.SEED_TERMS,
+                       shard_size=args.shard_size)
+        print(f"Run {args.date}: {len(words)} word(s) in {n} shard(s).")
+    elif args.command == "work":
+        n = work(queue, args.date, args.worker, args.lease,
+                 fetch_workers=args.fetch_workers, score_workers=args.workers)
+        print(f"[{args.worker}] completed {n} shard(s).")
+    elif args.command == "merge":
+        merge(queue, args.date)
+    else:
+        print(f"Run {args.date}: {queue.status(args.date) or 'not planned'}")
+
+
+if __name__ == "__main__":
+    main()
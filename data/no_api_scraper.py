@@ -5,6 +5,7 @@ import time
 import datetime
 import os
 import json
+import threading
 
 # Configuration
 # Anchor to the project root (not cwd), since Streamlit Cloud doesn't
@@ -12,7 +13,6 @@ import json
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DB_PATH = os.path.join(_PROJECT_ROOT, 'data', 'slang_data.db')
 _USER_AGENTS_PATH = os.path.join(_PROJECT_ROOT, 'data', 'user_agents.txt')
-PENDING_WORDS_PATH = os.path.join(_PROJECT_ROOT, 'data', 'pending_words.txt')
 
 
 def _load_user_agents():
@@ -41,6 +41,43 @@ SUBREDDITS = {
 }
 DEFAULT_KEYWORDS = ['aura', 'cooked', 'peng']
 
+# Minimum spacing between Reddit requests, process-wide. Override with the
+# REDDIT_REQUEST_INTERVAL environment variable (seconds) or the updater's
+# --request-interval. It caps fetch throughput at 1/interval requests per
+# second however many fetchers run; a shorter interval is faster but risks
+# 429s, each of which pauses every fetcher.
+REQUEST_INTERVAL = float(os.environ.get('REDDIT_REQUEST_INTERVAL', '0.5'))
+
+
+class RateLimiter:
+    """
+    Spaces calls at least `interval` seconds apart across every thread that
+    shares it, so concurrent fetchers (see data/update_pipeline.py) hit Reddit
+    no harder than a serial loop would.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until this caller's slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next, now)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def pause(self, seconds):
+        """Hold every caller back for `seconds` (e.g. after a 429)."""
+        with self._lock:
+            self._next = max(self._next, time.monotonic() + seconds)
+
+
+REDDIT_LIMITER = RateLimiter(REQUEST_INTERVAL)
+
 def setup_database():
     """Create the 'mentions' table if it doesn't exist."""
     conn = sqlite3.connect(DB_PATH)
@@ -58,10 +95,19 @@ def setup_database():
     conn.commit()
     conn.close()
 
-def fetch_reddit_data(subreddit, keyword, is_mainstream, print_preview=False, _retry=True):
+class FetchError(Exception):
+    """A Reddit search that failed (rate limit, error status, network), not one that found nothing."""
+
+
+def fetch_reddit_data(subreddit, keyword, is_mainstream, print_preview=False, _retry=True,
+                      raise_errors=False):
     """
     Fetch posts from a subreddit for a specific keyword using the JSON search endpoint.
     URL: https://www.reddit.com/r/[SUBREDDIT]/search.json?q=[KEYWORD]&restrict_sr=1&sort=new
+
+    A failed search returns [] like an empty one, unless `raise_errors` is set,
+    in which case it raises FetchError (the updater pipeline uses this so it
+    never checkpoints a failure as "no results").
     """
     url = f"https://www.reddit.com/r/{subreddit}/search.json"
     user_agent = random.choice(USER_AGENTS)
@@ -80,11 +126,15 @@ def fetch_reddit_data(subreddit, keyword, is_mainstream, print_preview=False, _r
     print(f"Fetching '{keyword}' from r/{subreddit}...")
     
     try:
+        REDDIT_LIMITER.wait()
         response = requests.get(url, headers=headers, params=params, timeout=10)
         
         if response.status_code == 429:
-            print(f"Rate limited (429)! Sleeping for 10 seconds...")
+            print(f"Rate limited (429)! Backing off for 10 seconds...")
+            REDDIT_LIMITER.pause(10)
             time.sleep(10)
+            if raise_errors:
+                raise FetchError(f"rate limited searching '{keyword}' in r/{subreddit}")
             return []
 
         if response.status_code == 403 and _retry:
@@ -92,10 +142,13 @@ def fetch_reddit_data(subreddit, keyword, is_mainstream, print_preview=False, _r
             # with a fresh, randomly-chosen User-Agent before giving up.
             print("Blocked (403). Retrying once with a different User-Agent...")
             time.sleep(2)
-            return fetch_reddit_data(subreddit, keyword, is_mainstream, print_preview, _retry=False)
+            return fetch_reddit_data(subreddit, keyword, is_mainstream, print_preview, _retry=False,
+                                     raise_errors=raise_errors)
 
         if response.status_code != 200:
             print(f"Error {response.status_code}: {response.text[:200]}")
+            if raise_errors:
+                raise FetchError(f"HTTP {response.status_code} searching '{keyword}' in r/{subreddit}")
             return []
             
         data = response.json()
@@ -129,8 +182,12 @@ def fetch_reddit_data(subreddit, keyword, is_mainstream, print_preview=False, _r
         print(f"Found {len(results)} results.")
         return results
 
+    except FetchError:
+        raise
     except Exception as e:
         print(f"Exception fetching data: {e}")
+        if raise_errors:
+            raise FetchError(f"searching '{keyword}' in r/{subreddit}: {e}") from e
         return []
 
 def save_to_db(results):
@@ -142,6 +199,7 @@ def save_to_db(results):
     cursor = conn.cursor()
     
     count = 0
+    new_counts = {}  # (keyword, date) -> [niche, mainstream], for trend stats
     for row in results:
         try:
             cursor.execute('''
@@ -149,9 +207,25 @@ def save_to_db(results):
                 VALUES (?, ?, ?, ?, ?, ?)
             ''', row)
             count += 1
+            if cursor.rowcount == 1 and row[4] is not None:
+                day = datetime.datetime.fromtimestamp(row[4], datetime.timezone.utc).strftime('%Y-%m-%d')
+                bucket = new_counts.setdefault((row[1], day), [0, 0])
+                bucket[1 if row[5] else 0] += 1
         except sqlite3.Error as e:
             print(f"DB Error: {e}")
-            
+
+    # Fold genuinely new mentions into the running trend statistics in the
+    # same transaction (a no-op until the table has been built once).
+    if new_counts:
+        try:
+            from models.trend_stats import TrendStatsStore
+            TrendStatsStore(DB_PATH).add_counts(
+                [(kw, day, n, m) for (kw, day), (n, m) in new_counts.items()],
+                conn=conn, only_if_built=True,
+            )
+        except Exception as e:
+            print(f"Trend stats update skipped: {e}")
+
     conn.commit()
     conn.close()
     print(f"Saved {count} new mentions to DB.")
@@ -195,18 +269,12 @@ def log_pending_word(word):
     find anything on. The scheduled auto_updater.py job (which has full,
     unrestricted internet access and no UI timeout pressure) retries these
     specifically, so a word that fails live can still get added later
-    without anyone re-typing it.
+    without anyone re-typing it. Repeat searches raise the word's priority
+    (see data/pending_queue.py).
     """
-    word = (word or "").strip().lower()
-    if not word:
-        return
-    existing = set()
-    if os.path.exists(PENDING_WORDS_PATH):
-        with open(PENDING_WORDS_PATH, encoding='utf-8') as f:
-            existing = {line.strip() for line in f if line.strip()}
-    if word not in existing:
-        with open(PENDING_WORDS_PATH, 'a', encoding='utf-8') as f:
-            f.write(word + "\n")
+    from data.pending_queue import PendingQueue
+
+    PendingQueue().enqueue(word)
 
 
 def search_global_feed(word):
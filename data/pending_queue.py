@@ -0,0 +1,190 @@
+"""
+Pending-word queue
+------------------
+Words live users searched for that Deep Search couldn't find anything on,
+waiting for the scheduled auto-updater to retry them. They used to be lines
+in data/pending_words.txt: every failed search re-read the whole file to
+dedupe before appending (O(n) per search), concurrent Streamlit sessions
+could interleave their writes, and the updater deleted the file outright,
+losing words logged while it ran.
+
+They now live in one SQLite table, keyed by word:
+
+    enqueue(word)    one upsert: inserts the word or bumps its hit count
+    dequeue(limit)   atomically leases the most-searched unleased words
+    ack(batch)       deletes a batch's words once their results are written
+    release(batch)   hands a batch back (e.g. the run failed)
+    reclaim(token)   re-takes a batch by its lease token (a killed run's retry)
+
+A leased batch that is never acked or released (the updater was killed)
+becomes available again after LEASE_SECONDS. Words enqueued while they're
+leased just gain hits and stay leased. An existing pending_words.txt is
+imported on first use.
+"""
+
+import os
+import sqlite3
+import time
+import uuid
+from collections import namedtuple
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PENDING_DB_PATH = os.path.join(_PROJECT_ROOT, "data", "pending_words.db")
+LEGACY_PATH = os.path.join(_PROJECT_ROOT, "data", "pending_words.txt")
+
+LEASE_SECONDS = 3600
+
+# token: lease id; words: most-searched first.
+Batch = namedtuple("Batch", "token words")
+
+
+class PendingQueue:
+    """The `pending_words` table: word, hits, first/last searched, lease."""
+
+    def __init__(self, db_path: str = PENDING_DB_PATH, legacy_path: Optional[str] = LEGACY_PATH) -> None:
+        self.db_path = db_path
+        self.legacy_path = legacy_path
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS pending_words (
+                word TEXT PRIMARY KEY,
+                hits INTEGER NOT NULL DEFAULT 1,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                lease_token TEXT,
+                lease_expires REAL
+            )
+        """)
+        if self.legacy_path and os.path.exists(self.legacy_path):
+            self._import_legacy(conn)
+        return conn
+
+    def _import_legacy(self, conn: sqlite3.Connection) -> None:
+        try:
+            with open(self.legacy_path, encoding="utf-8") as f:
+                words = [line.strip().lower() for line in f if line.strip()]
+        except OSError:
+            return      # another process imported it first
+        self._upsert(conn, words)
+        try:
+            os.remove(self.legacy_path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, words: Iterable[str]) -> None:
+        now = datetime.now().isoformat(timespec="seconds")
+        conn.executemany(
+            "INSERT INTO pending_words (word, first_seen, last_seen) VALUES (?, ?, ?) "
+            "ON CONFLICT(word) DO UPDATE SET hits = hits + 1, last_seen = excluded.last_seen",
+            [(w, now, now) for w in words],
+        )
+
+    def enqueue(self, word: str) -> None:
+        """Queue `word`, or count one more search for it if it's already queued."""
+        word = (word or "").strip().lower()
+        if not word:
+            return
+        conn = self._connect()
+        try:
+            self._upsert(conn, [word])
+        finally:
+            conn.close()
+
+    def peek(self) -> List[str]:
+        """Every queued word, most-searched first, leased or not."""
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT word FROM pending_words ORDER BY hits DESC, first_seen, word").fetchall()
+        finally:
+            conn.close()
+        return [w for (w,) in rows]
+
+    def hits(self, word: str) -> int:
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT hits FROM pending_words WHERE word = ?",
+                               ((word or "").strip().lower(),)).fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else 0
+
+    def dequeue(self, limit: Optional[int] = None, lease_seconds: float = LEASE_SECONDS,
+                now: Optional[float] = None) -> Batch:
+        """Lease up to `limit` (all if None) available words, most-searched first."""
+        now = time.time() if now is None else now
+        token = uuid.uuid4().hex
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            words = [w for (w,) in conn.execute(
+                "SELECT word FROM pending_words WHERE lease_token IS NULL OR lease_expires < ? "
+                "ORDER BY hits DESC, first_seen, word LIMIT ?",
+                (now, -1 if limit is None else limit),
+            )]
+            conn.executemany("UPDATE pending_words SET lease_token = ?, lease_expires = ? WHERE word = ?",
+                             [(token, now + lease_seconds, w) for w in words])
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        return Batch(token, words)
+
+    def reclaim(self, token: str, lease_seconds: float = LEASE_SECONDS,
+                now: Optional[float] = None) -> Batch:
+        """
+        Renew and return the words still leased under `token`, e.g. by a run
+        that was killed before it could ack or release them.
+        """
+        now = time.time() if now is None else now
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("UPDATE pending_words SET lease_expires = ? WHERE lease_token = ?",
+                         (now + lease_seconds, token))
+            words = [w for (w,) in conn.execute(
+                "SELECT word FROM pending_words WHERE lease_token = ? ORDER BY hits DESC, first_seen, word",
+                (token,))]
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        return Batch(token, words)
+
+    def ack(self, batch: Batch, words: Optional[Iterable[str]] = None) -> int:
+        """
+        Remove a batch's words (only `words` of it, if given), provided the
+        batch still holds their lease. Returns how many were removed.
+        """
+        words = batch.words if words is None else list(words)
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            removed = sum(conn.execute("DELETE FROM pending_words WHERE word = ? AND lease_token = ?",
+                                       (w, batch.token)).rowcount for w in words)
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        return removed
+
+    def release(self, batch: Batch) -> None:
+        """Give a batch's words back to the queue without removing them."""
+        conn = self._connect()
+        try:
+            conn.execute("UPDATE pending_words SET lease_token = NULL, lease_expires = NULL "
+                         "WHERE lease_token = ?", (batch.token,))
+        finally:
+            conn.close()
+
+    def remove(self, words: Optional[Iterable[str]] = None) -> None:
+        """Delete `words` (every word if None), leased or not."""
+        conn = self._connect()
+        try:
+            if words is None:
+                conn.execute("DELETE FROM pending_words")
+            else:
+                conn.executemany("DELETE FROM pending_words WHERE word = ?", [(w,) for w in words])
+        finally:
+            conn.close()
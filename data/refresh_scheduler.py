@@ -0,0 +1,133 @@
+"""
+Mention-refresh scheduler
+-------------------------
+Decides which archive words get today's mention counts fetched, within the
+auto-updater's per-run budget (auto_updater.MAX_WORDS_PER_RUN). The old
+rule, the first N words alphabetically, never refreshed words late in the
+alphabet once the archive outgrew N, and spent requests every day on flat,
+dead words.
+
+Every word not yet sampled today is ranked on three signals:
+
+    staleness    days since its last recorded sample (never sampled = due)
+    volatility   mean absolute day-over-day change of log(1 + count),
+                 niche and mainstream, over the last VOLATILITY_WINDOW_DAYS
+                 (as a percentile across words; too few samples counts as
+                 maximally volatile)
+    demand       0.5 ** (days since a user last searched it / DEMAND_HALF_LIFE_DAYS),
+                 from slang_terms.last_searched_at in the word vault
+
+Words whose staleness has reached the guarantee are always taken first.
+The guarantee is MAX_STALENESS_DAYS, raised to ceil(words / budget) when
+the archive is too big to cycle through any faster. Remaining slots go to
+the highest priority = staleness / guarantee + volatility + 0.5 * demand.
+Only the history shards inside the volatility window are read.
+"""
+
+import math
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+from data import history_store
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VAULT_DB_PATH = os.path.join(_PROJECT_ROOT, "data", "word_vault.db")
+
+MAX_STALENESS_DAYS = 7
+VOLATILITY_WINDOW_DAYS = 28
+DEMAND_HALF_LIFE_DAYS = 7
+DEMAND_WEIGHT = 0.5
+
+
+def _days_between(earlier: str, later: str) -> int:
+    return (datetime.strptime(later[:10], "%Y-%m-%d") - datetime.strptime(earlier[:10], "%Y-%m-%d")).days
+
+
+def load_demand(db_path: str = VAULT_DB_PATH) -> Dict[str, str]:
+    """word (lowercased) -> last_searched_at, for words users have searched."""
+    if not os.path.exists(db_path):
+        return {}
+    try:
+        conn = sqlite3.connect(db_path, timeout=10)
+        try:
+            rows = conn.execute(
+                "SELECT lower(word), MAX(last_searched_at) FROM slang_terms "
+                "WHERE last_searched_at IS NOT NULL GROUP BY lower(word)"
+            ).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return {}
+    return dict(rows)
+
+
+def word_signals(words: Iterable[str], today: str,
+                 history_dir: str = history_store.HISTORY_DIR) -> pd.DataFrame:
+    """
+    Per-word staleness (days, inf if unseen in the window) and volatility
+    (NaN with fewer than two samples), indexed by word.
+    """
+    words = sorted({w.strip().lower() for w in words})
+    window = max(VOLATILITY_WINDOW_DAYS, MAX_STALENESS_DAYS)
+    start = (datetime.strptime(today, "%Y-%m-%d") - timedelta(days=window)).strftime("%Y-%m-%d")
+    history = history_store.read_history(start=start, end=today, words=words, history_dir=history_dir)
+
+    signals = pd.DataFrame(index=pd.Index(words, name="word"))
+    signals["staleness"] = np.inf
+    signals["volatility"] = np.nan
+    if history.empty:
+        return signals
+
+    daily = (history.assign(word=history["word"].str.lower())
+             .groupby(["word", "date"], sort=True)[["niche_count", "mainstream_count"]].sum())
+    last = daily.reset_index().groupby("word")["date"].max()
+    signals.loc[last.index, "staleness"] = [_days_between(d, today) for d in last]
+
+    logs = np.log1p(daily)
+    changes = logs.groupby(level="word").diff().abs().sum(axis=1, min_count=1)
+    volatility = changes.groupby(level="word").mean()
+    signals.loc[volatility.index, "volatility"] = volatility
+    return signals
+
+
+def plan(known_words: Iterable[str], today: str, budget: int,
+         history_dir: str = history_store.HISTORY_DIR,
+         vault_db: str = VAULT_DB_PATH,
+         max_staleness: int = MAX_STALENESS_DAYS) -> List[str]:
+    """Up to `budget` words to refresh today, most valuable first."""
+    known = {w.strip().lower() for w in known_words if w and w.strip()}
+    if budget <= 0 or not known:
+        return []
+    signals = word_signals(known, today, history_dir)
+    signals = signals[signals["staleness"] > 0]     # already sampled today
+    if signals.empty:
+        return []
+
+    guarantee = max(max_staleness, math.ceil(len(known) / budget))
+    demand = load_demand(vault_db)
+    demand_score = pd.Series(
+        [0.5 ** (max(_days_between(demand[w], today), 0) / DEMAND_HALF_LIFE_DAYS) if w in demand else 0.0
+         for w in signals.index],
+        index=signals.index,
+    )
+    volatility = signals["volatility"].rank(pct=True).fillna(1.0)
+    priority = (np.minimum(signals["staleness"] / guarantee, 1.0)
+                + volatility + DEMAND_WEIGHT * demand_score)
+
+    ranked = pd.DataFrame({"word": signals.index, "staleness": signals["staleness"].to_numpy(),
+                           "priority": priority.to_numpy()})
+    due = ranked[ranked["staleness"] >= guarantee].sort_values(["staleness", "word"], ascending=[False, True])
+    rest = ranked[ranked["staleness"] < guarantee].sort_values(["priority", "word"], ascending=[False, True])
+    return (list(due["word"]) + list(rest["word"]))[:budget]
+
+
+def report(words: List[str], known_words: Iterable[str], budget: int) -> str:
+    known = len(set(known_words))
+    guarantee = max(MAX_STALENESS_DAYS, math.ceil(known / budget)) if budget > 0 else 0
+    return (f"Refreshing {len(words)} of {known} word(s) "
+            f"(budget {budget}, every word at most {guarantee} day(s) stale).")
@@ -0,0 +1,128 @@
+"""
+Updater run journal
+-------------------
+A scheduled auto-updater run that died partway through (runner timeout,
+network blip) used to start over and re-fetch everything on the next
+attempt. The pipeline (data/update_pipeline.py) now writes each completed
+fetch unit to an append-only journal:
+
+    {"date": "2026-03-01", "version": 1}                   header
+    {"lease": "3f2a..."}                                   pending-word lease
+    {"stage": "mention", "word": "rizz", "subreddit": "london",
+     "n": 12, "posts": []}                                 one line per unit
+
+`n` is the number of results and `posts` are the post texts the score
+stage reads from them: the first post of a pending-word search, and up to
+max_posts_per_sub posts of a discovery search (the buffered candidates the
+discovery counter is rebuilt from). Mention counts need only `n`.
+
+The lease line is the token of the pending-word batch the run leased
+(data/pending_queue.py). A run killed outright never releases that lease,
+so the retry reclaims the batch by its token instead of dequeuing, which
+would find those words still leased and skip them.
+
+Every line is flushed and fsynced before the unit's result is used, so a
+restarted run for the same day replays the journaled units instead of
+fetching them again. Because the score stage folds results in job order,
+the resumed run ends up with exactly the state an uninterrupted run would
+have had. A journal from another day is ignored and started afresh, so a
+retry has to run for the interrupted run's date (auto_updater.py --date;
+the scheduled workflow retries a failed run once that way). The updater
+deletes the journal once the run's results are written.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JOURNAL_PATH = os.path.join(_PROJECT_ROOT, "data", ".cache", "updater_journal.jsonl")
+
+VERSION = 1
+
+# (stage, word, subreddit) -> (result count, post texts)
+Unit = Tuple[int, List[str]]
+
+
+class RunJournal:
+    """Completed fetch units of one day's run, persisted to `path`."""
+
+    def __init__(self, date: str, path: str = JOURNAL_PATH) -> None:
+        self.date = date
+        self.path = path
+        self.units: Dict[Tuple[str, str, str], Unit] = {}
+        self.lease: Optional[str] = None
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if not self._load():
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"date": date, "version": VERSION}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        self.resumed = len(self.units)
+
+    def _load(self) -> bool:
+        """Read back today's journal, cutting off a torn last line. False if there's none."""
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return False
+
+        good_end = 0
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            if good_end == 0:
+                if record.get("date") != self.date or record.get("version") != VERSION:
+                    return False
+            elif "lease" in record:
+                self.lease = record["lease"]
+            else:
+                key = (record["stage"], record["word"], record["subreddit"])
+                self.units[key] = (record["n"], record["posts"])
+            good_end += len(line)
+
+        if good_end == 0:
+            return False
+        if good_end < len(data):
+            with open(self.path, "r+b") as f:
+                f.truncate(good_end)
+        return True
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def get(self, stage: str, word: str, subreddit: str) -> Optional[Unit]:
+        return self.units.get((stage, word, subreddit))
+
+    def _append(self, record: Dict) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def record(self, stage: str, word: str, subreddit: str, n: int, posts: List[str]) -> None:
+        with self._lock:
+            self._append({"stage": stage, "word": word, "subreddit": subreddit, "n": n, "posts": posts})
+            self.units[(stage, word, subreddit)] = (n, posts)
+
+    def record_lease(self, token: str) -> None:
+        """Remember the run's pending-word lease, so a retry can reclaim it."""
+        with self._lock:
+            self._append({"lease": token})
+            self.lease = token
+
+    def discard(self) -> None:
+        """Delete the journal once the run's results are durably written."""
+        with self._lock:
+            self.units.clear()
+            self.lease = None
+            if os.path.exists(self.path):
+                os.remove(self.path)
@@ -0,0 +1,462 @@
+"""
+Pipelined auto-updater
+----------------------
+auto_updater.main used to run its steps strictly in order, with every
+Reddit request made serially, so the daily Action spent most of its time
+waiting on the network. This runs the same work as three stages connected
+by bounded queues:
+
+    producer -> jobs -> fetch (N threads) -> results -> score -> writes -> write
+
+  fetch   Reddit searches for the pending words, the discovery seed terms
+          and today's mention counts. Every thread goes through the
+          process-wide no_api_scraper.REDDIT_LIMITER, so the threads overlap
+          request latency without raising the request rate. Throughput is
+          therefore capped at 1 / REQUEST_INTERVAL requests per second (2/s
+          by default); extra fetchers only help while a request takes
+          longer than the interval.
+  score   folds the results back together in job order, so the outcome
+          doesn't depend on which request finished first and matches the
+          serial path. It runs the slang check and decides the new archive
+          entries.
+  write   looks up definitions (a discovery batch concurrently, see
+          urban_dictionary.fetch_definitions), appends the entries to the
+          archive CSV as they arrive and, once everything is in, records
+          the mention history.
+
+Words accepted during the run get their mention counts fetched in the same
+run, as with the serial path. Each stage's busy time and item count is
+printed at the end.
+
+Before anything is fetched, the run's searches are collected into a
+FetchPlan keyed on (subreddit, keyword): a seed term that's also an archive
+word, or a pending word that gets accepted and then needs today's mention
+counts, is searched once and its results fanned out to every job that
+consumes them. The plan's request count is printed first, so a run can be
+sized against the rate budget.
+
+Fetch threads reduce each search to a unit, (result count, post texts the
+score stage reads). With a RunJournal (data/run_journal.py) every unit is
+journaled before it's scored, and units already in today's journal are
+replayed instead of fetched, so an interrupted run resumes where it
+stopped. A search that fails (fetch raises no_api_scraper.FetchError) is
+not journaled, so a resumed run fetches it again, and it never counts as
+zero results: a word with a failed mention search gets no history row
+that day, and a pending word with a failed search is left unresolved
+(`unsearched`) so the caller can hand it back to the pending queue.
+"""
+
+import queue
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+from data import auto_updater
+from data.discovery import CandidateCounter
+from data.run_journal import RunJournal
+from data.no_api_scraper import SUBREDDITS, FetchError, fetch_reddit_data
+from data.urban_dictionary import fetch_definition as fetch_ud_definition
+from data.urban_dictionary import fetch_definitions as fetch_ud_definitions
+from models.analyzer import SlangAnalyzer
+from models.slang_detector import is_slang_batch
+
+FETCH_WORKERS = 4
+QUEUE_SIZE = 64
+
+_DONE = object()
+
+# kind: "pending" | "discover" | "mention"; index: position of the word or
+# seed term; sub_index: position in search_order() (all of a word's subreddits).
+Job = namedtuple("Job", "kind index sub_index subreddit keyword is_mainstream")
+# One Reddit search and the jobs its results fan out to.
+Request = namedtuple("Request", "subreddit keyword is_mainstream consumers")
+
+
+def search_order() -> List[tuple]:
+    """(subreddit, is_mainstream) pairs in the serial path's order: niche first."""
+    return ([(sub, False) for sub in SUBREDDITS["niche"]]
+            + [(sub, True) for sub in SUBREDDITS["mainstream"]])
+
+
+class StageStats:
+    """Busy time, CPU time and item count of one stage, summed over its threads."""
+
+    def __init__(self, name: str, threads: int = 1) -> None:
+        self.name = name
+        self.threads = threads
+        self.busy = 0.0
+        self.cpu = 0.0
+        self.items = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def timed(self):
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.busy += time.perf_counter() - start
+                self.cpu += time.thread_time() - cpu_start
+                self.items += 1
+
+    def summary(self, wall: float) -> str:
+        idle = max(wall * self.threads - self.busy, 0.0)
+        return (f"  {self.name:<6} {self.busy:7.2f}s busy, {idle:7.2f}s waiting "
+                f"over {self.threads} thread(s), {self.items} item(s)")
+
+
+class FetchPlan:
+    """The (subreddit, keyword) searches a run needs, each with its consuming jobs, in first-use order."""
+
+    def __init__(self, jobs=()) -> None:
+        self._consumers: Dict[tuple, List[Job]] = {}
+        self.jobs = 0
+        self.add(jobs)
+
+    def add(self, jobs) -> None:
+        for job in jobs:
+            self._consumers.setdefault((job.subreddit, job.keyword), []).append(job)
+            self.jobs += 1
+
+    def __len__(self) -> int:
+        return len(self._consumers)
+
+    def requests(self):
+        for (sub, keyword), consumers in self._consumers.items():
+            yield Request(sub, keyword, consumers[0].is_mainstream, consumers)
+
+    def summary(self) -> str:
+        return (f"Fetch plan: {len(self)} request(s) for {self.jobs} job(s) "
+                f"({self.jobs - len(self)} shared).")
+
+
+class UpdatePipeline:
+    """
+    One auto-updater run. The hooks default to the real network/IO
+    functions; tests and offline runs swap them out.
+
+    Args:
+        known_words: words already in the archive (updated with new ones).
+        pending: words live users searched for that Deep Search missed.
+        fetch: (subreddit, keyword, is_mainstream=...) -> result tuples;
+            raises FetchError for a failed search.
+        score: is_slang_batch-compatible scorer.
+        define: (word, timeout=seconds) -> definition or None.
+        append: list of archive entries -> None (per pending word, and once
+            for the discovered words).
+        record: list of history rows -> None (called once, at the end).
+        journal: optional RunJournal to resume from and checkpoint into.
+        mention_words: words whose mention counts to fetch; by default the
+            refresh scheduler picks them.
+    """
+
+    def __init__(self, known_words: set, pending: Optional[List[str]] = None,
+                 fetch: Callable = partial(fetch_reddit_data, raise_errors=True), score: Callable = is_slang_batch,
+                 define: Callable = fetch_ud_definition,
+                 append: Callable = auto_updater.append_to_csv,
+                 record: Callable = auto_updater.record_mentions,
+                 seed_terms: Optional[List[str]] = None, max_posts_per_sub: int = 50,
+                 fetch_workers: int = FETCH_WORKERS, score_workers: int = 1,
+                 queue_size: int = QUEUE_SIZE, today: Optional[str] = None,
+                 journal: Optional[RunJournal] = None,
+                 mention_words: Optional[List[str]] = None) -> None:
+        self.known_words = known_words          # updated by the write stage
+        self._known = set(known_words)          # snapshot the score stage reads
+        self.pending = [w for w in (pending or []) if w not in self._known]
+        self.fetch, self.score, self.define = fetch, score, define
+        self.append, self.record = append, record
+        self.seed_terms = auto_updater.SEED_TERMS if seed_terms is None else seed_terms
+        self.max_posts_per_sub = max_posts_per_sub
+        self.fetch_workers = fetch_workers
+        self.score_workers = score_workers
+        self.today = today or datetime.now().strftime("%Y-%m-%d")
+        self.subs = search_order()
+        self.journal = journal
+        self.mention_words = mention_words
+        self.replayed = 0
+        self.failed = 0
+        self.unsearched: List[str] = []         # pending words with a failed search
+        self.skipped_mentions: List[str] = []   # words with a failed mention search
+        self.plan: Optional[FetchPlan] = None
+        # (subreddit, keyword) -> result count, so a search already made this
+        # run can serve later mention jobs.
+        self._fetched: Dict[tuple, int] = {}
+
+        self._jobs = queue.Queue(maxsize=queue_size)
+        self._results = queue.Queue(maxsize=queue_size)
+        self._writes = queue.Queue(maxsize=queue_size)
+        self._discovery_done = threading.Event()
+        self._errors: List[BaseException] = []
+
+        self.stats = {name: StageStats(name, threads) for name, threads in
+                      (("fetch", fetch_workers), ("score", 1), ("write", 1))}
+        self.pending_entries: List[Dict] = []
+        self.new_entries: List[Dict] = []
+        self.rows: List[Dict] = []
+        self.candidates_scanned = 0
+
+        # Score-stage state.
+        self._pending_results: Dict[int, Dict[int, tuple]] = {}
+        self._pending_next = 0
+        self._discover_results: Dict[int, tuple] = {}
+        self._discover_next = 0
+        self._counter = CandidateCounter()
+        self._accepted: List[str] = []
+        self._mention_counts: Dict[str, List[int]] = {}
+        self._extra_words: List[str] = []
+
+    # ------------------------------------------------------------------
+    # Producer
+    # ------------------------------------------------------------------
+    def _word_jobs(self, kind: str, words: List[str]):
+        for i, word in enumerate(words):
+            for j, (sub, mainstream) in enumerate(self.subs):
+                yield Job(kind, i, j, sub, word, mainstream)
+
+    def _initial_jobs(self, mention_words: List[str]):
+        yield from self._word_jobs("pending", self.pending)
+        for i, term in enumerate(self.seed_terms):
+            for j, (sub, mainstream) in enumerate(self.subs):
+                yield Job("discover", i * len(self.subs) + j, j, sub, term, mainstream)
+        yield from self._word_jobs("mention", mention_words)
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+    def _fetch_stage(self) -> None:
+        while True:
+            request = self._jobs.get()
+            if request is _DONE:
+                self._results.put(_DONE)
+                return
+            for job, unit in zip(request.consumers, self._units(request)):
+                self._results.put((job, unit))
+
+    def _units(self, request: Request) -> List[Optional[tuple]]:
+        """
+        Each consumer's unit: from the journal, an earlier search this run,
+        or one fetch. None for every consumer if the fetch failed.
+        """
+        key = (request.subreddit, request.keyword)
+        units = []
+        for job in request.consumers:
+            unit = self.journal.get(job.kind, job.keyword, job.subreddit) if self.journal is not None else None
+            if unit is None and job.kind == "mention" and key in self._fetched:
+                unit = (self._fetched[key], [])
+            units.append(unit)
+        if all(u is not None for u in units):
+            if key not in self._fetched:
+                self.replayed += 1          # journaled by an interrupted run
+            self._fetched[key] = units[0][0]
+            return units
+        try:
+            with self.stats["fetch"].timed():
+                results = self.fetch(request.subreddit, request.keyword, is_mainstream=request.is_mainstream)
+        except FetchError:
+            # Neither journaled nor shared, so a resumed run (or a later
+            # mention job) searches again.
+            self.failed += 1
+            return [None] * len(request.consumers)
+        except Exception as e:
+            self._errors.append(e)
+            return [(0, [])] * len(request.consumers)
+        self._fetched[key] = len(results)
+        units = [self._digest(job, results) for job in request.consumers]
+        if self.journal is not None:
+            for job, unit in zip(request.consumers, units):
+                self.journal.record(job.kind, job.keyword, job.subreddit, *unit)
+        return units
+
+    def _digest(self, job: Job, results: list) -> tuple:
+        """(result count, post texts the score stage reads) for one search."""
+        if job.kind == "discover":
+            posts = [r[3] for r in results[:self.max_posts_per_sub]]
+        elif job.kind == "pending":
+            posts = [r[3] for r in results[:1]]
+        else:
+            posts = []
+        return len(results), posts
+
+    def _score_stage(self) -> None:
+        finished = 0
+        try:
+            self._maybe_finish_discovery()
+            while finished < self.fetch_workers:
+                item = self._results.get()
+                if item is _DONE:
+                    finished += 1
+                    continue
+                if self._errors:
+                    # Drain so the fetchers never block, and release the producer.
+                    self._discovery_done.set()
+                    continue
+                try:
+                    with self.stats["score"].timed():
+                        self._on_result(*item)
+                except Exception as e:
+                    self._errors.append(e)
+                    self._discovery_done.set()
+        finally:
+            self._discovery_done.set()
+            self._writes.put(_DONE)
+
+    def _write_stage(self) -> None:
+        analyzer = SlangAnalyzer()
+        while True:
+            item = self._writes.get()
+            if item is _DONE:
+                break
+            if self._errors:
+                continue
+            try:
+                with self.stats["write"].timed():
+                    kind, payload = item
+                    if kind == "row":
+                        self.rows.append(payload)
+                        continue
+                    # A batch of accepted words: definitions concurrently, under one deadline.
+                    definitions = fetch_ud_definitions((p[0] for p in payload), fetch=self.define)
+                    entries = [auto_updater.make_entry(*p, analyzer, define=definitions.get) for p in payload]
+                    (self.pending_entries if kind == "pending" else self.new_entries).extend(entries)
+                    self.known_words.update(e["word"] for e in entries)
+                    self.append(entries)
+            except Exception as e:
+                self._errors.append(e)
+        if self.rows and not self._errors:
+            with self.stats["write"].timed():
+                self.rows.sort(key=lambda r: r["word"])
+                self.record(self.rows)
+
+    # ------------------------------------------------------------------
+    # Score-stage bookkeeping
+    # ------------------------------------------------------------------
+    def _on_result(self, job: Job, unit: Optional[tuple]) -> None:
+        n, posts = unit if unit is not None else (0, [])
+        if job.kind == "pending":
+            self._pending_results.setdefault(job.index, {})[job.sub_index] = unit
+            self._resolve_pending()
+        elif job.kind == "discover":
+            self._discover_results[job.index] = (job, posts)
+            while self._discover_next in self._discover_results:
+                done, batch = self._discover_results.pop(self._discover_next)
+                for content in batch:
+                    self._counter.add_post(content, done.subreddit, done.is_mainstream)
+                self._discover_next += 1
+        else:
+            # [niche, mainstream, searches outstanding, any search failed]
+            counts = self._mention_counts.setdefault(job.keyword, [0, 0, len(self.subs), False])
+            counts[1 if job.is_mainstream else 0] += n
+            counts[2] -= 1
+            counts[3] = counts[3] or unit is None
+            if counts[2] == 0:
+                if counts[3]:
+                    # A partial count would read as a real drop in usage.
+                    self.skipped_mentions.append(job.keyword)
+                else:
+                    self._writes.put(("row", {"date": self.today, "word": job.keyword,
+                                              "niche_count": counts[0], "mainstream_count": counts[1]}))
+        self._maybe_finish_discovery()
+
+    def _resolve_pending(self) -> None:
+        """Score pending words in order, each once all its searches are in."""
+        while len(self._pending_results.get(self._pending_next, {})) == len(self.subs):
+            per_sub = self._pending_results.pop(self._pending_next)
+            word = self.pending[self._pending_next]
+            self._pending_next += 1
+            if any(per_sub[j] is None for j in range(len(self.subs))):
+                self.unsearched.append(word)
+                continue
+
+            niche = mainstream = 0
+            sample_context = sample_sub = ""
+            for j, (sub, is_mainstream) in enumerate(self.subs):
+                n, posts = per_sub[j]
+                if is_mainstream:
+                    mainstream += n
+                else:
+                    niche += n
+                if posts and not sample_context:
+                    sample_context, sample_sub = posts[0], sub
+            if niche + mainstream < auto_updater.MIN_MENTIONS_TO_QUALIFY or not sample_context:
+                continue
+            if self.score([(word, sample_context, sample_sub)])[0]["is_slang"]:
+                self._accepted.append(word)
+                self._writes.put(("pending", [(word, niche, mainstream, sample_context)]))
+
+    def _maybe_finish_discovery(self) -> None:
+        """Once pending and discovery results are all in, score the discovered candidates."""
+        n_discover = len(self.seed_terms) * len(self.subs)
+        if (self._discovery_done.is_set() or self._pending_next < len(self.pending)
+                or self._discover_next < n_discover):
+            return
+
+        stats = self._counter.stats()
+        self.candidates_scanned = len(stats)
+        excluded = self._known | set(self._accepted)
+        candidates = [
+            (word, info) for word, info in stats.items()
+            if word not in excluded
+            and info["niche_count"] + info["mainstream_count"] >= auto_updater.MIN_MENTIONS_TO_QUALIFY
+        ]
+        verdicts = self.score(
+            ((word, info["sample_context"], info["sample_subreddit"]) for word, info in candidates),
+            workers=self.score_workers,
+        )
+        accepted = [(word, info["niche_count"], info["mainstream_count"], info["sample_context"])
+                    for (word, info), verdict in zip(candidates, verdicts) if verdict["is_slang"]]
+        self._accepted.extend(word for word, *_rest in accepted)
+        if accepted:
+            self._writes.put(("new", accepted))
+        self._extra_words = self._accepted
+        self._discovery_done.set()
+
+    # ------------------------------------------------------------------
+    def run(self) -> "UpdatePipeline":
+        started = time.perf_counter()
+        mention_words = self.mention_words
+        if mention_words is None:
+            mention_words = auto_updater.select_words_to_scan(self._known, self.today)
+
+        threads = [threading.Thread(target=self._fetch_stage, name=f"fetch-{i}", daemon=True)
+                   for i in range(self.fetch_workers)]
+        threads.append(threading.Thread(target=self._score_stage, name="score", daemon=True))
+        threads.append(threading.Thread(target=self._write_stage, name="write", daemon=True))
+        for t in threads:
+            t.start()
+
+        self.plan = FetchPlan(self._initial_jobs(mention_words))
+        room = max(auto_updater.MAX_WORDS_PER_RUN - len(mention_words), 0)
+        print(f"{self.plan.summary()} Up to {room * len(self.subs)} more for words accepted this run.")
+        for request in self.plan.requests():
+            self._jobs.put(request)
+        # New words join today's mention counts, within the same daily cap.
+        # Accepted pending words were already searched; those are reused.
+        self._discovery_done.wait()
+        extra = sorted(w for w in self._extra_words if w not in mention_words)[:room]
+        for request in FetchPlan(self._word_jobs("mention", extra)).requests():
+            self._jobs.put(request)
+        for _ in range(self.fetch_workers):
+            self._jobs.put(_DONE)
+
+        for t in threads:
+            t.join()
+        self.wall = time.perf_counter() - started
+        if self._errors:
+            raise self._errors[0]
+        return self
+
+    def report(self) -> str:
+        lines = [f"Stage timings ({self.wall:.2f}s wall):"]
+        if self.replayed:
+            lines.append(f"  resumed {self.replayed} fetch(es) from the run journal")
+        if self.failed:
+            lines.append(f"  {self.failed} fetch(es) failed and were not journaled; "
+                         f"{len(self.unsearched)} pending word(s) left queued, "
+                         f"{len(self.skipped_mentions)} mention count(s) skipped")
+        lines += [s.summary(self.wall) for s in self.stats.values()]
+        return "\n".join(lines)
@@ -0,0 +1,194 @@
+"""
+Offline updater benchmark
+-------------------------
+Times a full auto-updater run (data/update_pipeline.py) without touching
+the network or the git-tracked data:
+
+  - A synthetic archive of `archive_size` words, plus the history, trend
+    statistics and detector state, lives in a temporary data directory.
+  - Reddit searches are answered from fixtures, with an optional simulated
+    per-request latency. They are spaced `request_interval` seconds apart
+    by a RateLimiter like the real REDDIT_LIMITER; the default, 0, doesn't
+    limit them, so the result shows the pipeline's own overhead. Pass the
+    production interval to see what a real run can reach: at most
+    1 / interval requests per second. A fixture file is JSON mapping a
+    keyword (or "subreddit/keyword") to the post texts a search returns.
+    Keywords it doesn't cover get deterministic synthetic posts.
+  - Urban Dictionary is never called: every accepted word falls back to
+    its Reddit context.
+
+The pipeline's own hooks and stage counters do the measuring. The result
+is one JSON object: requests issued, requests per second, wall time, busy
+and CPU time per stage, peak RSS and rows written. Keep these objects to
+compare runs over time. Stage CPU is the stage threads' own CPU time, so
+with --workers > 1 the scoring processes aren't included.
+
+Usage:
+    python data/auto_updater.py --benchmark [--archive-size N] [--fixtures F.json]
+                                [--latency SECONDS] [--request-interval SECONDS]
+                                [--output result.json]
+"""
+
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import zlib
+from contextlib import redirect_stdout
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from data import auto_updater, refresh_scheduler
+from data.no_api_scraper import RateLimiter
+
+try:
+    import resource
+except ImportError:     # Windows
+    resource = None
+
+ARCHIVE_SIZE = 1000
+PENDING_WORDS = 10
+POSTS_PER_SEARCH = 25
+
+_SYLLABLES = ["ba", "ko", "ri", "zz", "mo", "ty", "fl", "ex", "dr", "pe", "ng", "sk", "id", "oo", "va", "yu"]
+_FILLER = ("honestly the vibe in here is something else and everyone keeps saying it "
+           "like it means anything at all but fair enough").split()
+
+
+def _pseudo_word(rng: random.Random) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def synthetic_words(n: int, seed: int = 0) -> List[str]:
+    """`n` distinct made-up words, the same for the same seed."""
+    rng = random.Random(seed)
+    words = []
+    seen = set()
+    while len(words) < n:
+        word = _pseudo_word(rng)
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def write_archive(words: List[str], csv_path: str) -> None:
+    entries = [{"word": w, "meaning": "Synthetic benchmark word.", "origin_era": "2026",
+                "category": "Benchmark", "2026_status": "Peak"} for w in words]
+    with redirect_stdout(sys.stderr):
+        auto_updater.append_to_csv(entries, csv_path=csv_path)
+
+
+class FixtureFetch:
+    """fetch_reddit_data stand-in answering from fixtures."""
+
+    def __init__(self, fixtures: Optional[Dict[str, List[str]]] = None, latency: float = 0.0,
+                 posts_per_search: int = POSTS_PER_SEARCH, request_interval: float = 0.0) -> None:
+        self.fixtures = fixtures or {}
+        self.latency = latency
+        self.limiter = RateLimiter(request_interval) if request_interval else None
+        self.posts_per_search = posts_per_search
+
+    def _posts(self, subreddit: str, keyword: str) -> List[str]:
+        for key in (f"{subreddit}/{keyword}", keyword):
+            if key in self.fixtures:
+                return self.fixtures[key]
+        rng = random.Random(zlib.crc32(f"{subreddit}/{keyword}".encode("utf-8")))
+        return [" ".join([keyword] + rng.sample(_FILLER, 8) + [_pseudo_word(rng) for _ in range(2)])
+                for _ in range(rng.randint(0, self.posts_per_search))]
+
+    def __call__(self, subreddit: str, keyword: str, is_mainstream: bool, **_kwargs) -> list:
+        if self.limiter is not None:
+            self.limiter.wait()
+        if self.latency:
+            time.sleep(self.latency)
+        return [(f"{subreddit}-{keyword}-{i}", keyword, subreddit, text, 0.0, is_mainstream)
+                for i, text in enumerate(self._posts(subreddit, keyword))]
+
+
+def load_fixtures(path: str) -> Dict[str, List[str]]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_benchmark(archive_size: int = ARCHIVE_SIZE, fixtures: Optional[Dict[str, List[str]]] = None,
+                  latency: float = 0.0, request_interval: float = 0.0, pending_words: int = PENDING_WORDS,
+                  budget: int = auto_updater.MAX_WORDS_PER_RUN, fetch_workers: int = 4,
+                  score_workers: int = 1, score: Optional[Callable] = None,
+                  data_dir: Optional[str] = None) -> Dict:
+    """
+    One offline run; returns the JSON-ready report. `data_dir` keeps the
+    generated data for inspection; by default a temporary directory is
+    used and removed.
+    """
+    from data.update_pipeline import UpdatePipeline
+
+    own_dir = data_dir is None
+    data_dir = data_dir or tempfile.mkdtemp(prefix="slang-bench-")
+    os.makedirs(data_dir, exist_ok=True)
+    today = datetime.now().strftime("%Y-%m-%d")
+    csv_path = os.path.join(data_dir, "slang_master_2026.csv")
+    try:
+        words = synthetic_words(archive_size + pending_words)
+        archive_words, pending = words[:archive_size], words[archive_size:]
+        write_archive(archive_words, csv_path)
+        known_words = set(archive_words)
+
+        fetch = FixtureFetch(fixtures, latency, request_interval=request_interval)
+        appended, recorded = [], []
+
+        def append(entries):
+            appended.extend(entries)
+            auto_updater.append_to_csv(entries, csv_path=csv_path)
+
+        def record(rows):
+            recorded.extend(rows)
+            auto_updater.record_mentions(rows, data_dir=data_dir)
+
+        kwargs = {"score": score} if score is not None else {}
+        with redirect_stdout(sys.stderr):
+            mention_words = refresh_scheduler.plan(
+                known_words, today, budget, history_dir=os.path.join(data_dir, "mentions_history"),
+                vault_db=os.path.join(data_dir, "word_vault.db"))
+            cpu_start = time.process_time()
+            pipeline = UpdatePipeline(known_words, pending, fetch=fetch, define=lambda word, timeout=None: None,
+                                      append=append, record=record, mention_words=mention_words,
+                                      fetch_workers=fetch_workers, score_workers=score_workers,
+                                      today=today, **kwargs).run()
+            cpu = time.process_time() - cpu_start
+    finally:
+        if own_dir:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    wall = pipeline.wall
+    requests = pipeline.stats["fetch"].items
+    return {
+        "date": today,
+        "archive_size": archive_size,
+        "pending_words": len(pending),
+        "mention_words": len(mention_words),
+        "latency_s": latency,
+        "request_interval_s": request_interval,
+        "requests_per_s_cap": round(1 / request_interval, 2) if request_interval else None,
+        "fetch_workers": fetch_workers,
+        "score_workers": score_workers,
+        "requests": requests,
+        "requests_per_s": round(requests / wall, 2) if wall else None,
+        "wall_s": round(wall, 3),
+        "cpu_s": round(cpu, 3),
+        "stages": {name: {"busy_s": round(s.busy, 3), "cpu_s": round(s.cpu, 3), "items": s.items}
+                   for name, s in pipeline.stats.items()},
+        "peak_rss_mb": peak_rss_mb(),
+        "rows_written": {"archive": len(appended), "history": len(recorded)},
+    }
@@ -8,14 +8,44 @@ the actual reason most words came back as "Deep search returned no results."
 
 API docs (unofficial but stable and widely used):
     GET https://api.urbandictionary.com/v0/define?term={word}
+
+`fetch_definitions` looks up a whole batch concurrently for the
+auto-updater. Every request, batched or not, holds one of MAX_PER_HOST
+slots for its host, and the batch as a whole gets a deadline. Words whose
+lookup hasn't finished by then come back as None, so callers fall back to
+their Reddit context exactly as for a word UD doesn't know. Each lookup's
+request timeout (and its wait for a host slot) is cut to the time left
+before the deadline, so abandoned lookup threads finish about then too
+and don't hold up interpreter exit.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Optional
+from urllib.parse import urlparse
+
 import requests
 
 UD_API_URL = "https://api.urbandictionary.com/v0/define"
 
+MAX_PER_HOST = 4        # concurrent requests to one host, process-wide
+BATCH_DEADLINE = 30.0   # seconds for a whole fetch_definitions batch
+REQUEST_TIMEOUT = 8.0   # seconds for one lookup
+
+_slots_lock = threading.Lock()
+_host_slots: Dict[str, threading.BoundedSemaphore] = {}
+
 
-def fetch_definition(word: str, timeout: int = 8):
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    host = urlparse(url).netloc
+    with _slots_lock:
+        if host not in _host_slots:
+            _host_slots[host] = threading.BoundedSemaphore(MAX_PER_HOST)
+        return _host_slots[host]
+
+
+def fetch_definition(word: str, timeout: float = REQUEST_TIMEOUT):
     """
     Look up a word on Urban Dictionary.
 
@@ -28,7 +58,13 @@ def fetch_definition(word: str, timeout: int = 8):
         return None
 
     try:
-        response = requests.get(UD_API_URL, params={"term": word}, timeout=timeout)
+        slot = _host_slot(UD_API_URL)
+        if not slot.acquire(timeout=timeout):
+            return None
+        try:
+            response = requests.get(UD_API_URL, params={"term": word}, timeout=timeout)
+        finally:
+            slot.release()
         if response.status_code != 200:
             return None
 
@@ -61,3 +97,41 @@ def fetch_definition(word: str, timeout: int = 8):
         # rather than raising, since this is just one of several fallback
         # definition sources.
         return None
+
+
+def fetch_definitions(words: Iterable[str], deadline: float = BATCH_DEADLINE,
+                      max_workers: int = MAX_PER_HOST,
+                      fetch: Callable[..., Optional[str]] = fetch_definition) -> Dict[str, Optional[str]]:
+    """
+    Definitions for every word, looked up concurrently with
+    `fetch(word, timeout=seconds)`. A word whose lookup fails or misses the
+    deadline maps to None. Returns within about `deadline` seconds; lookups
+    still running then are abandoned, and their timeouts end them shortly
+    after.
+    """
+    words = list(dict.fromkeys(words))
+    results: Dict[str, Optional[str]] = dict.fromkeys(words)
+    if not words:
+        return results
+
+    ends_at = time.monotonic() + deadline
+
+    def lookup(word: str) -> Optional[str]:
+        remaining = ends_at - time.monotonic()
+        if remaining <= 0:
+            return None
+        return fetch(word, timeout=min(REQUEST_TIMEOUT, remaining))
+
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(words))),
+                              thread_name_prefix="ud-lookup")
+    try:
+        futures = {pool.submit(lookup, word): word for word in words}
+        done, _late = wait(futures, timeout=deadline)
+        for future in done:
+            try:
+                results[futures[future]] = future.result()
+            except Exception:
+                pass
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return results
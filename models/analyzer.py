@@ -11,23 +11,36 @@ Note: this module previously depended on the `prophet` package for
 forecasting, which is not declared in requirements.txt and is not
 installed in production. It has been replaced with a lightweight,
 dependency-free linear trend estimate so the app/tests don't crash with
-`ModuleNotFoundError: No module named 'prophet'`.
+`ModuleNotFoundError: No module named 'prophet'`. Forward projections now
+come from the NumPy-only forecaster in models/forecast.py.
 """
 
-import csv
 import os
 import re
 import sqlite3
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from data import archive, history_binary, history_store
+from data.cache import VersionedLRUCache
+from models import trend_stats, trends
+
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DB_PATH = os.environ.get("SLANG_DB_PATH", os.path.join(_PROJECT_ROOT, "data", "slang_data.db"))
 CSV_PATH = os.path.join(_PROJECT_ROOT, "data", "slang_master_2026.csv")
 
 _WORD_RE = re.compile(r"^[a-z0-9\s\-]{1,50}$")
 
+# Words per live-table query, well under SQLite's bound-parameter limit.
+LIVE_QUERY_CHUNK = 500
+
+# Shared by every SlangAnalyzer in the process (the app builds a new one per
+# search); keyed by (db_path, word, window) and invalidated by data_version().
+ANALYSIS_CACHE_SIZE = 256
+_ANALYSIS_CACHE = VersionedLRUCache(maxsize=ANALYSIS_CACHE_SIZE)
+
 
 class SlangAnalyzer:
     """Analyze slang terms for lifecycle status and growth trends."""
@@ -59,17 +72,15 @@ class SlangAnalyzer:
 
         cleaned = word.strip().lower()
 
-        if os.path.exists(CSV_PATH):
-            with open(CSV_PATH, newline="", encoding="utf-8") as f:
-                for row in csv.DictReader(f):
-                    if row.get("word", "").strip().lower() == cleaned:
-                        return {
-                            "word": cleaned,
-                            "meaning": row.get("meaning", ""),
-                            "origin_era": row.get("origin_era", ""),
-                            "category": row.get("category", ""),
-                            "status_2026": row.get("2026_status", "Unverified"),
-                        }
+        row = archive.load(CSV_PATH).get(cleaned)
+        if row is not None:
+            return {
+                "word": cleaned,
+                "meaning": row.get("meaning", ""),
+                "origin_era": row.get("origin_era", ""),
+                "category": row.get("category", ""),
+                "status_2026": row.get("2026_status", "Unverified"),
+            }
 
         # Not found in the archive: return a minimal placeholder record
         # instead of an empty dict, since the word itself was valid input.
@@ -105,42 +116,51 @@ class SlangAnalyzer:
     # ------------------------------------------------------------------
     # Mention-history based growth analysis
     # ------------------------------------------------------------------
-    def get_data(self, word: str) -> pd.DataFrame:
+    def get_data(self, word: str, start: Optional[str] = None,
+                 end: Optional[str] = None) -> pd.DataFrame:
         """
         Fetch daily mainstream/niche mention counts for a word, combining:
-        1. The git-tracked history CSV (data/mentions_history.csv) built by
-           the scheduled auto-updater — this is the real persistent record,
-           since *.db files are gitignored and don't survive across restarts
-           or fresh Action checkouts.
+        1. The git-tracked, month-sharded history (data/mentions_history/)
+           built by the scheduled auto-updater — this is the real persistent
+           record, since *.db files are gitignored and don't survive across
+           restarts or fresh Action checkouts.
         2. Today's live SQLite 'mentions' table, in case the word was just
            searched on-demand and hasn't made it into a scheduled run yet.
+
+        `start`/`end` (YYYY-MM-DD, inclusive) limit the range; only history
+        shards overlapping it are opened.
         """
         word_lower = word.strip().lower()
-        rows = []
+        frames = []
+        for part in (self._load_history([word_lower], start, end),
+                     self._load_live_counts([word_lower], start, end)):
+            if part.empty:
+                continue
+            for kind in ("niche", "mainstream"):
+                frames.append(pd.DataFrame({
+                    "date": part["date"].to_numpy(),
+                    "subreddit_type": kind,
+                    "count": part[f"{kind}_count"].to_numpy(dtype=np.int64),
+                }))
+
+        if not frames:
+            return pd.DataFrame()
 
-        history_path = os.path.join(
-            os.path.dirname(self.db_path), "mentions_history.csv"
-        )
-        if os.path.exists(history_path):
-            hist = pd.read_csv(history_path)
-            hist = hist[hist["word"].str.lower() == word_lower]
-            for _, r in hist.iterrows():
-                rows.append({"date": r["date"], "subreddit_type": "niche", "count": int(r["niche_count"])})
-                rows.append({"date": r["date"], "subreddit_type": "mainstream", "count": int(r["mainstream_count"])})
+        df = pd.concat(frames, ignore_index=True)
+        # Sum in case both sources have an entry for the same date.
+        return df.groupby(["date", "subreddit_type"], as_index=False)["count"].sum()
 
+    def data_version(self) -> Tuple[str, Optional[int]]:
+        """
+        Cheap fingerprint of everything mention analysis reads: the history
+        manifest hash plus the live 'mentions' table's highest rowid (rows
+        are only ever inserted). Changes whenever either source gains data.
+        """
+        history_dir = os.path.join(os.path.dirname(self.db_path), "mentions_history")
+        live_mark = None
         try:
             conn = sqlite3.connect(self.db_path)
-            query = """
-                SELECT
-                    date(timestamp, 'unixepoch') as date,
-                    CASE WHEN is_mainstream = 1 THEN 'mainstream' ELSE 'niche' END as subreddit_type,
-                    COUNT(*) as count
-                FROM mentions
-                WHERE keyword = ?
-                GROUP BY date, subreddit_type
-            """
-            live = pd.read_sql_query(query, conn, params=(word_lower,))
-            rows.extend(live.to_dict("records"))
+            live_mark = conn.execute("SELECT MAX(rowid) FROM mentions").fetchone()[0]
         except Exception:
             pass
         finally:
@@ -148,13 +168,140 @@ class SlangAnalyzer:
                 conn.close()
             except Exception:
                 pass
+        return history_store.history_version(history_dir), live_mark
 
-        if not rows:
+    def get_daily_series(self, word: str, start: Optional[str] = None,
+                         end: Optional[str] = None) -> pd.DataFrame:
+        """
+        Fast path for `process_data(get_data(word, start, end))`: scatters the
+        history and live counts straight into dense per-day NumPy arrays
+        instead of building a long frame and pivoting it. Returns an
+        identical DataFrame (get_data always has both subreddit types, so
+        process_data's int column for a missing type never arises).
+        """
+        word_lower = word.strip().lower()
+        parts = [p for p in (self._load_history([word_lower], start, end),
+                             self._load_live_counts([word_lower], start, end)) if not p.empty]
+        if not parts:
             return pd.DataFrame()
 
-        df = pd.DataFrame(rows)
-        # Sum in case both sources have an entry for the same date.
-        return df.groupby(["date", "subreddit_type"], as_index=False)["count"].sum()
+        day = np.concatenate([history_binary.dates_to_days(p["date"]) for p in parts])
+        first = day.min()
+        offset = day - first
+        n_days = int(offset.max()) + 1
+        niche = np.bincount(offset, minlength=n_days, weights=np.concatenate(
+            [p["niche_count"].to_numpy(dtype=np.float64) for p in parts]))
+        mainstream = np.bincount(offset, minlength=n_days, weights=np.concatenate(
+            [p["mainstream_count"].to_numpy(dtype=np.float64) for p in parts]))
+
+        # Parse the first date the same way process_data does, so the
+        # datetime resolution of the result matches exactly.
+        first_date = pd.to_datetime(pd.Index([np.datetime_as_string(history_binary.days_to_dates(first))]))[0]
+        dates = pd.date_range(start=first_date, periods=n_days)
+        return self._daily_frame(dates, mainstream, niche)
+
+    @staticmethod
+    def _daily_frame(dates: pd.DatetimeIndex, mainstream: np.ndarray, niche: np.ndarray) -> pd.DataFrame:
+        """The continuous daily frame get_daily_series returns."""
+        total = mainstream + niche
+        df = pd.DataFrame({
+            "date": dates,
+            "mainstream": mainstream,
+            "niche": niche,
+            "total": total,
+            "ratio": (mainstream + 1) / (niche + 1),
+            "saturation": mainstream / (total + 1),
+        })
+        df.columns.name = "subreddit_type"
+        return df
+
+    def _load_word_history(self, word_lower: str, start: Optional[str] = None,
+                           end: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """One word's rows from the persistent history (None if it has none)."""
+        hist = self._load_history([word_lower], start, end)
+        return hist if not hist.empty else None
+
+    def _load_history(self, words: Optional[Iterable[str]] = None, start: Optional[str] = None,
+                      end: Optional[str] = None) -> pd.DataFrame:
+        """
+        Persistent history rows for `words` (all words if None). Prefers the
+        memory-mapped binary copy (data/mentions_history.bin, see
+        data/history_binary.py) when it's at least as new as the shards,
+        since that's a slice rather than a parse; otherwise reads only the
+        shards overlapping the range.
+        """
+        data_dir = os.path.dirname(self.db_path)
+        history_dir = os.path.join(data_dir, "mentions_history")
+        binary_path = os.path.join(data_dir, "mentions_history.bin")
+
+        if (history_binary.is_fresh(binary_path, history_store.manifest_path(history_dir))
+                and history_binary.is_fresh(binary_path, history_store.legacy_path_for(history_dir))):
+            history = history_binary.shared(binary_path)
+            if words is None:
+                hist = history.to_frame()
+            else:
+                frames = [history.word_frame(w) for w in words]
+                hist = (pd.concat(frames, ignore_index=True) if frames
+                        else pd.DataFrame(columns=history_store.FIELDNAMES))
+            if start:
+                hist = hist[hist["date"] >= start]
+            if end:
+                hist = hist[hist["date"] <= end]
+            return hist
+
+        return history_store.read_history(start, end, words=words, history_dir=history_dir)
+
+    def _load_live_counts(self, words: Optional[Iterable[str]] = None, start: Optional[str] = None,
+                          end: Optional[str] = None) -> pd.DataFrame:
+        """
+        Per-day niche/mainstream counts from the live SQLite 'mentions' table,
+        in the same columns as the history (empty if the table isn't there).
+        The word and date filters run in SQL, so a single-word lookup only
+        aggregates that word's rows.
+        """
+        conditions, params = [], []
+        if start:
+            conditions.append("date(timestamp, 'unixepoch') >= ?")
+            params.append(start)
+        if end:
+            conditions.append("date(timestamp, 'unixepoch') <= ?")
+            params.append(end)
+        if words is None:
+            word_chunks = [None]
+        else:
+            wanted = sorted({w.strip().lower() for w in words})
+            if not wanted:
+                return pd.DataFrame(columns=history_store.FIELDNAMES)
+            word_chunks = [wanted[i:i + LIVE_QUERY_CHUNK] for i in range(0, len(wanted), LIVE_QUERY_CHUNK)]
+
+        frames = []
+        try:
+            conn = sqlite3.connect(self.db_path)
+            for chunk in word_chunks:
+                where = list(conditions)
+                chunk_params = list(params)
+                if chunk is not None:
+                    where.append(f"keyword IN ({', '.join('?' * len(chunk))})")
+                    chunk_params.extend(chunk)
+                query = f"""
+                    SELECT
+                        date(timestamp, 'unixepoch') as date,
+                        keyword as word,
+                        SUM(CASE WHEN is_mainstream = 1 THEN 0 ELSE 1 END) as niche_count,
+                        SUM(CASE WHEN is_mainstream = 1 THEN 1 ELSE 0 END) as mainstream_count
+                    FROM mentions
+                    {"WHERE " + " AND ".join(where) if where else ""}
+                    GROUP BY keyword, date
+                """
+                frames.append(pd.read_sql_query(query, conn, params=chunk_params))
+        except Exception:
+            return pd.DataFrame(columns=history_store.FIELDNAMES)
+        finally:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
 
     def process_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Pivot raw mention counts into a continuous daily time series."""
@@ -189,27 +336,13 @@ class SlangAnalyzer:
         """
         Dependency-free replacement for the old Prophet-based forecast.
         Estimates the growth rate as the relative change implied by a
-        simple linear fit over the available history.
+        simple linear fit over the available history (closed form, see
+        models/trends.py).
         """
-        n = len(series)
-        if n < 2:
-            return 0.0
+        return trends.linear_growth_rate(series.to_numpy())
 
-        x = list(range(n))
-        y = series.tolist()
-        mean_x = sum(x) / n
-        mean_y = sum(y) / n
-        denom = sum((xi - mean_x) ** 2 for xi in x)
-        if denom == 0:
-            return 0.0
-
-        slope = sum((xi - mean_x) * (yi - mean_y) for xi, yi in zip(x, y)) / denom
-        start_value = mean_y - slope * mean_x
-        if start_value <= 0:
-            return 0.0
-
-        end_value = start_value + slope * (n - 1)
-        return (end_value - start_value) / start_value
+    # Batched form: one growth rate per row of a (words x days) matrix.
+    growth_rates = staticmethod(trends.growth_rates)
 
     def calculate_growth_rate(self, df: pd.DataFrame, column: str) -> float:
         """Estimate the growth rate of a column over the historical data."""
@@ -217,18 +350,32 @@ class SlangAnalyzer:
             return 0.0
         return self._linear_growth_rate(df[column])
 
-    def analyze_word(self, word: str) -> Optional[Dict[str, Any]]:
-        """Full mention-history analysis pipeline for a word."""
-        raw_data = self.get_data(word)
-        if raw_data.empty:
-            return None
+    def analyze_word(self, word: str, window: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Full mention-history analysis pipeline for a word.
 
-        hist_df = self.process_data(raw_data)
+        With `window`, the growth rates (and so the cringe alert) are fitted
+        over only the most recent `window` days, so a word that peaked long
+        ago and is collapsing now shows it. The historical frame is always
+        the full series.
+
+        Results are memoized per (word, window) and data version (see
+        `data_version`), so repeat searches between history updates skip all
+        recomputation. Treat the returned frame as read-only.
+        """
+        key = (self.db_path, word.strip().lower(), window)
+        return _ANALYSIS_CACHE.get_or_compute(
+            key, self.data_version(), lambda: self._analyze_word(word, window)
+        )
+
+    def _analyze_word(self, word: str, window: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        hist_df = self.get_daily_series(word)
         if hist_df.empty:
             return None
 
-        m_growth = self.calculate_growth_rate(hist_df, "mainstream")
-        n_growth = self.calculate_growth_rate(hist_df, "niche")
+        recent = hist_df.tail(window) if window else hist_df
+        m_growth = self.calculate_growth_rate(recent, "mainstream")
+        n_growth = self.calculate_growth_rate(recent, "niche")
         is_cringe_alert = self.check_cringe_alert(m_growth, n_growth)
 
         return {
@@ -242,6 +389,161 @@ class SlangAnalyzer:
             "cringe_alert": is_cringe_alert,
         }
 
+    def trend_profile(self, word: str, window: int = 14, alpha: Optional[float] = None) -> pd.DataFrame:
+        """
+        Day-by-day windowed trend for both series: rolling least-squares
+        slope and growth rate over the trailing `window` days, EWMA level
+        (alpha defaults to 2 / (window + 1)) and momentum (trailing-window
+        mean minus the window before it). O(n) in the history length for
+        any window, via cumulative sums (models/trends.py).
+
+        Columns: date, then {mainstream,niche}_{slope,growth,ewma,momentum}.
+        Days without a full window are NaN.
+        """
+        hist_df = self.get_daily_series(word)
+        if hist_df.empty:
+            return pd.DataFrame()
+
+        alpha = alpha if alpha is not None else 2.0 / (window + 1)
+        profile = pd.DataFrame({"date": hist_df["date"]})
+        for col in ("mainstream", "niche"):
+            y = hist_df[col].to_numpy()
+            profile[f"{col}_slope"] = trends.rolling_slopes(y, window)
+            profile[f"{col}_growth"] = trends.rolling_growth_rates(y, window)
+            profile[f"{col}_ewma"] = trends.ewma(y, alpha)
+            profile[f"{col}_momentum"] = trends.momentum(y, window)
+        return profile
+
+    def _load_daily_counts(self, words: Optional[Iterable[str]] = None, end: Optional[str] = None,
+                           include_live: bool = True) -> pd.DataFrame:
+        """History (plus live counts), summed to one row per (word, date)."""
+        if words is not None:
+            words = [w.strip().lower() for w in words]
+        parts = [self._load_history(words, end=end)]
+        if include_live:
+            parts.append(self._load_live_counts(words, end=end))
+        combined = pd.concat(parts, ignore_index=True)
+        if combined.empty:
+            return pd.DataFrame(columns=history_store.FIELDNAMES)
+        combined["word"] = combined["word"].str.lower()
+        # Sum in case both sources have an entry for the same date.
+        return combined.groupby(["word", "date"], as_index=False)[["niche_count", "mainstream_count"]].sum()
+
+    def sync_trend_stats(self) -> trend_stats.TrendStatsStore:
+        """
+        The running-statistics store for this analyzer's data directory.
+        If the history changed without it, it is loaded from the committed
+        snapshot when that matches (and there are no live mentions to add),
+        else rebuilt from the history.
+        """
+        store = trend_stats.TrendStatsStore(self.db_path)
+        version = history_store.history_version(store.history_dir)
+        if store.built_version() != version:
+            if self.has_live_mentions() or not store.load_snapshot(version):
+                store.rebuild(self._load_daily_counts(), version)
+        return store
+
+    def has_live_mentions(self) -> bool:
+        """Whether the live 'mentions' table has any rows."""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                return conn.execute("SELECT 1 FROM mentions LIMIT 1").fetchone() is not None
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return False
+
+    def trend_snapshot(self, word: str) -> Optional[Dict[str, Any]]:
+        """
+        Growth metrics and cringe alert for `word` in constant time, from the
+        running sufficient statistics (models/trend_stats.py) instead of a
+        refit over the full history. Same numbers as `analyze_word`, minus
+        the historical frame. None if the word has no mentions.
+        """
+        stats = self.sync_trend_stats().get(word)
+        if stats is None:
+            return None
+        metrics = trend_stats.metrics_from_stats(stats)
+        return {
+            "metrics": metrics,
+            "cringe_alert": self.check_cringe_alert(metrics["mainstream_growth"], metrics["niche_growth"]),
+        }
+
+    def daily_matrix(self, words: Optional[Iterable[str]] = None, end: Optional[str] = None,
+                     include_live: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Every word's dense daily series, left-aligned in (words x days)
+        matrices: row i holds word i's counts from its own first day, for
+        lengths[i] days, zero-padded after that. None if there's no data.
+
+        Returns {'words', 'first_day', 'last_day', 'lengths', 'niche',
+        'mainstream'}; days are day numbers (see data/history_binary.py).
+        """
+        daily = self._load_daily_counts(words, end=end, include_live=include_live)
+        if daily.empty:
+            return None
+
+        codes, vocab = pd.factorize(daily["word"], sort=True)
+        day = history_binary.dates_to_days(daily["date"])
+        first = np.full(len(vocab), np.iinfo(np.int32).max, dtype=np.int64)
+        last = np.full(len(vocab), np.iinfo(np.int32).min, dtype=np.int64)
+        np.minimum.at(first, codes, day)
+        np.maximum.at(last, codes, day)
+        lengths = last - first + 1
+
+        col = day - first[codes]
+        niche = np.zeros((len(vocab), lengths.max()))
+        mainstream = np.zeros_like(niche)
+        niche[codes, col] = daily["niche_count"].to_numpy(dtype=np.float64)
+        mainstream[codes, col] = daily["mainstream_count"].to_numpy(dtype=np.float64)
+        return {"words": np.asarray(vocab), "first_day": first, "last_day": last,
+                "lengths": lengths, "niche": niche, "mainstream": mainstream}
+
+    def analyze_many(self, words: Optional[Iterable[str]] = None,
+                     end: Optional[str] = None) -> pd.DataFrame:
+        """
+        `analyze_word` metrics for every tracked word (or just `words`) from a
+        single read of the history plus one live-table query, with all growth
+        rates fitted in one batched NumPy pass.
+
+        `end` (YYYY-MM-DD) evaluates the archive as it stood on that day.
+
+        Returns a DataFrame with one row per word: word, first_date,
+        last_date, days, mainstream_growth, niche_growth, current_ratio,
+        saturation, cringe_alert.
+        """
+        columns = ["word", "first_date", "last_date", "days", "mainstream_growth",
+                   "niche_growth", "current_ratio", "saturation", "cringe_alert"]
+        matrix = self.daily_matrix(words, end=end)
+        if matrix is None:
+            return pd.DataFrame(columns=columns)
+
+        vocab, first, last, lengths = matrix["words"], matrix["first_day"], matrix["last_day"], matrix["lengths"]
+        niche, mainstream = matrix["niche"], matrix["mainstream"]
+        rows = np.arange(len(vocab))
+        last_niche = niche[rows, lengths - 1]
+        last_mainstream = mainstream[rows, lengths - 1]
+        m_growth = trends.growth_rates(mainstream, lengths)
+        n_growth = trends.growth_rates(niche, lengths)
+
+        return pd.DataFrame({
+            "word": vocab,
+            "first_date": np.datetime_as_string(history_binary.days_to_dates(first), unit="D"),
+            "last_date": np.datetime_as_string(history_binary.days_to_dates(last), unit="D"),
+            "days": lengths,
+            "mainstream_growth": m_growth,
+            "niche_growth": n_growth,
+            "current_ratio": (last_mainstream + 1) / (last_niche + 1),
+            "saturation": last_mainstream / (last_mainstream + last_niche + 1),
+            "cringe_alert": [self.check_cringe_alert(m, n) for m, n in zip(m_growth, n_growth)],
+        })
+
+    @staticmethod
+    def cache_stats() -> Dict[str, int]:
+        """Hit/miss counters and size of the analyze_word memo."""
+        return _ANALYSIS_CACHE.stats()
+
     def check_cringe_alert(self, m_growth: float, n_growth: float) -> bool:
         """
         Alert if mainstream growth rate exceeds niche growth rate by 200%
@@ -0,0 +1,118 @@
+"""
+Streaming cringe-threshold detector
+-----------------------------------
+`SlangAnalyzer.check_cringe_alert` only runs when someone happens to search
+a word, so threshold crossings across the rest of the archive go unnoticed.
+This module runs an online Page-Hinkley test over every word as the
+auto-updater appends each day's counts:
+
+    x_t   = log((mainstream + 1) / (niche + 1))     # daily mainstream/niche ratio
+    mean  = running mean of x
+    cum  += x_t - mean - DELTA
+    alarm when cum - min(cum) > THRESHOLD           # sustained upward shift
+
+Per-word state is four numbers plus the last processed date, kept in
+data/changepoint_state.csv; each alarm resets that word's state. The latest
+alarm per word goes to data/cringe_alerts.csv, which the app reads as-is.
+Both files are git-tracked so the state survives fresh Action checkouts.
+"""
+
+import csv
+import math
+import os
+from typing import Dict, Iterable, List
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_PATH = os.path.join(_PROJECT_ROOT, "data", "changepoint_state.csv")
+ALERTS_PATH = os.path.join(_PROJECT_ROOT, "data", "cringe_alerts.csv")
+
+DELTA = 0.05        # tolerated drift per day, in log-ratio units
+THRESHOLD = 1.5     # cumulative excess needed to raise an alert
+MIN_SAMPLES = 7     # days of warm-up before a word can alert
+
+STATE_FIELDS = ["word", "n", "mean", "cum", "min_cum", "last_date"]
+ALERT_FIELDS = ["word", "date", "statistic", "ratio", "samples"]
+
+
+def _fresh_state(word: str) -> Dict:
+    return {"word": word, "n": 0, "mean": 0.0, "cum": 0.0, "min_cum": 0.0, "last_date": ""}
+
+
+def step(state: Dict, date: str, niche: int, mainstream: int) -> Dict:
+    """
+    Feed one day into a word's state (mutated in place). Returns an alert
+    row if this day completed an upward shift, else None.
+    """
+    x = math.log((mainstream + 1) / (niche + 1))
+    state["n"] += 1
+    state["mean"] += (x - state["mean"]) / state["n"]
+    state["cum"] += x - state["mean"] - DELTA
+    state["min_cum"] = min(state["min_cum"], state["cum"])
+    state["last_date"] = date
+
+    statistic = state["cum"] - state["min_cum"]
+    if state["n"] >= MIN_SAMPLES and statistic > THRESHOLD:
+        alert = {"word": state["word"], "date": date, "statistic": round(statistic, 4),
+                 "ratio": round((mainstream + 1) / (niche + 1), 4), "samples": state["n"]}
+        state.update(_fresh_state(state["word"]), last_date=date)
+        return alert
+    return None
+
+
+def _read_csv(path: str) -> List[Dict]:
+    if not os.path.exists(path):
+        return []
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def _write_csv(path: str, fieldnames: List[str], rows: Iterable[Dict]) -> None:
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(tmp_path, path)
+
+
+def load_state(path: str = STATE_PATH) -> Dict[str, Dict]:
+    states = {}
+    for row in _read_csv(path):
+        states[row["word"]] = {
+            "word": row["word"], "n": int(row["n"]), "mean": float(row["mean"]),
+            "cum": float(row["cum"]), "min_cum": float(row["min_cum"]), "last_date": row["last_date"],
+        }
+    return states
+
+
+def load_alerts(path: str = ALERTS_PATH) -> Dict[str, Dict]:
+    """Latest alert per word, keyed by lowercased word (what the app reads)."""
+    return {row["word"]: row for row in _read_csv(path)}
+
+
+def update(rows: Iterable[Dict], state_path: str = STATE_PATH,
+           alerts_path: str = ALERTS_PATH) -> List[Dict]:
+    """
+    Feed history rows (date, word, niche_count, mainstream_count) through
+    every word's detector, skipping days a word has already processed, and
+    persist the state and alerts. Returns the alerts raised by this call.
+    """
+    states = load_state(state_path)
+    alerts = load_alerts(alerts_path)
+    raised = []
+
+    for row in sorted(rows, key=lambda r: r["date"]):
+        word = row["word"].strip().lower()
+        state = states.setdefault(word, _fresh_state(word))
+        if state["last_date"] and row["date"] <= state["last_date"]:
+            continue
+        alert = step(state, row["date"], int(row["niche_count"]), int(row["mainstream_count"]))
+        if alert:
+            alerts[word] = alert
+            raised.append(alert)
+
+    _write_csv(state_path, STATE_FIELDS,
+               ({**s, "mean": round(s["mean"], 6), "cum": round(s["cum"], 6),
+                 "min_cum": round(s["min_cum"], 6)} for _, s in sorted(states.items())))
+    _write_csv(alerts_path, ALERT_FIELDS, (a for _, a in sorted(alerts.items())))
+    return raised
@@ -0,0 +1,175 @@
+"""
+Cringe-threshold forecasting
+----------------------------
+Dependency-light replacement for the Prophet forecasting this project
+dropped (see models/analyzer.py): damped-trend Holt exponential smoothing,
+fitted to every word's niche and mainstream series at once. The recursion
+runs once over time and is vectorized across words (and across a small
+grid of smoothing parameters, keeping each word's best one-step-ahead fit).
+
+From the fitted level/trend it projects both series forward and reports the
+first day on which the projected counts would score as "Cringe" under
+SlangAnalyzer.calculate_cringe_score / detect_lifecycle_status (score >= 80,
+i.e. mainstream >= 1.6x niche).
+
+Results depend only on the git-tracked history, so they're cached per
+history version: in a small in-memory LRU for the process, and on disk
+under data/.cache/ so a fresh process doesn't refit the archive either.
+Only the latest version's file is kept per horizon.
+"""
+
+import glob
+import hashlib
+import os
+from itertools import product
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from data import history_binary, history_store
+from data.cache import VersionedLRUCache
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(_PROJECT_ROOT, "data", ".cache")
+
+ALPHAS = (0.2, 0.5, 0.8)
+BETAS = (0.05, 0.2)
+PHI = 0.9
+CRINGE_SCORE = 80.0
+DEFAULT_HORIZON = 90
+
+# (history dir, horizon) -> result, valid for one history version.
+_memo = VersionedLRUCache(maxsize=8)
+
+
+def holt_damped(y: np.ndarray, lengths: np.ndarray, alpha: float, beta: float,
+                phi: float = PHI) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Damped-trend Holt smoothing of each row of `y`, over its first
+    lengths[i] values.
+
+        level_t = a*y_t + (1 - a)*(level + phi*trend)
+        trend_t = b*(level_t - level) + (1 - b)*phi*trend
+
+    Returns (level, trend, sse) per row, where sse is the sum of squared
+    one-step-ahead errors.
+    """
+    level = y[:, 0].copy()
+    trend = np.zeros(len(y))
+    sse = np.zeros(len(y))
+    for t in range(1, y.shape[1]):
+        active = t < lengths
+        predicted = level + phi * trend
+        err = y[:, t] - predicted
+        new_level = predicted + alpha * err
+        new_trend = beta * (new_level - level) + (1 - beta) * phi * trend
+        sse += np.where(active, err * err, 0.0)
+        level = np.where(active, new_level, level)
+        trend = np.where(active, new_trend, trend)
+    return level, trend, sse
+
+
+def fit(y: np.ndarray, lengths: np.ndarray, phi: float = PHI) -> Tuple[np.ndarray, np.ndarray]:
+    """Best (lowest SSE) level/trend per row over the ALPHAS x BETAS grid."""
+    best_sse = np.full(len(y), np.inf)
+    best_level = np.zeros(len(y))
+    best_trend = np.zeros(len(y))
+    for alpha, beta in product(ALPHAS, BETAS):
+        level, trend, sse = holt_damped(y, lengths, alpha, beta, phi)
+        better = sse < best_sse
+        best_sse = np.where(better, sse, best_sse)
+        best_level = np.where(better, level, best_level)
+        best_trend = np.where(better, trend, best_trend)
+    return best_level, best_trend
+
+
+def project(level: np.ndarray, trend: np.ndarray, horizon: int, phi: float = PHI) -> np.ndarray:
+    """(rows x horizon) projections; column h-1 is h days ahead, clipped at 0."""
+    steps = np.arange(1, horizon + 1)
+    damped = np.cumsum(phi ** steps)
+    return np.maximum(level[:, None] + trend[:, None] * damped[None, :], 0.0)
+
+
+def cringe_scores(niche: np.ndarray, mainstream: np.ndarray) -> np.ndarray:
+    """Vectorized SlangAnalyzer.calculate_cringe_score."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(niche == 0, 0.0, np.minimum(100.0, mainstream / niche * 50))
+
+
+def forecast_matrix(matrix: Dict, horizon: int = DEFAULT_HORIZON) -> pd.DataFrame:
+    """
+    Fit and project every word in a SlangAnalyzer.daily_matrix result.
+
+    Returns one row per word: word, last_date, current_score,
+    projected_score (at the horizon), days_to_cringe (NaN if not within the
+    horizon; 0 if already there) and cringe_date.
+    """
+    lengths = matrix["lengths"]
+    rows = np.arange(len(lengths))
+    n_level, n_trend = fit(matrix["niche"], lengths)
+    m_level, m_trend = fit(matrix["mainstream"], lengths)
+    niche_f = project(n_level, n_trend, horizon)
+    mainstream_f = project(m_level, m_trend, horizon)
+
+    current = cringe_scores(matrix["niche"][rows, lengths - 1], matrix["mainstream"][rows, lengths - 1])
+    projected = cringe_scores(niche_f, mainstream_f)
+    crossed = projected >= CRINGE_SCORE
+    days_to = np.where(crossed.any(axis=1), crossed.argmax(axis=1) + 1.0, np.nan)
+    days_to = np.where(current >= CRINGE_SCORE, 0.0, days_to)
+
+    cringe_day = matrix["last_day"] + np.nan_to_num(days_to).astype(np.int64)
+    cringe_date = np.where(np.isnan(days_to), "",
+                           np.datetime_as_string(history_binary.days_to_dates(cringe_day), unit="D"))
+    return pd.DataFrame({
+        "word": matrix["words"],
+        "last_date": np.datetime_as_string(history_binary.days_to_dates(matrix["last_day"]), unit="D"),
+        "current_score": current,
+        "projected_score": projected[:, -1],
+        "days_to_cringe": days_to,
+        "cringe_date": cringe_date,
+    })
+
+
+def forecast_crossings(analyzer, horizon: int = DEFAULT_HORIZON,
+                       cache_dir: Optional[str] = CACHE_DIR) -> pd.DataFrame:
+    """
+    Projected cringe-crossing dates for the whole archive, cached per
+    history version (memory first, then `cache_dir`; None disables the
+    disk cache).
+    """
+    history_dir = os.path.join(os.path.dirname(analyzer.db_path), "mentions_history")
+    version = history_store.history_version(history_dir)
+    found, result = _memo.get((history_dir, horizon), version)
+    if found:
+        return result
+
+    # The history version is a hash of the manifest alone, so two history
+    # directories can share it (e.g. two empty stores); key files by both.
+    dir_key = hashlib.sha1(os.path.abspath(history_dir).encode("utf-8")).hexdigest()[:8]
+    cache_path = (os.path.join(cache_dir, f"forecast_{dir_key}_{version}_{horizon}.csv")
+                  if cache_dir else None)
+    if cache_path and os.path.exists(cache_path):
+        result = pd.read_csv(cache_path, dtype={"word": str, "cringe_date": str}, keep_default_na=False,
+                             na_values={"days_to_cringe": [""]})
+    else:
+        matrix = analyzer.daily_matrix(include_live=False)
+        result = forecast_matrix(matrix, horizon) if matrix else pd.DataFrame(
+            columns=["word", "last_date", "current_score", "projected_score", "days_to_cringe", "cringe_date"])
+        if cache_path:
+            os.makedirs(cache_dir, exist_ok=True)
+            result.to_csv(cache_path, index=False)
+            _remove_stale(cache_dir, dir_key, horizon, keep=cache_path)
+
+    _memo.set((history_dir, horizon), version, result)
+    return result
+
+
+def _remove_stale(cache_dir: str, dir_key: str, horizon: int, keep: str) -> None:
+    """Delete this history directory's and horizon's files for older versions."""
+    for path in glob.glob(os.path.join(cache_dir, f"forecast_{dir_key}_*_{horizon}.csv")):
+        if os.path.abspath(path) != os.path.abspath(keep):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -0,0 +1,71 @@
+"""
+Trend Leaderboard
+-----------------
+Ranks the whole archive by cringe risk using SlangAnalyzer.analyze_many,
+which reads the mention history once for every word.
+
+    python models/leaderboard.py                 # top 10, 7-day lookback
+    python models/leaderboard.py --top 25 --since 14
+
+Sections:
+  - Fastest mainstream risers: highest mainstream growth rate.
+  - Newly crossed the cringe threshold: words whose cringe alert is on now
+    but was off `--since` days before the latest recorded day.
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import Dict
+
+import pandas as pd
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _PROJECT_ROOT)
+
+from models.analyzer import SlangAnalyzer  # noqa: E402
+
+
+def build_leaderboard(analyzer: SlangAnalyzer, top: int = 10, since_days: int = 7) -> Dict[str, pd.DataFrame]:
+    """Return {'risers': DataFrame, 'newly_crossed': DataFrame}."""
+    current = analyzer.analyze_many()
+    if current.empty:
+        return {"risers": current, "newly_crossed": current}
+
+    risers = current.sort_values(["mainstream_growth", "word"], ascending=[False, True]).head(top)
+
+    latest = datetime.strptime(current["last_date"].max(), "%Y-%m-%d")
+    cutoff = (latest - timedelta(days=since_days)).strftime("%Y-%m-%d")
+    before = analyzer.analyze_many(end=cutoff)
+    was_alert = set(before.loc[before["cringe_alert"], "word"])
+    newly_crossed = current[current["cringe_alert"] & ~current["word"].isin(was_alert)]
+    newly_crossed = newly_crossed.sort_values(["mainstream_growth", "word"], ascending=[False, True]).head(top)
+
+    return {"risers": risers, "newly_crossed": newly_crossed}
+
+
+def _print_table(title: str, df: pd.DataFrame) -> None:
+    print(f"\n{title}")
+    print("-" * len(title))
+    if df.empty:
+        print("  (none)")
+        return
+    for rank, row in enumerate(df.itertuples(index=False), start=1):
+        print(f"  {rank:>2}. {row.word:<24} mainstream {row.mainstream_growth * 100:+7.1f}%"
+              f"  niche {row.niche_growth * 100:+7.1f}%  ratio {row.current_ratio:.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank tracked slang by cringe risk.")
+    parser.add_argument("--top", type=int, default=10, help="rows per section")
+    parser.add_argument("--since", type=int, default=7, help="lookback in days for newly crossed thresholds")
+    args = parser.parse_args(argv)
+
+    board = build_leaderboard(SlangAnalyzer(), top=args.top, since_days=args.since)
+    _print_table("Fastest mainstream risers", board["risers"])
+    _print_table(f"Newly crossed the cringe threshold (last {args.since} days)", board["newly_crossed"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+English lexicon and NLTK resources
+----------------------------------
+Everything the slang heuristics need from NLTK, loaded on first use rather
+than at import time: the standard-English word list, WordNet and the VADER
+sentiment analyzer. Importing models.slang_detector (and with it the app
+and the auto-updater) no longer checks, downloads or parses any corpus.
+
+The word list can also be prebuilt into a compact artifact,
+data/english_lexicon.bin, that opens in milliseconds instead of building
+a ~236k-entry set from the NLTK corpus:
+
+    header   <4sHHIQ   magic b"SLLX", version, flags (unused),
+                       n_words, words_nbytes
+    words    utf-8     words sorted by their utf-8 bytes, joined by "\\n",
+                       zero-padded to an 8-byte boundary
+    offsets  int64     n_words + 1 entries; word i is
+                       words[offsets[i]:offsets[i + 1] - 1]
+
+Membership is a binary search over the memory-mapped file, so nothing is
+copied onto the heap. Words keep their corpus casing, exactly like the
+`set(words.words())` they replace.
+
+`english_vocab()` is the one lexicon service for the whole codebase
+(slang_detector and MasterWordAnalyzer both use it). Because it's a
+read-only map of one file, every Streamlit or updater worker process shares
+the same physical pages; if the artifact is missing it's built on first use
+so that stays true, and only a read-only checkout falls back to a private
+in-memory set.
+
+Usage:
+    python models/lexicon.py build [data/english_lexicon.bin]
+"""
+
+import argparse
+import mmap
+import os
+import ssl
+import struct
+import threading
+from array import array
+from functools import lru_cache
+from itertools import accumulate
+from typing import Iterable, Optional
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LEXICON_PATH = os.path.join(_PROJECT_ROOT, "data", "english_lexicon.bin")
+
+MAGIC = b"SLLX"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHIQ")
+
+# NLTK resource path -> downloader package name.
+NLTK_RESOURCES = {
+    "corpora/words": "words",
+    "sentiment/vader_lexicon.zip": "vader_lexicon",
+    "corpora/wordnet.zip": "wordnet",
+}
+
+_lock = threading.Lock()
+_ensured = set()
+
+
+def _pad8(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def ensure_nltk(resource: str) -> None:
+    """Download an NLTK resource (a key of NLTK_RESOURCES) if it's missing, once per process."""
+    if resource in _ensured:
+        return
+    import nltk
+
+    with _lock:
+        if resource in _ensured:
+            return
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            # Fix for NLTK download SSL/certificate issues on some machines
+            try:
+                ssl._create_default_https_context = ssl._create_unverified_context
+            except AttributeError:
+                pass
+            nltk.download(NLTK_RESOURCES[resource])
+        _ensured.add(resource)
+
+
+def write_lexicon(words: Iterable[str], path: str = LEXICON_PATH) -> int:
+    """Write `words` to `path` in the artifact format. Returns the word count."""
+    encoded = sorted({w.encode("utf-8") for w in words if w and "\n" not in w})
+    blob = b"".join(w + b"\n" for w in encoded)
+    offsets = array("q", accumulate((len(w) + 1 for w in encoded), initial=0))
+
+    # Per-process temp name: several workers may build the same artifact.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(encoded), len(blob)))
+        f.write(blob.ljust(_pad8(len(blob)), b"\0"))
+        f.write(offsets.tobytes())
+    # Atomic swap so a reader never maps a half-written file.
+    os.replace(tmp_path, path)
+    return len(encoded)
+
+
+def build(path: str = LEXICON_PATH) -> int:
+    """Build the artifact from the NLTK words corpus."""
+    ensure_nltk("corpora/words")
+    from nltk.corpus import words
+
+    return write_lexicon(words.words(), path)
+
+
+class Lexicon:
+    """Read-only, memory-mapped view of a lexicon artifact (supports `in` and `len`)."""
+
+    def __init__(self, path: str = LEXICON_PATH) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _flags, n_words, words_nbytes = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a version-{VERSION} lexicon file")
+        self._n = n_words
+        self._words_start = _HEADER.size
+        start = self._words_start + _pad8(words_nbytes)
+        self._offsets = memoryview(self._mmap)[start:start + 8 * (n_words + 1)].cast("q")
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _word(self, i: int) -> bytes:
+        base = self._words_start
+        return self._mmap[base + self._offsets[i]:base + self._offsets[i + 1] - 1]
+
+    def __contains__(self, word: str) -> bool:
+        key = word.encode("utf-8")
+        lo, hi = 0, self._n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._word(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo < self._n and self._word(lo) == key
+
+
+@lru_cache(maxsize=None)
+def english_vocab(path: Optional[str] = None):
+    """
+    The shared standard-English word list: a memory-mapped `Lexicon`,
+    building the artifact from the NLTK corpus first if it's missing.
+    """
+    path = path or LEXICON_PATH
+    if not os.path.exists(path):
+        try:
+            build(path)
+        except OSError:
+            # Read-only checkout: fall back to a private in-memory copy.
+            from nltk.corpus import words
+
+            return frozenset(words.words())
+    return Lexicon(path)
+
+
+@lru_cache(maxsize=None)
+def sentiment_analyzer():
+    """The shared VADER analyzer."""
+    ensure_nltk("sentiment/vader_lexicon.zip")
+    from nltk.sentiment import SentimentIntensityAnalyzer
+
+    return SentimentIntensityAnalyzer()
+
+
+def synsets(word: str):
+    """`wordnet.synsets(word)`, downloading WordNet on first use."""
+    ensure_nltk("corpora/wordnet.zip")
+    from nltk.corpus import wordnet
+
+    return wordnet.synsets(word)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the compact English lexicon artifact.")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("path", nargs="?", default=LEXICON_PATH)
+    args = parser.parse_args(argv)
+    n = build(args.path)
+    print(f"Wrote {n} word(s) to {args.path}.")
+
+
+if __name__ == "__main__":
+    main()
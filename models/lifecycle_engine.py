@@ -1,8 +1,9 @@
 import sqlite3
 import pandas as pd
 import os
-import csv
 from datetime import datetime
+from data import archive
+from data.cache import VersionedLRUCache
 from data.no_api_scraper import search_global_feed
 
 # Anchor paths to the project root (not the current working directory),
@@ -11,8 +12,17 @@ _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DB_PATH = os.path.join(_PROJECT_ROOT, 'data', 'word_vault.db')
 CSV_PATH = os.path.join(_PROJECT_ROOT, 'data', 'slang_master_2026.csv')
 
+# Timeline curves are a pure function of a word's archive record, so they're
+# memoized per data version (see LifecycleEngine.data_version).
+_TIMELINE_CACHE = VersionedLRUCache(maxsize=256)
+
 class LifecycleEngine:
+    # Bumped on every write this process makes to slang_terms, so memoized
+    # timelines for a word that was just deep-searched are recomputed.
+    _writes = 0
+
     def __init__(self):
+        self._seeded_signature = None
         self._init_db()
         self._seed_from_csv()
 
@@ -33,20 +43,21 @@ class LifecycleEngine:
         conn.close()
 
     def _seed_from_csv(self):
-        if not os.path.exists(CSV_PATH):
+        seed = archive.load(CSV_PATH)
+        self._seeded_signature = seed.signature
+        rows = seed.rows
+        if not rows:
             return
 
         conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
         
         # Check if empty (simple check) - or just use INSERT OR IGNORE
-        with open(CSV_PATH, mode='r') as infile:
-            reader = csv.DictReader(infile)
-            for row in reader:
-                cursor.execute('''
-                    INSERT OR IGNORE INTO slang_terms (word, meaning, origin_era, category, status_2026)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (row['word'], row['meaning'], row['origin_era'], row['category'], row['2026_status']))
+        cursor.executemany('''
+            INSERT OR IGNORE INTO slang_terms (word, meaning, origin_era, category, status_2026)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [(row['word'], row['meaning'], row['origin_era'], row['category'], row['2026_status'])
+              for row in rows])
         
         conn.commit()
         conn.close()
@@ -59,6 +70,11 @@ class LifecycleEngine:
         """
         word_lower = word.lower() # DB storage logic? Let's store original case from CSV, but search case-insensitive?
         # Creating a case-insensitive search logic
+
+        # A long-lived engine (the app keeps one per process) picks up rows
+        # the auto-updater appended since it was created.
+        if archive.load(CSV_PATH).signature != self._seeded_signature:
+            self._seed_from_csv()
         
         conn = sqlite3.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
@@ -137,7 +153,8 @@ class LifecycleEngine:
         ''', (word, meaning, origin_era, category, status, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
         conn.commit()
         conn.close()
-        
+        LifecycleEngine._writes += 1
+
         return {
             'word': word,
             'meaning': meaning,
@@ -146,7 +163,28 @@ class LifecycleEngine:
             'category': category
         }
 
+    def data_version(self):
+        """
+        Fingerprint of what timelines are built from: the seed CSV's
+        mtime/size, this process's slang_terms writes, and the current year
+        (the curve always ends at the present).
+        """
+        return archive.load(CSV_PATH).signature, LifecycleEngine._writes, datetime.now().year
+
     def get_timeline_data(self, target_word):
+        """
+        Memoized `_build_timeline_data`: repeat requests for the same word
+        at the same data version skip the DB lookup and curve building.
+        """
+        key = (DB_PATH, target_word.strip().lower())
+        found, timeline = _TIMELINE_CACHE.get(key, self.data_version())
+        if not found:
+            timeline = self._build_timeline_data(target_word)
+            # Versioned after building, since a deep search may have written.
+            _TIMELINE_CACHE.set(key, self.data_version(), timeline)
+        return timeline
+
+    def _build_timeline_data(self, target_word):
         """
         Builds a deterministic "Cultural Wave" curve for this word, derived
         only from its own real archive fields (origin_era, status_2026) —
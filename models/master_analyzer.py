@@ -1,32 +1,16 @@
 import sqlite3
 import pandas as pd
-import nltk
-from nltk.corpus import words, wordnet
-from nltk.sentiment import SentimentIntensityAnalyzer
 import os
 import csv
 import datetime
 from data.no_api_scraper import fetch_reddit_data
+from models import lexicon
 
 # Configuration
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DB_PATH = os.path.join(_PROJECT_ROOT, 'data', 'word_vault.db')
 SLANG_CSV_PATH = os.path.join(_PROJECT_ROOT, 'data', 'slang_data.csv')
 
-# Ensure NLTK data (re-run just in case)
-try:
-    nltk.data.find('corpora/words')
-except LookupError:
-    nltk.download('words')
-try:
-    nltk.data.find('sentiment/vader_lexicon.zip')
-except LookupError:
-    nltk.download('vader_lexicon')
-try:
-    nltk.data.find('corpora/wordnet.zip')
-except LookupError:
-    nltk.download('wordnet')
-
 class WordVault:
     def __init__(self, db_path=DB_PATH):
         self.db_path = db_path
@@ -86,8 +70,8 @@ class WordVault:
 class MasterWordAnalyzer:
     def __init__(self):
         self.vault = WordVault()
-        self.english_vocab = set(words.words())
-        self.sia = SentimentIntensityAnalyzer()
+        self.english_vocab = lexicon.english_vocab()  # shared, memory-mapped
+        self.sia = lexicon.sentiment_analyzer()
         self.known_slang = self._load_slang_csv()
 
     def _load_slang_csv(self):
@@ -117,7 +101,7 @@ class MasterWordAnalyzer:
         }
 
         # 1. Baseline Layer (Standard English)
-        if word_lower in self.english_vocab or wordnet.synsets(word_lower):
+        if word_lower in self.english_vocab or lexicon.synsets(word_lower):
             result['classification'] = 'standard'
             result['slang_ratio'] = 0.0
             result['data_source'] = 'nltk_corpus'
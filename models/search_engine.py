@@ -4,8 +4,8 @@ import requests
 import json
 import time
 import os
-import csv
 from datetime import datetime
+from data import archive
 
 # Configuration
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -16,7 +16,6 @@ CUSTOM_USER_AGENT = 'SlangResearchBot/1.0'
 class SearchEngine:
     def __init__(self):
         self._init_db()
-        self.csv_data = self._load_csv()
 
     def _init_db(self):
         """Initialize the slang_vault.db"""
@@ -36,18 +35,8 @@ class SearchEngine:
         conn.close()
 
     def _load_csv(self):
-        """Load the static CSV into a dictionary for fast lookup."""
-        data = {}
-        if os.path.exists(CSV_PATH):
-            with open(CSV_PATH, mode='r') as infile:
-                reader = csv.DictReader(infile)
-                for row in reader:
-                    data[row['word'].lower()] = {
-                        'meaning': row['meaning'],
-                        'status': row['initial_status'],
-                        'source': '2026 Archive'
-                    }
-        return data
+        """The shared, indexed view of the static CSV (reloaded if it changes)."""
+        return archive.load(CSV_PATH)
 
     def _fetch_reddit_count(self, word, subreddit):
         """Fetch count of mentions from a subreddit using search.json."""
@@ -78,9 +67,14 @@ class SearchEngine:
         """
         word_lower = word.lower()
 
-        # LAYER 1: CSV Check
-        if word_lower in self.csv_data:
-            return self.csv_data[word_lower]
+        # LAYER 1: CSV Check (a later row for a duplicated word overrides earlier ones)
+        row = self._load_csv().get_last(word_lower)
+        if row is not None:
+            return {
+                'meaning': row['meaning'],
+                'status': row['initial_status'],
+                'source': '2026 Archive'
+            }
 
         # LAYER 2: Deep Search & LAYER 3: Classification
         # If not in CSV, we scrape to classify.
@@ -1,38 +1,35 @@
-import nltk
-from nltk.corpus import words, wordnet
-from nltk.sentiment import SentimentIntensityAnalyzer
-import ssl
-
-# Fix for NLTK download SSL/certificate issues on some machines
-try:
-    _create_unverified_https_context = ssl._create_unverified_context
-except AttributeError:
-    pass
-else:
-    ssl._create_default_https_context = _create_unverified_https_context
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from models import lexicon
 
-# Ensure necessary NLTK data is downloaded
-try:
-    nltk.data.find('corpora/words')
-except LookupError:
-    nltk.download('words')
+# The word list, WordNet and VADER are loaded on first use (see
+# models/lexicon.py), so importing this module stays cheap. ENGLISH_VOCAB and
+# sia remain available as module attributes for existing callers.
 
-try:
-    nltk.data.find('sentiment/vader_lexicon.zip')
-except LookupError:
-    nltk.download('vader_lexicon')
 
-try:
-    nltk.data.find('corpora/wordnet.zip')
-except LookupError:
-    nltk.download('wordnet')
+def __getattr__(name):
+    if name == "ENGLISH_VOCAB":
+        return lexicon.english_vocab()
+    if name == "sia":
+        return lexicon.sentiment_analyzer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Initialize resources
-ENGLISH_VOCAB = set(words.words())
-sia = SentimentIntensityAnalyzer()
 
 NICHE_SUBREDDITS = ['london', 'ukdrill']
 
+
+@lru_cache(maxsize=65536)
+def _in_dictionary(word_lower):
+    """Standard-English word list or WordNet membership, memoized per word."""
+    return word_lower in lexicon.english_vocab() or bool(lexicon.synsets(word_lower))
+
+
+def _compound(context):
+    """VADER compound score of `context` (-1 to 1)."""
+    return lexicon.sentiment_analyzer().polarity_scores(context)['compound']
+
+
 def is_slang(word, context, subreddit):
     """
     Determines if a word is slang based on corpus presence, sentiment intensity, and origin.
@@ -45,6 +42,59 @@ def is_slang(word, context, subreddit):
     Returns:
         dict: {'is_slang': bool, 'score': float, 'reasons': list}
     """
+    return _verdict(word, _compound(context) if context else None, subreddit)
+
+
+def _warm_up():
+    """Process-pool initializer: load the lexicon, VADER and WordNet once per worker."""
+    lexicon.english_vocab()
+    lexicon.sentiment_analyzer()
+    lexicon.synsets("slang")
+
+
+def is_slang_batch(candidates, workers=1):
+    """
+    `is_slang` for many (word, context, subreddit) candidates at once.
+
+    Candidates that share a context (e.g. every word pulled from one Reddit
+    post) share a single VADER pass, and dictionary lookups are memoized
+    per word. Returns one verdict per candidate, in order, identical to
+    calling `is_slang` on each.
+
+    With workers > 1 the candidates are grouped by context, split into
+    chunks and scored in a process pool; results are put back in input
+    order, so the output is the same as the serial path.
+    """
+    candidates = list(candidates)
+    if workers > 1 and len(candidates) > workers:
+        return _score_in_pool(candidates, workers)
+
+    compounds = {}
+    for _word, context, _subreddit in candidates:
+        if context and context not in compounds:
+            compounds[context] = _compound(context)
+    return [_verdict(word, compounds.get(context) if context else None, subreddit)
+            for word, context, subreddit in candidates]
+
+
+def _score_in_pool(candidates, workers):
+    # Stable sort by context keeps each post's words in one chunk (mostly),
+    # so the per-context VADER sharing survives the split.
+    order = sorted(range(len(candidates)), key=lambda i: candidates[i][1] or "")
+    size = -(-len(order) // (workers * 4))
+    chunks = [order[i:i + size] for i in range(0, len(order), size)]
+
+    results = [None] * len(candidates)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_up) as pool:
+        scored = pool.map(is_slang_batch, ([candidates[i] for i in chunk] for chunk in chunks))
+        for chunk, verdicts in zip(chunks, scored):
+            for i, verdict in zip(chunk, verdicts):
+                results[i] = verdict
+    return results
+
+
+def _verdict(word, compound, subreddit):
+    """Score one word given its context's compound sentiment (None without context)."""
     score = 0.1 # Base score
     reasons = []
     
@@ -52,7 +102,7 @@ def is_slang(word, context, subreddit):
     
     # 1. Corpus Check
     # If the word is NOT in standard English dictionary, likely slang or neologism.
-    if word_lower not in ENGLISH_VOCAB and not wordnet.synsets(word_lower):
+    if not _in_dictionary(word_lower):
         score += 0.4
         reasons.append("Not in standard dictionary")
     else:
@@ -62,12 +112,11 @@ def is_slang(word, context, subreddit):
 
     # 2. Intensity/Sentiment Check (VADER)
     # Slang often appears in high-intensity (emotional) contexts.
-    if context:
-        sentiment = sia.polarity_scores(context)
+    if compound is not None:
         # Compound score ranges -1 to 1. Check absolute intensity.
-        if abs(sentiment['compound']) > 0.5:
+        if abs(compound) > 0.5:
             score += 0.2
-            reasons.append(f"High sentiment intensity ({sentiment['compound']:.2f})")
+            reasons.append(f"High sentiment intensity ({compound:.2f})")
     
     # 3. Subreddit/Context Check
     if subreddit in NICHE_SUBREDDITS:
@@ -0,0 +1,303 @@
+"""
+Incremental trend statistics
+----------------------------
+Keeps the least-squares sufficient statistics of every word's daily
+niche/mainstream series in a `trend_stats` table, so growth rates and the
+cringe alert can be read in constant time instead of refitting the whole
+history on every call.
+
+Per word, with x = days since the word's first recorded day and the series
+densely zero-filled between its first and last day (exactly the series
+SlangAnalyzer.get_daily_series builds), the row holds:
+
+    n, Σx, Σx²                       shared by both series
+    Σy, Σxy    for niche and mainstream
+    the last day's niche/mainstream counts (for ratio/saturation)
+
+All values are integer counts, so they are stored as SQLite INTEGERs and
+never drift. Each new (word, day, niche, mainstream) count is folded in
+with O(1) arithmetic, including zero-filled gaps and days earlier than the
+current first day.
+
+Writers: data/auto_updater.collect_daily_mentions (history rows) and
+data/no_api_scraper.save_to_db (live mentions).
+
+The table lives in slang_data.db, which is gitignored, so every fresh
+checkout (each Action run, each Streamlit deploy) starts without it. The
+auto-updater therefore also exports the history-only statistics to
+data/trend_stats.json, committed alongside the history and stamped with
+the history version they reflect. A store whose table is missing or
+stale loads that snapshot when its version matches the history and no
+live mentions need folding in; otherwise the table is rebuilt from the
+history once, in one batched pass.
+"""
+
+import json
+import os
+import sqlite3
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from data import history_binary, history_store
+from models import trends
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DB_PATH = os.environ.get("SLANG_DB_PATH", os.path.join(_PROJECT_ROOT, "data", "slang_data.db"))
+
+SNAPSHOT_NAME = "trend_stats.json"
+
+_FIELDS = ["first_day", "last_day", "n", "sum_x", "sum_xx",
+           "sum_niche", "sum_x_niche", "sum_mainstream", "sum_x_mainstream",
+           "last_niche", "last_mainstream"]
+
+
+def _sum_range(a: int, b: int) -> Tuple[int, int]:
+    """(Σx, Σx²) for integer x in [a, b]; (0, 0) if the range is empty."""
+    if b < a:
+        return 0, 0
+
+    def sq(m: int) -> int:
+        return m * (m + 1) * (2 * m + 1) // 6 if m > 0 else 0
+
+    return (a + b) * (b - a + 1) // 2, sq(b) - sq(a - 1)
+
+
+def fold(stats: Optional[Dict[str, int]], day: int, niche: int, mainstream: int) -> Dict[str, int]:
+    """Return `stats` with one day's counts added (O(1), pure)."""
+    if stats is None:
+        return {"first_day": day, "last_day": day, "n": 1, "sum_x": 0, "sum_xx": 0,
+                "sum_niche": niche, "sum_x_niche": 0,
+                "sum_mainstream": mainstream, "sum_x_mainstream": 0,
+                "last_niche": niche, "last_mainstream": mainstream}
+
+    s = dict(stats)
+    if day < s["first_day"]:
+        # Re-base x so the new day is x = 0: every existing x grows by k.
+        k = s["first_day"] - day
+        s["sum_xx"] += 2 * k * s["sum_x"] + k * k * s["n"]
+        s["sum_x"] += k * s["n"]
+        s["sum_x_niche"] += k * s["sum_niche"]
+        s["sum_x_mainstream"] += k * s["sum_mainstream"]
+        # Zero-filled days 1..k-1 plus the new day itself at x = 0.
+        gx, gxx = _sum_range(1, k - 1)
+        s["n"] += k
+        s["sum_x"] += gx
+        s["sum_xx"] += gxx
+        s["first_day"] = day
+    elif day > s["last_day"]:
+        # Zero-filled gap plus the new day, at x = old span .. new span.
+        gx, gxx = _sum_range(s["last_day"] - s["first_day"] + 1, day - s["first_day"])
+        s["n"] += day - s["last_day"]
+        s["sum_x"] += gx
+        s["sum_xx"] += gxx
+        s["last_day"] = day
+        s["last_niche"] = s["last_mainstream"] = 0
+
+    x = day - s["first_day"]
+    s["sum_niche"] += niche
+    s["sum_x_niche"] += x * niche
+    s["sum_mainstream"] += mainstream
+    s["sum_x_mainstream"] += x * mainstream
+    if day == s["last_day"]:
+        s["last_niche"] += niche
+        s["last_mainstream"] += mainstream
+    return s
+
+
+def metrics_from_stats(stats: Dict[str, int]) -> Dict[str, float]:
+    """analyze_word-style metrics from one row of sufficient statistics."""
+    n, sx, sxx = stats["n"], stats["sum_x"], stats["sum_xx"]
+    m_growth = trends.growth_rate_from_sums(n, sx, sxx, stats["sum_mainstream"], stats["sum_x_mainstream"])
+    n_growth = trends.growth_rate_from_sums(n, sx, sxx, stats["sum_niche"], stats["sum_x_niche"])
+    last_m, last_n = stats["last_mainstream"], stats["last_niche"]
+    return {
+        "mainstream_growth": m_growth,
+        "niche_growth": n_growth,
+        "current_ratio": (last_m + 1) / (last_n + 1),
+        "saturation": last_m / (last_m + last_n + 1),
+    }
+
+
+class TrendStatsStore:
+    """The `trend_stats` table plus the history version it reflects."""
+
+    def __init__(self, db_path: str = DB_PATH, history_dir: Optional[str] = None) -> None:
+        self.db_path = db_path
+        self.history_dir = history_dir or os.path.join(os.path.dirname(db_path), "mentions_history")
+        self.snapshot_path = os.path.join(os.path.dirname(self.history_dir), SNAPSHOT_NAME)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        self._init_tables(conn)
+        return conn
+
+    @staticmethod
+    def _init_tables(conn: sqlite3.Connection) -> None:
+        columns = ", ".join(f"{f} INTEGER NOT NULL" for f in _FIELDS)
+        conn.execute(f"CREATE TABLE IF NOT EXISTS trend_stats (word TEXT PRIMARY KEY, {columns})")
+        conn.execute("CREATE TABLE IF NOT EXISTS trend_stats_meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def built_version(self, conn: Optional[sqlite3.Connection] = None) -> Optional[str]:
+        """History version the table was last built/updated for (None if never)."""
+        own = conn is None
+        conn = conn or self._connect()
+        try:
+            self._init_tables(conn)
+            row = conn.execute("SELECT value FROM trend_stats_meta WHERE key = 'history_version'").fetchone()
+            return row[0] if row else None
+        finally:
+            if own:
+                conn.close()
+
+    def get(self, word: str) -> Optional[Dict[str, int]]:
+        conn = self._connect()
+        try:
+            row = conn.execute(f"SELECT {', '.join(_FIELDS)} FROM trend_stats WHERE word = ?",
+                               (word.strip().lower(),)).fetchone()
+        finally:
+            conn.close()
+        return dict(zip(_FIELDS, row)) if row else None
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def add_counts(self, counts: Iterable[Tuple[str, str, int, int]],
+                   history_version: Optional[str] = None,
+                   conn: Optional[sqlite3.Connection] = None,
+                   only_if_built: bool = False) -> None:
+        """
+        Fold (word, YYYY-MM-DD, niche, mainstream) counts into the table.
+
+        `history_version` is recorded alongside (pass it after appending to
+        the history). With `only_if_built`, nothing happens unless the table
+        has been built before — callers that only add live mentions use this
+        so they don't create a partial table that looks complete.
+        """
+        own = conn is None
+        conn = conn or self._connect()
+        try:
+            self._init_tables(conn)
+            if only_if_built and self.built_version(conn) is None:
+                return
+            counts = list(counts)
+            if not counts:
+                return
+            days = history_binary.dates_to_days([c[1] for c in counts])
+            for (word, _date, niche, mainstream), day in zip(counts, days):
+                word = word.strip().lower()
+                row = conn.execute(f"SELECT {', '.join(_FIELDS)} FROM trend_stats WHERE word = ?",
+                                   (word,)).fetchone()
+                stats = fold(dict(zip(_FIELDS, row)) if row else None, int(day), int(niche), int(mainstream))
+                conn.execute(
+                    f"INSERT OR REPLACE INTO trend_stats (word, {', '.join(_FIELDS)}) "
+                    f"VALUES (?{', ?' * len(_FIELDS)})",
+                    (word, *(stats[f] for f in _FIELDS)),
+                )
+            if history_version is not None:
+                self._set_version(conn, history_version)
+            if own:
+                conn.commit()
+        finally:
+            if own:
+                conn.close()
+
+    @staticmethod
+    def _set_version(conn: sqlite3.Connection, version: str) -> None:
+        conn.execute("INSERT OR REPLACE INTO trend_stats_meta (key, value) VALUES ('history_version', ?)",
+                     (version,))
+
+    def rebuild(self, daily: pd.DataFrame, history_version: str) -> None:
+        """
+        Replace the table with statistics computed in one batched pass from
+        `daily` (columns: word, date, niche_count, mainstream_count; one
+        row per word per day).
+        """
+        rows = []
+        if not daily.empty:
+            codes, vocab = pd.factorize(daily["word"].str.lower(), sort=True)
+            day = history_binary.dates_to_days(daily["date"]).astype(np.int64)
+            first = np.full(len(vocab), np.iinfo(np.int64).max)
+            last = np.full(len(vocab), np.iinfo(np.int64).min)
+            np.minimum.at(first, codes, day)
+            np.maximum.at(last, codes, day)
+            n = last - first + 1
+            x = day - first[codes]
+            is_last = day == last[codes]
+
+            def per_word(values):
+                out = np.zeros(len(vocab), dtype=np.int64)
+                np.add.at(out, codes, values)
+                return out
+
+            niche = daily["niche_count"].to_numpy(dtype=np.int64)
+            mainstream = daily["mainstream_count"].to_numpy(dtype=np.int64)
+            columns = {
+                "first_day": first, "last_day": last, "n": n,
+                "sum_x": n * (n - 1) // 2, "sum_xx": (n - 1) * n * (2 * n - 1) // 6,
+                "sum_niche": per_word(niche), "sum_x_niche": per_word(x * niche),
+                "sum_mainstream": per_word(mainstream), "sum_x_mainstream": per_word(x * mainstream),
+                "last_niche": per_word(niche * is_last), "last_mainstream": per_word(mainstream * is_last),
+            }
+            rows = [(w, *(int(columns[f][i]) for f in _FIELDS)) for i, w in enumerate(vocab)]
+
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM trend_stats")
+            conn.executemany(
+                f"INSERT INTO trend_stats (word, {', '.join(_FIELDS)}) VALUES (?{', ?' * len(_FIELDS)})",
+                rows,
+            )
+            self._set_version(conn, history_version)
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Committed snapshot
+    # ------------------------------------------------------------------
+    def export_snapshot(self) -> None:
+        """Write the table and its history version to `snapshot_path`."""
+        conn = self._connect()
+        try:
+            version = self.built_version(conn)
+            rows = conn.execute(f"SELECT word, {', '.join(_FIELDS)} FROM trend_stats ORDER BY word").fetchall()
+        finally:
+            conn.close()
+        if version is None:
+            return
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"history_version": version, "fields": _FIELDS,
+                       "rows": [list(r) for r in rows]}, f, separators=(",", ":"))
+            f.write("\n")
+        os.replace(tmp_path, self.snapshot_path)
+
+    def load_snapshot(self, history_version: str) -> bool:
+        """
+        Replace the table with the committed snapshot if it was exported
+        for `history_version`. False (table untouched) otherwise.
+        """
+        try:
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if snapshot.get("history_version") != history_version or snapshot.get("fields") != _FIELDS:
+            return False
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM trend_stats")
+            conn.executemany(
+                f"INSERT INTO trend_stats (word, {', '.join(_FIELDS)}) VALUES (?{', ?' * len(_FIELDS)})",
+                [tuple(r) for r in snapshot["rows"]],
+            )
+            self._set_version(conn, history_version)
+            conn.commit()
+        finally:
+            conn.close()
+        return True
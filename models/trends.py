@@ -0,0 +1,174 @@
+"""
+Trend kernels
+-------------
+Vectorized NumPy building blocks for the mention-history analysis in
+models/analyzer.py. Everything here works on plain arrays, so the same code
+serves a single word's series and a (words x days) matrix of the whole
+archive.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+def linear_growth_rate(y) -> float:
+    """
+    Relative change implied by a least-squares line through `y` (indexed
+    0..n-1): (fitted_end - fitted_start) / fitted_start, or 0.0 when there
+    are fewer than two points or the fitted start isn't positive.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = y.size
+    if n < 2:
+        return 0.0
+
+    x_centered = np.arange(n, dtype=np.float64) - (n - 1) / 2.0
+    mean_y = y.mean()
+    slope = np.dot(x_centered, y - mean_y) / np.dot(x_centered, x_centered)
+    start_value = mean_y - slope * (n - 1) / 2.0
+    if start_value <= 0:
+        return 0.0
+    return float(slope * (n - 1) / start_value)
+
+
+def growth_rates(matrix, lengths: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    `linear_growth_rate` for every row of a 2-D array in one pass.
+
+    Args:
+        matrix: (words x days) array of counts.
+        lengths: optional per-row number of valid leading values, for rows
+            shorter than the matrix width (values past a row's length are
+            ignored). Defaults to the full width for every row.
+
+    Returns:
+        float64 array with one growth rate per row.
+    """
+    y = np.asarray(matrix, dtype=np.float64)
+    if y.ndim != 2:
+        raise ValueError("growth_rates expects a 2-D (words x days) array")
+    n_rows, width = y.shape
+    n = np.full(n_rows, width, dtype=np.float64) if lengths is None else np.asarray(lengths, dtype=np.float64)
+
+    x = np.arange(width, dtype=np.float64)
+    valid = x[None, :] < n[:, None]
+    safe_n = np.maximum(n, 1.0)
+    mean_x = (n - 1) / 2.0
+
+    y = np.where(valid, y, 0.0)
+    mean_y = y.sum(axis=1) / safe_n
+    x_centered = np.where(valid, x[None, :] - mean_x[:, None], 0.0)
+    y_centered = np.where(valid, y - mean_y[:, None], 0.0)
+
+    denom = np.einsum("ij,ij->i", x_centered, x_centered)
+    numer = np.einsum("ij,ij->i", x_centered, y_centered)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(denom > 0, numer / denom, 0.0)
+        start_value = mean_y - slope * mean_x
+        rates = np.where((n >= 2) & (start_value > 0), slope * (n - 1) / start_value, 0.0)
+    return rates
+
+
+def growth_rate_from_sums(n: int, sum_x: int, sum_xx: int, sum_y: int, sum_xy: int) -> float:
+    """
+    `linear_growth_rate` from running sums over x = 0..n-1 (see
+    models/trend_stats.py), in O(1). With integer sums the slope's
+    numerator and denominator are exact.
+    """
+    if n < 2:
+        return 0.0
+    denom = n * sum_xx - sum_x * sum_x
+    if denom == 0:
+        return 0.0
+    slope = (n * sum_xy - sum_x * sum_y) / denom
+    start_value = sum_y / n - slope * sum_x / n
+    if start_value <= 0:
+        return 0.0
+    return float(slope * (n - 1) / start_value)
+
+
+# ----------------------------------------------------------------------
+# Windowed trends. All of these work along the last axis, so they accept a
+# single series or a (words x days) matrix, and cost O(n) via cumulative
+# sums regardless of the window size. Positions without a full window are
+# NaN.
+# ----------------------------------------------------------------------
+def _padded_cumsum(y: np.ndarray) -> np.ndarray:
+    """Cumulative sum along the last axis with a leading zero."""
+    out = np.zeros(y.shape[:-1] + (y.shape[-1] + 1,))
+    np.cumsum(y, axis=-1, out=out[..., 1:])
+    return out
+
+
+def rolling_slopes(y, window: int) -> np.ndarray:
+    """Least-squares slope of each trailing `window`-day block."""
+    if window < 2:
+        raise ValueError("window must be at least 2")
+    y = np.asarray(y, dtype=np.float64)
+    n = y.shape[-1]
+    out = np.full(y.shape, np.nan)
+    if n < window:
+        return out
+
+    idx = np.arange(n, dtype=np.float64)
+    c_y = _padded_cumsum(y)
+    c_xy = _padded_cumsum(y * idx)
+    end = np.arange(window, n + 1)   # exclusive block ends
+    start = end - window
+    sum_y = c_y[..., end] - c_y[..., start]
+    # Σ (j - start) * y_j over the block, i.e. x re-based to 0..window-1.
+    sum_xy = c_xy[..., end] - c_xy[..., start] - start * sum_y
+
+    w = float(window)
+    sum_x = w * (w - 1) / 2
+    sum_xx = (w - 1) * w * (2 * w - 1) / 6
+    out[..., window - 1:] = (w * sum_xy - sum_x * sum_y) / (w * sum_xx - sum_x * sum_x)
+    return out
+
+
+def rolling_growth_rates(y, window: int) -> np.ndarray:
+    """`linear_growth_rate` of each trailing `window`-day block."""
+    y = np.asarray(y, dtype=np.float64)
+    slope = rolling_slopes(y, window)
+    means = rolling_means(y, window)
+    start_value = means - slope * (window - 1) / 2.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rates = np.where(start_value > 0, slope * (window - 1) / start_value, 0.0)
+    return np.where(np.isnan(slope), np.nan, rates)
+
+
+def rolling_means(y, window: int) -> np.ndarray:
+    """Mean of each trailing `window`-day block."""
+    y = np.asarray(y, dtype=np.float64)
+    out = np.full(y.shape, np.nan)
+    if y.shape[-1] < window:
+        return out
+    c_y = _padded_cumsum(y)
+    out[..., window - 1:] = (c_y[..., window:] - c_y[..., :-window]) / window
+    return out
+
+
+def momentum(y, window: int) -> np.ndarray:
+    """Mean of the trailing `window` days minus the mean of the `window` before."""
+    means = rolling_means(y, window)
+    out = np.full(means.shape, np.nan)
+    out[..., window:] = means[..., window:] - means[..., :-window]
+    return out
+
+
+def ewma(y, alpha: float) -> np.ndarray:
+    """
+    Exponentially weighted moving average (level_t = a*y_t + (1-a)*level_{t-1},
+    seeded with the first value). One pass over time, vectorized across rows.
+    """
+    if not 0 < alpha <= 1:
+        raise ValueError("alpha must be in (0, 1]")
+    y = np.asarray(y, dtype=np.float64)
+    out = np.empty_like(y)
+    if y.shape[-1] == 0:
+        return out
+    out[..., 0] = y[..., 0]
+    for t in range(1, y.shape[-1]):
+        out[..., t] = alpha * y[..., t] + (1 - alpha) * out[..., t - 1]
+    return out
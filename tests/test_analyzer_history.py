@@ -0,0 +1,178 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data import history_store
+from models import forecast
+from models import analyzer as analyzer_module
+from models.analyzer import SlangAnalyzer
+
+
+class TestAnalyzerHistory(unittest.TestCase):
+    """Mention-history analysis against a throwaway data directory."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tmp.name, "slang_data.db")
+        rng = np.random.default_rng(3)
+        rows = []
+        for day in range(1, 29):
+            for word in ("rizz", "aura", "peng"):
+                if word == "peng" and day % 3:
+                    continue  # sparse word: gaps get zero-filled
+                rows.append({
+                    "date": f"2026-07-{day:02d}", "word": word,
+                    "niche_count": int(rng.poisson(5)),
+                    "mainstream_count": int(rng.poisson(day if word == "rizz" else 2)),
+                })
+        history_store.append_rows(rows, os.path.join(self.tmp.name, "mentions_history"))
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE mentions (id TEXT PRIMARY KEY, keyword TEXT, subreddit TEXT, "
+                     "content TEXT, timestamp REAL, is_mainstream BOOLEAN)")
+        # 2026-07-28 and 2026-08-02 (UTC) live mentions; 'skibidi' is live-only
+        # and has no niche mentions at all.
+        conn.executemany("INSERT INTO mentions VALUES (?, ?, 'london', '', ?, ?)",
+                         [("a", "aura", 1785240000, 0), ("b", "aura", 1785240000, 1),
+                          ("c", "aura", 1785672000, 1), ("d", "skibidi", 1785672000, 1)])
+        conn.commit()
+        conn.close()
+        self.analyzer = SlangAnalyzer(db_path=db_path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_analyze_many_matches_analyze_word(self):
+        batch = self.analyzer.analyze_many().set_index("word")
+        self.assertEqual(sorted(batch.index), ["aura", "peng", "rizz", "skibidi"])
+        for word in batch.index:
+            single = self.analyzer.analyze_word(word)
+            for key, value in single["metrics"].items():
+                self.assertAlmostEqual(batch.loc[word, key], value, places=10, msg=f"{word}.{key}")
+            self.assertEqual(batch.loc[word, "cringe_alert"], single["cringe_alert"])
+            self.assertEqual(batch.loc[word, "days"], len(single["historical"]))
+
+    def test_analyze_many_end_date(self):
+        batch = self.analyzer.analyze_many(["AURA"], end="2026-07-10")
+        self.assertEqual(batch["word"].tolist(), ["aura"])
+        self.assertEqual(batch["last_date"].tolist(), ["2026-07-10"])
+
+    def test_daily_series_matches_pivot_path(self):
+        """Regression: the array fast path must equal the original pivot, process_data(get_data())."""
+        for word in ("rizz", "aura", "peng", "skibidi", "unknown"):
+            for start, end in ((None, None), ("2026-07-05", "2026-07-20"), ("2026-07-27", None)):
+                expected = self.analyzer.process_data(self.analyzer.get_data(word, start, end))
+                actual = self.analyzer.get_daily_series(word, start, end)
+                pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+
+    def test_live_counts_filtered_in_sql(self):
+        live = self.analyzer._load_live_counts(["AURA"], start="2026-07-29")
+        self.assertEqual(live[["date", "word", "niche_count", "mainstream_count"]].values.tolist(),
+                         [["2026-08-02", "aura", 0, 1]])
+
+        original = analyzer_module.LIVE_QUERY_CHUNK
+        analyzer_module.LIVE_QUERY_CHUNK = 1
+        try:
+            live = self.analyzer._load_live_counts(["aura", "skibidi", "unknown"])
+        finally:
+            analyzer_module.LIVE_QUERY_CHUNK = original
+        self.assertEqual(sorted(set(live["word"])), ["aura", "skibidi"])
+        self.assertEqual(int(live["mainstream_count"].sum()), 3)
+
+    def test_process_data_missing_type_stays_int(self):
+        raw = pd.DataFrame({"date": ["2026-07-01", "2026-07-03"], "subreddit_type": ["niche", "niche"],
+                            "count": [2, 4]})
+        df = self.analyzer.process_data(raw)
+        self.assertEqual(list(df.columns), ["date", "niche", "mainstream", "total", "ratio", "saturation"])
+        self.assertEqual(df["mainstream"].dtype, np.int64)
+        self.assertEqual(df["niche"].tolist(), [2.0, 0.0, 4.0])
+
+    def test_trend_snapshot_matches_analyze_word(self):
+        for word in ("rizz", "aura", "peng", "skibidi"):
+            snapshot = self.analyzer.trend_snapshot(word)
+            full = self.analyzer.analyze_word(word)
+            for key, value in full["metrics"].items():
+                self.assertAlmostEqual(snapshot["metrics"][key], value, places=9, msg=f"{word}.{key}")
+            self.assertEqual(snapshot["cringe_alert"], full["cringe_alert"])
+        self.assertIsNone(self.analyzer.trend_snapshot("unknown"))
+
+    def test_incremental_updates_match_rebuild(self):
+        store = self.analyzer.sync_trend_stats()
+        history_dir = os.path.join(self.tmp.name, "mentions_history")
+        rows = [
+            {"date": "2026-08-10", "word": "rizz", "niche_count": 3, "mainstream_count": 40},  # after a gap
+            {"date": "2026-06-20", "word": "peng", "niche_count": 7, "mainstream_count": 1},   # before first day
+            {"date": "2026-07-15", "word": "aura", "niche_count": 2, "mainstream_count": 2},   # existing day
+            {"date": "2026-08-01", "word": "new", "niche_count": 1, "mainstream_count": 0},
+        ]
+        history_store.append_rows(rows, history_dir)
+        store.add_counts([(r["word"], r["date"], r["niche_count"], r["mainstream_count"]) for r in rows],
+                         history_version=history_store.history_version(history_dir))
+        incremental = {w: store.get(w) for w in ("rizz", "peng", "aura", "new", "skibidi")}
+
+        store.rebuild(self.analyzer._load_daily_counts(), "rebuilt")
+        for word, stats in incremental.items():
+            self.assertEqual(stats, store.get(word), msg=word)
+
+    def test_fresh_checkout_loads_committed_trend_stats(self):
+        built = SlangAnalyzer(db_path=os.path.join(self.tmp.name, "ci.db")).sync_trend_stats()
+        built.export_snapshot()
+
+        fresh = SlangAnalyzer(db_path=os.path.join(self.tmp.name, "deploy.db"))
+        fresh._load_daily_counts = lambda *args, **kwargs: self.fail("rebuilt instead of loading the snapshot")
+        store = fresh.sync_trend_stats()
+        for word in ("rizz", "aura", "peng"):
+            self.assertEqual(store.get(word), built.get(word))
+
+        # A snapshot from another history version is ignored.
+        history_store.append_rows([{"date": "2026-07-29", "word": "rizz", "niche_count": 1,
+                                    "mainstream_count": 1}], os.path.join(self.tmp.name, "mentions_history"))
+        version = history_store.history_version(store.history_dir)
+        self.assertFalse(store.load_snapshot(version))
+
+    def test_forecast_is_cached_per_history_version(self):
+        cache_dir = os.path.join(self.tmp.name, "cache")
+        first = forecast.forecast_crossings(self.analyzer, horizon=30, cache_dir=cache_dir)
+        self.assertEqual(sorted(first["word"]), ["aura", "peng", "rizz"])  # history only, no live-only words
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+        forecast._memo.clear()
+        pd.testing.assert_frame_equal(forecast.forecast_crossings(self.analyzer, horizon=30, cache_dir=cache_dir),
+                                      first, check_dtype=False)
+
+        history_store.append_rows([{"date": "2026-07-29", "word": "rizz", "niche_count": 1,
+                                    "mainstream_count": 1}], os.path.join(self.tmp.name, "mentions_history"))
+        forecast.forecast_crossings(self.analyzer, horizon=30, cache_dir=cache_dir)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)     # the old version's file is gone
+        self.assertEqual(forecast._memo.stats()["size"], 1)
+
+        # Another history directory with the same (empty) version doesn't share files.
+        empty_a = SlangAnalyzer(db_path=os.path.join(self.tmp.name, "a", "slang_data.db"))
+        empty_b = SlangAnalyzer(db_path=os.path.join(self.tmp.name, "b", "slang_data.db"))
+        forecast.forecast_crossings(empty_a, horizon=30, cache_dir=cache_dir)
+        forecast.forecast_crossings(empty_b, horizon=30, cache_dir=cache_dir)
+        self.assertEqual(len(os.listdir(cache_dir)), 3)
+
+    def test_analyze_word_is_memoized_per_data_version(self):
+        self.analyzer.analyze_word("rizz")
+        before = SlangAnalyzer.cache_stats()
+        first = self.analyzer.analyze_word("rizz")
+        after = SlangAnalyzer.cache_stats()
+        self.assertEqual(after["hits"], before["hits"] + 1)
+
+        history_store.append_rows([{"date": "2026-07-29", "word": "rizz", "niche_count": 0,
+                                    "mainstream_count": 50}], os.path.join(self.tmp.name, "mentions_history"))
+        second = self.analyzer.analyze_word("rizz")
+        self.assertEqual(SlangAnalyzer.cache_stats()["misses"], after["misses"] + 1)
+        self.assertEqual(len(second["historical"]), len(first["historical"]) + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data import archive
+
+
+class TestArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "slang.csv")
+        self._write("word,meaning,category\n"
+                    "Rizz,Charisma,Gen Z/Alpha\n"
+                    "rizzler,Someone with rizz,Gen Z/Alpha\n"
+                    "peng,Attractive,UK\n"
+                    "RIZZ,Duplicate,UK\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, text):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_lookup_and_indexes(self):
+        a = archive.load(self.path)
+        self.assertEqual(len(a), 3)
+        self.assertEqual(a.get("  rizz ")["meaning"], "Charisma")   # first row wins
+        self.assertEqual(a.get_last("rizz")["meaning"], "Duplicate")
+        self.assertEqual(a.get_last("peng")["meaning"], "Attractive")
+        self.assertIn("PENG", a)
+        self.assertIsNone(a.get("skibidi"))
+        self.assertEqual(a.with_prefix("riz"), ["rizz", "rizzler"])
+        self.assertEqual(a.with_prefix("x"), [])
+        self.assertEqual(a.in_category("gen z/alpha"), ["rizz", "rizzler"])
+        self.assertEqual(len(a.rows), 4)
+        self.assertEqual(list(a.frame().columns), ["word", "meaning", "category"])
+
+    def test_shared_until_file_changes(self):
+        first = archive.load(self.path)
+        self.assertIs(archive.load(self.path), first)
+
+        time.sleep(0.01)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("skibidi,Nonsense,Gen Z/Alpha\n")
+        reloaded = archive.load(self.path)
+        self.assertIsNot(reloaded, first)
+        self.assertIn("skibidi", reloaded)
+
+    def test_missing_file_is_empty(self):
+        a = archive.load(os.path.join(self.tmp.name, "missing.csv"))
+        self.assertEqual(len(a), 0)
+        self.assertEqual(a.rows, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models import change_detector
+
+
+class TestChangeDetector(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = {
+            "state_path": os.path.join(self.tmp.name, "state.csv"),
+            "alerts_path": os.path.join(self.tmp.name, "alerts.csv"),
+        }
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _day(self, day, word, niche, mainstream):
+        return {"date": f"2026-07-{day:02d}", "word": word, "niche_count": niche, "mainstream_count": mainstream}
+
+    def test_sustained_mainstream_jump_alerts_once(self):
+        rows = [self._day(d, "rizz", 10, 2) for d in range(1, 15)]
+        rows += [self._day(d, "rizz", 2, 20) for d in range(15, 18)]
+        rows += [self._day(d, "peng", 10, 2) for d in range(1, 18)]
+        raised = change_detector.update(rows, **self.paths)
+        self.assertEqual([(a["word"], a["date"]) for a in raised], [("rizz", "2026-07-15")])
+
+        alerts = change_detector.load_alerts(self.paths["alerts_path"])
+        self.assertEqual(set(alerts), {"rizz"})
+
+    def test_replaying_processed_days_is_a_no_op(self):
+        rows = [self._day(d, "rizz", 10, 2) for d in range(1, 10)]
+        change_detector.update(rows, **self.paths)
+        before = change_detector.load_state(self.paths["state_path"])
+        change_detector.update(rows, **self.paths)
+        self.assertEqual(before, change_detector.load_state(self.paths["state_path"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import sys
+import unittest
+from collections import Counter
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data.auto_updater import extract_candidate_words
+from data.discovery import CONTEXT_CHARS, CandidateCounter, SpaceSaving
+
+
+class TestSpaceSaving(unittest.TestCase):
+    def test_heavy_hitters_survive_bounded_memory(self):
+        summary = SpaceSaving(capacity=10)
+        stream = []
+        for i in range(2000):
+            stream.append("rizz" if i % 5 == 0 else f"noise{i}")
+            if i % 7 == 0:
+                stream.append("aura")
+        for term in stream:
+            summary.add(term, False, "", "london")
+            self.assertLessEqual(len(summary), 10)
+            self.assertLessEqual(len(summary._heap), 40)
+
+        truth = Counter(stream)
+        for term in ("rizz", "aura"):
+            count, error, niche, _m, _c, _s = summary.items[term]
+            self.assertGreaterEqual(count, truth[term])
+            self.assertLessEqual(count - error, truth[term])
+            self.assertLessEqual(niche, truth[term])
+
+
+class TestCandidateCounter(unittest.TestCase):
+    def test_unigram_counts_match_exact_extraction_under_capacity(self):
+        posts = ["This rizz is unreal, no cap", "Peak rizz energy today", "mid vibes honestly"]
+        counter = CandidateCounter()
+        for text in posts:
+            counter.add_post(text, "london", False)
+        stats = counter.stats()
+        exact = Counter(w for text in posts for w in extract_candidate_words(text))
+        for word, n in exact.items():
+            self.assertEqual(stats[word]["niche_count"], n)
+
+    def test_cohesive_bigrams_only(self):
+        counter = CandidateCounter()
+        for i in range(6):
+            counter.add_post(f"caught him aura farming again {i}", "london", False)
+            counter.add_post("that 404 coded fit", "AskReddit", True)
+        for i in range(10):
+            counter.add_post(f"my best mate {i}", "london", False)
+        counter.add_post("my best friend", "london", False)
+        counter.add_post("best friend forever", "london", False)
+
+        stats = counter.stats()
+        self.assertEqual(stats["aura farming"]["niche_count"], 6)
+        self.assertEqual(stats["404 coded"]["mainstream_count"], 6)
+        self.assertNotIn("best friend", stats)     # "best" mostly appears without "friend"
+
+    def test_sample_context_is_short_block(self):
+        long_post = "filler " * 100 + "skibidi toilet"
+        counter = CandidateCounter()
+        counter.add_post(long_post, "memes", True)
+        context = counter.stats()["skibidi"]["sample_context"]
+        self.assertLessEqual(len(context), CONTEXT_CHARS)
+        self.assertIn("skibidi", context)
+
+    def test_sample_context_spans_block_boundary(self):
+        post = "x" * (CONTEXT_CHARS - 10) + " aura farming " + "filler " * 100
+        counter = CandidateCounter()
+        counter.add_post(post, "london", False)
+        counter.add_post("aura farming again", "london", False)
+        stats = counter.stats()
+        for term in ("aura", "aura farming"):
+            context = stats[term]["sample_context"]
+            self.assertLessEqual(len(context), CONTEXT_CHARS)
+            self.assertIn("aura farming", context)
+
+
+if __name__ == '__main__':
+    unittest.main()
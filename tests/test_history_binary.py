@@ -0,0 +1,60 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data import history_binary
+from data.history_binary import BinaryHistory, binary_to_csv, csv_to_binary
+
+
+class TestHistoryBinary(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmp.name, "mentions_history.csv")
+        self.bin_path = os.path.join(self.tmp.name, "mentions_history.bin")
+        self.df = pd.DataFrame({
+            "date": ["2026-06-22", "2026-06-22", "2026-06-23", "2026-06-23", "2026-06-24"],
+            "word": ["rizz", "aura", "aura", "rizz", "rizz"],
+            "niche_count": [5, 1, 2, 6, 7],
+            "mainstream_count": [0, 3, 4, 1, 2],
+        })
+        self.df.to_csv(self.csv_path, index=False)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_series_is_sorted_slice(self):
+        csv_to_binary(self.csv_path, self.bin_path)
+        with BinaryHistory(self.bin_path) as history:
+            self.assertEqual(history.words, ["aura", "rizz"])
+            rizz = history.series("RIZZ")
+            self.assertEqual(rizz["niche"].tolist(), [5, 6, 7])
+            self.assertEqual(rizz["mainstream"].tolist(), [0, 1, 2])
+            self.assertEqual(len(history.series("unknown")), 0)
+
+    def test_round_trip(self):
+        csv_to_binary(self.csv_path, self.bin_path)
+        out_path = os.path.join(self.tmp.name, "out.csv")
+        binary_to_csv(self.bin_path, out_path)
+        expected = self.df.sort_values(["date", "word"]).reset_index(drop=True)
+        pd.testing.assert_frame_equal(pd.read_csv(out_path), expected)
+
+    def test_shared_reopens_on_rewrite(self):
+        csv_to_binary(self.csv_path, self.bin_path)
+        first = history_binary.shared(self.bin_path)
+        self.assertIs(history_binary.shared(self.bin_path), first)
+
+        self.df.loc[len(self.df)] = ["2026-06-25", "rizz", 8, 3]
+        self.df.to_csv(self.csv_path, index=False)
+        csv_to_binary(self.csv_path, self.bin_path)
+        second = history_binary.shared(self.bin_path)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.series("rizz")["niche"].tolist(), [5, 6, 7, 8])
+
+
+if __name__ == '__main__':
+    unittest.main()
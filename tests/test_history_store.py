@@ -0,0 +1,48 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data import history_store
+
+
+def _row(date, word, niche=1, mainstream=0):
+    return {"date": date, "word": word, "niche_count": niche, "mainstream_count": mainstream}
+
+
+class TestHistoryStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.history_dir = os.path.join(self.tmp.name, "mentions_history")
+        history_store.append_rows([
+            _row("2026-06-29", "rizz"), _row("2026-06-30", "aura"),
+            _row("2026-07-01", "rizz", 4, 2), _row("2026-08-02", "rizz", 9, 9),
+        ], self.history_dir)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_rows_go_to_month_shards(self):
+        manifest = history_store.load_manifest(self.history_dir)
+        self.assertEqual(sorted(manifest), ["2026-06", "2026-07", "2026-08"])
+        self.assertEqual(manifest["2026-06"]["start"], "2026-06-29")
+        self.assertEqual(manifest["2026-06"]["rows"], 2)
+
+    def test_range_only_opens_overlapping_shards(self):
+        paths = history_store.shards_for_range("2026-07-01", "2026-07-31", self.history_dir)
+        self.assertEqual([os.path.basename(p) for p in paths], ["2026-07.csv"])
+
+        df = history_store.read_history("2026-06-30", "2026-07-15", ["RIZZ"], self.history_dir)
+        self.assertEqual(df["date"].tolist(), ["2026-07-01"])
+
+    def test_version_changes_on_append(self):
+        before = history_store.history_version(self.history_dir)
+        history_store.append_rows([_row("2026-08-03", "rizz")], self.history_dir)
+        self.assertNotEqual(before, history_store.history_version(self.history_dir))
+        self.assertEqual(history_store.words_recorded_on("2026-08-03", self.history_dir), {"rizz"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data.job_queue import JobQueue, work
+from tests.test_update_pipeline import fake_fetch, fake_score
+
+DAY = "2099-01-01"
+
+
+class TestJobQueue(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.queue = JobQueue(os.path.join(self.tmp.name, "queue.db"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def plan(self, queue=None):
+        return (queue or self.queue).plan(DAY, ["zzmention1", "zzmention2", "zzmention3"],
+                                          ["yeet", "ghost"], ["slang", "trend"], shard_size=2)
+
+    def test_plan_is_idempotent(self):
+        self.assertEqual(self.plan(), 2)
+        self.assertEqual(self.plan(), 2)
+        self.assertEqual(self.queue.status(DAY), {"pending": 2})
+
+    def test_expired_lease_is_reclaimed_and_stale_worker_cannot_commit(self):
+        self.plan()
+        first = self.queue.claim(DAY, "a", lease_seconds=10, now=100.0)
+        self.assertEqual(first["shard"], 0)
+        self.assertEqual(first["spec"]["seeds"], ["slang", "trend"])
+        self.assertEqual(self.queue.claim(DAY, "b", lease_seconds=10, now=105.0)["shard"], 1)
+        self.assertIsNone(self.queue.claim(DAY, "c", lease_seconds=10, now=105.0))
+
+        # Worker "a" stalls past its lease; "c" takes shard 0 over.
+        self.assertEqual(self.queue.claim(DAY, "c", lease_seconds=10, now=111.0)["shard"], 0)
+        self.assertFalse(self.queue.renew(DAY, 0, "a"))
+        self.assertFalse(self.queue.complete(DAY, 0, "a", [{"word": "stale"}], []))
+        self.assertTrue(self.queue.complete(DAY, 0, "c", [{"word": "fresh"}], []))
+        self.assertIsNone(self.queue.results(DAY))     # shard 1 still out
+        self.assertTrue(self.queue.complete(DAY, 1, "b", [], []))
+        self.assertEqual(self.queue.results(DAY)[0], [{"word": "fresh"}])
+
+    def test_results_do_not_depend_on_which_worker_ran_which_shard(self):
+        kwargs = dict(fetch=fake_fetch, score=fake_score, define=lambda word, timeout=None: None, fetch_workers=2)
+        self.plan()
+        self.assertEqual(work(self.queue, DAY, "solo", **kwargs), 2)
+        solo = self.queue.results(DAY)
+
+        other = JobQueue(os.path.join(self.tmp.name, "other.db"))
+        self.plan(other)
+        shard = other.claim(DAY, "second")          # "second" holds shard 0...
+        self.assertEqual(work(other, DAY, "first", **kwargs), 1)   # ...so "first" runs shard 1
+        other.renew(DAY, shard["shard"], "second", lease_seconds=-1)
+        self.assertEqual(work(other, DAY, "third", **kwargs), 1)   # expired: "third" runs shard 0
+        self.assertEqual(other.results(DAY), solo)
+
+        entries, rows, pending = solo
+        self.assertEqual(entries[0]["word"], "yeet")     # pending words first, then discoveries
+        words = [r["word"] for r in rows]
+        self.assertEqual(words, sorted(set(words)))
+        self.assertTrue({"yeet", "zzmention1", "zzmention2", "zzmention3"} <= set(words))
+        self.assertEqual(pending, ["yeet", "ghost"])
+
+
+if __name__ == '__main__':
+    unittest.main()
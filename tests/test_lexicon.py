@@ -0,0 +1,45 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models import lexicon
+
+
+class TestLexicon(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "lexicon.bin")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_membership_matches_set(self):
+        words = ["apple", "London", "friend", "cooked", "café", "a", "zebra", "apple"]
+        self.assertEqual(lexicon.write_lexicon(words, self.path), 7)
+        lex = lexicon.Lexicon(self.path)
+        self.assertEqual(len(lex), 7)
+        for word in set(words) | {"london", "rizz", "", "apples", "zzz", "Café"}:
+            self.assertEqual(word in lex, word in set(words), word)
+
+    def test_empty_lexicon(self):
+        lexicon.write_lexicon([], self.path)
+        self.assertNotIn("apple", lexicon.Lexicon(self.path))
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            lexicon.Lexicon(self.path)
+
+    def test_english_vocab_prefers_artifact(self):
+        lexicon.write_lexicon(["rizz"], self.path)
+        vocab = lexicon.english_vocab(self.path)
+        self.assertIsInstance(vocab, lexicon.Lexicon)
+        self.assertIs(lexicon.english_vocab(self.path), vocab)   # one shared instance
+
+
+if __name__ == '__main__':
+    unittest.main()
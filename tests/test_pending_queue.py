@@ -0,0 +1,85 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data.pending_queue import PendingQueue
+
+
+class TestPendingQueue(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.legacy = os.path.join(self.tmp.name, "pending_words.txt")
+        self.queue = PendingQueue(os.path.join(self.tmp.name, "pending.db"), legacy_path=self.legacy)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_enqueue_is_idempotent_and_counts_hits(self):
+        for word in ["Rizz", "rizz ", "aura", "rizz", ""]:
+            self.queue.enqueue(word)
+        self.assertEqual(self.queue.peek(), ["rizz", "aura"])
+        self.assertEqual(self.queue.hits("rizz"), 3)
+
+    def test_concurrent_enqueues_lose_nothing(self):
+        threads = [threading.Thread(target=lambda i=i: [self.queue.enqueue(f"w{i % 5}") for _ in range(10)])
+                   for i in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(sorted(self.queue.peek()), [f"w{i}" for i in range(5)])
+        self.assertEqual(sum(self.queue.hits(f"w{i}") for i in range(5)), 100)
+
+    def test_dequeue_leases_most_searched_and_ack_keeps_new_words(self):
+        for word in ["low", "high", "high", "mid", "mid", "high"]:
+            self.queue.enqueue(word)
+        batch = self.queue.dequeue(limit=2, now=1000.0)
+        self.assertEqual(batch.words, ["high", "mid"])
+        self.assertEqual(self.queue.dequeue(now=1000.0).words, ["low"])   # leased words are skipped
+
+        self.queue.enqueue("fresh")                  # logged while the updater runs
+        self.assertEqual(self.queue.ack(batch), 2)
+        self.assertEqual(sorted(self.queue.peek()), ["fresh", "low"])
+
+    def test_released_or_expired_leases_come_back(self):
+        self.queue.enqueue("yeet")
+        batch = self.queue.dequeue(lease_seconds=60, now=1000.0)
+        self.queue.release(batch)
+        self.assertEqual(self.queue.dequeue(lease_seconds=60, now=1000.0).words, ["yeet"])
+        self.assertEqual(self.queue.dequeue(now=1030.0).words, [])
+        retry = self.queue.dequeue(now=1061.0)
+        self.assertEqual(retry.words, ["yeet"])
+        self.assertEqual(self.queue.ack(batch), 0)   # the stale lease can't ack
+        self.assertEqual(self.queue.ack(retry), 1)
+
+    def test_partial_ack_then_release_keeps_unsearched_words(self):
+        for word in ["rizz", "yeet", "yeet"]:
+            self.queue.enqueue(word)
+        batch = self.queue.dequeue(now=1000.0)
+        self.assertEqual(self.queue.ack(batch, ["rizz"]), 1)    # yeet's searches failed
+        self.queue.release(batch)
+        self.assertEqual(self.queue.dequeue(now=1000.0).words, ["yeet"])
+        self.assertEqual(self.queue.hits("yeet"), 2)
+
+    def test_killed_run_reclaims_its_lease(self):
+        for word in ["rizz", "yeet"]:
+            self.queue.enqueue(word)
+        batch = self.queue.dequeue(now=1000.0)        # the run is then killed
+        self.assertEqual(self.queue.dequeue(now=1010.0).words, [])
+        retry = self.queue.reclaim(batch.token, now=1010.0)
+        self.assertEqual(sorted(retry.words), ["rizz", "yeet"])
+        self.assertEqual(self.queue.ack(retry), 2)
+
+    def test_imports_legacy_text_file(self):
+        with open(self.legacy, "w", encoding="utf-8") as f:
+            f.write("peng\ncooked\n")
+        self.assertEqual(sorted(self.queue.peek()), ["cooked", "peng"])
+        self.assertFalse(os.path.exists(self.legacy))
+
+
+if __name__ == '__main__':
+    unittest.main()
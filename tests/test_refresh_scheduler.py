@@ -0,0 +1,71 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data import history_store, refresh_scheduler
+
+
+def _day(offset):
+    return (datetime(2026, 7, 1) + timedelta(days=offset)).strftime("%Y-%m-%d")
+
+
+class TestRefreshScheduler(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.history_dir = os.path.join(self.tmp.name, "mentions_history")
+        self.vault = os.path.join(self.tmp.name, "word_vault.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _record(self, day, counts):
+        history_store.append_rows([
+            {"date": day, "word": w, "niche_count": n, "mainstream_count": m}
+            for w, (n, m) in counts.items()
+        ], self.history_dir)
+
+    def _plan(self, words, day, budget):
+        return refresh_scheduler.plan(words, day, budget, history_dir=self.history_dir, vault_db=self.vault)
+
+    def test_every_word_refreshed_within_guarantee(self):
+        words = [f"word{i:02d}" for i in range(20)]
+        budget = 4
+        guarantee = max(refresh_scheduler.MAX_STALENESS_DAYS, 20 // budget)
+        last_seen = {}
+        for offset in range(30):
+            day = _day(offset)
+            chosen = self._plan(words, day, budget)
+            self.assertLessEqual(len(chosen), budget)
+            self._record(day, {w: (1, 0) for w in chosen})
+            last_seen.update({w: offset for w in chosen})
+            if offset >= guarantee:
+                stalest = max(offset - last_seen.get(w, -1) for w in words)
+                self.assertLessEqual(stalest, guarantee, day)
+
+    def test_volatile_and_searched_words_beat_flat_ones(self):
+        words = ["flat", "jumpy", "searched", "zzz"]
+        for offset in range(4):
+            self._record(_day(offset), {"flat": (0, 0), "jumpy": (offset * 7 % 10, 0),
+                                        "searched": (0, 0), "zzz": (5, offset * 9 % 20)})
+        conn = sqlite3.connect(self.vault)
+        conn.execute("CREATE TABLE slang_terms (word TEXT PRIMARY KEY, last_searched_at TEXT)")
+        conn.execute("INSERT INTO slang_terms VALUES ('Searched', ?)", (_day(3) + " 12:00:00",))
+        conn.commit()
+        conn.close()
+
+        chosen = self._plan(words, _day(4), budget=3)
+        self.assertNotIn("flat", chosen)
+        self.assertEqual(set(chosen), {"jumpy", "searched", "zzz"})
+
+    def test_skips_words_already_sampled_today(self):
+        self._record(_day(0), {"rizz": (1, 1)})
+        self.assertEqual(self._plan(["rizz", "aura"], _day(0), budget=5), ["aura"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data.no_api_scraper import FetchError
+from data.run_journal import RunJournal
+from data.update_pipeline import UpdatePipeline
+from tests.test_update_pipeline import fake_fetch, fake_score, run
+
+
+class TestRunJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "journal.jsonl")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_and_torn_tail(self):
+        journal = RunJournal("2099-01-01", self.path)
+        journal.record("mention", "rizz", "london", 3, [])
+        journal.record("discover", "slang", "memes", 2, ["a post", "another"])
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"stage": "mention", "wo')          # killed mid-write
+
+        resumed = RunJournal("2099-01-01", self.path)
+        self.assertEqual(resumed.resumed, 2)
+        self.assertEqual(resumed.get("discover", "slang", "memes"), (2, ["a post", "another"]))
+        resumed.record("mention", "peak", "london", 1, [])
+        self.assertEqual(len(RunJournal("2099-01-01", self.path)), 3)
+
+    def test_lease_survives_restart(self):
+        journal = RunJournal("2099-01-01", self.path)
+        journal.record_lease("token-1")
+        journal.record("mention", "rizz", "london", 3, [])
+        resumed = RunJournal("2099-01-01", self.path)
+        self.assertEqual(resumed.lease, "token-1")
+        self.assertEqual(resumed.resumed, 1)
+        self.assertIsNone(RunJournal("2099-01-02", self.path).lease)
+
+    def test_other_day_starts_fresh(self):
+        RunJournal("2099-01-01", self.path).record("mention", "rizz", "london", 3, [])
+        self.assertEqual(len(RunJournal("2099-01-02", self.path)), 0)
+
+    def test_interrupted_run_resumes_without_refetching(self):
+        _pipeline, _known, expected_appended, expected_recorded = run(fetch_workers=1)
+
+        calls = []
+
+        def dying_fetch(subreddit, keyword, is_mainstream):
+            if len(calls) == 20:
+                raise RuntimeError("runner timed out")
+            calls.append((subreddit, keyword))
+            return fake_fetch(subreddit, keyword, is_mainstream)
+
+        def pipeline(fetch, appended, recorded):
+            return UpdatePipeline(
+                {"aura", "peak"}, pending=["yeet", "ghost", "aura"], fetch=fetch, score=fake_score,
+                define=lambda word, timeout=None: None, append=appended.extend, record=recorded.extend,
+                seed_terms=["slang", "trend"], fetch_workers=1, today="2099-01-01",
+                journal=RunJournal("2099-01-01", self.path),
+            )
+
+        with self.assertRaises(RuntimeError):
+            pipeline(dying_fetch, [], []).run()
+
+        refetched, appended, recorded = [], [], []
+
+        def counting_fetch(subreddit, keyword, is_mainstream):
+            refetched.append((subreddit, keyword))
+            return fake_fetch(subreddit, keyword, is_mainstream)
+
+        resumed = pipeline(counting_fetch, appended, recorded).run()
+        self.assertEqual(resumed.replayed, 20)
+        self.assertEqual(len(refetched), (2 + 2 + 4) * 5 - 20)
+        self.assertEqual(appended, expected_appended)
+        self.assertEqual(recorded, expected_recorded)
+
+    def test_failed_fetch_is_not_journaled(self):
+        def flaky_fetch(subreddit, keyword, is_mainstream):
+            if keyword in ("rizz", "yeet") and subreddit == "london":
+                raise FetchError("rate limited")
+            return fake_fetch(subreddit, keyword, is_mainstream)
+
+        recorded = []
+        first = UpdatePipeline({"rizz", "peak"}, pending=["yeet"], fetch=flaky_fetch, score=fake_score,
+                               define=lambda word, timeout=None: None, append=lambda entries: None, record=recorded.extend,
+                               seed_terms=[], mention_words=["rizz", "peak"], today="2099-01-01",
+                               journal=RunJournal("2099-01-01", self.path)).run()
+        self.assertEqual(first.failed, 2)
+        # No zero-filled count for rizz, and yeet stays unresolved.
+        self.assertEqual([r["word"] for r in recorded], ["peak"])
+        self.assertEqual(first.skipped_mentions, ["rizz"])
+        self.assertEqual(first.unsearched, ["yeet"])
+
+        journal = RunJournal("2099-01-01", self.path)
+        self.assertIsNone(journal.get("mention", "rizz", "london"))
+        self.assertEqual(journal.resumed, 4 + 5 + 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models import search_engine
+
+
+class TestSearchEngineArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self._db_path = search_engine.DB_PATH
+        search_engine.DB_PATH = os.path.join(self.tmp.name, "slang_vault.db")
+
+    def tearDown(self):
+        search_engine.DB_PATH = self._db_path
+        self.tmp.cleanup()
+
+    def test_last_row_wins_for_duplicated_words(self):
+        # data/slang_2026_master.csv lists "cap" twice; the later row has
+        # always been the one search returns.
+        result = search_engine.SearchEngine().search_word("Cap")
+        self.assertEqual(result, {"meaning": "Cap", "status": "Peak", "source": "2026 Archive"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from models.slang_detector import is_slang
+from models.slang_detector import is_slang, is_slang_batch
 
 class TestSlangDetector(unittest.TestCase):
 
@@ -38,5 +38,14 @@ class TestSlangDetector(unittest.TestCase):
         self.assertTrue(result['is_slang'])
         print(f"Skibidi Test: {result}")
 
+    def test_batch_matches_loop(self):
+        post = "This guy has insane rizz, no cap"
+        candidates = [
+            ("rizz", post, "ukdrill"), ("cap", post, "ukdrill"), ("guy", post, "ukdrill"),
+            ("friend", "He is my best friend", "AskReddit"), ("skibidi", "", "memes"),
+        ]
+        self.assertEqual(is_slang_batch(candidates), [is_slang(*c) for c in candidates])
+        self.assertEqual(is_slang_batch(candidates, workers=2), is_slang_batch(candidates))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,111 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.forecast import forecast_matrix, holt_damped
+from models.trends import ewma, growth_rates, linear_growth_rate, momentum, rolling_growth_rates, rolling_slopes
+
+
+def reference_growth_rate(y):
+    """The original pure-Python least-squares growth rate."""
+    n = len(y)
+    if n < 2:
+        return 0.0
+    x = list(range(n))
+    mean_x = sum(x) / n
+    mean_y = sum(y) / n
+    denom = sum((xi - mean_x) ** 2 for xi in x)
+    slope = sum((xi - mean_x) * (yi - mean_y) for xi, yi in zip(x, y)) / denom
+    start_value = mean_y - slope * mean_x
+    if start_value <= 0:
+        return 0.0
+    return slope * (n - 1) / start_value
+
+
+class TestGrowthRates(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.matrix = rng.poisson(4, (50, 30)).astype(float)
+        self.matrix[0] = np.arange(30)          # fitted start <= 0
+        self.matrix[1] = 0                      # flat zero series
+        self.matrix[2] = np.arange(30)[::-1]    # declining
+
+    def test_single_matches_reference(self):
+        for row in self.matrix:
+            self.assertAlmostEqual(linear_growth_rate(row), reference_growth_rate(row.tolist()), places=10)
+        self.assertEqual(linear_growth_rate([5.0]), 0.0)
+
+    def test_batched_matches_reference(self):
+        expected = [reference_growth_rate(row.tolist()) for row in self.matrix]
+        np.testing.assert_allclose(growth_rates(self.matrix), expected, atol=1e-10)
+
+    def test_batched_respects_lengths(self):
+        lengths = np.arange(50) % 30
+        expected = [reference_growth_rate(row[:n].tolist()) for row, n in zip(self.matrix, lengths)]
+        np.testing.assert_allclose(growth_rates(self.matrix, lengths), expected, atol=1e-10)
+
+
+class TestWindowedTrends(unittest.TestCase):
+    def setUp(self):
+        self.y = np.random.default_rng(11).poisson(6, 40).astype(float)
+
+    def test_rolling_matches_naive_windows(self):
+        window = 7
+        slopes = rolling_slopes(self.y, window)
+        rates = rolling_growth_rates(self.y, window)
+        self.assertTrue(np.isnan(slopes[:window - 1]).all())
+        for i in range(window - 1, len(self.y)):
+            block = self.y[i - window + 1:i + 1]
+            self.assertAlmostEqual(slopes[i], np.polyfit(np.arange(window), block, 1)[0], places=9)
+            self.assertAlmostEqual(rates[i], reference_growth_rate(block.tolist()), places=9)
+
+    def test_rolling_is_row_wise_on_matrices(self):
+        matrix = np.vstack([self.y, self.y[::-1]])
+        np.testing.assert_allclose(rolling_growth_rates(matrix, 5)[1], rolling_growth_rates(self.y[::-1], 5))
+
+    def test_ewma_and_momentum(self):
+        level = ewma(self.y, 0.3)
+        expected = self.y[0]
+        for t, value in enumerate(self.y):
+            expected = value if t == 0 else 0.3 * value + 0.7 * expected
+            self.assertAlmostEqual(level[t], expected)
+
+        mom = momentum(self.y, 5)
+        self.assertTrue(np.isnan(mom[:9]).all())
+        self.assertAlmostEqual(mom[20], self.y[16:21].mean() - self.y[11:16].mean())
+
+
+class TestForecast(unittest.TestCase):
+    def _matrix(self, niche, mainstream):
+        niche, mainstream = np.atleast_2d(niche).astype(float), np.atleast_2d(mainstream).astype(float)
+        n = niche.shape[1]
+        return {"words": np.array(["w%d" % i for i in range(len(niche))]),
+                "first_day": np.full(len(niche), 20600), "last_day": np.full(len(niche), 20600 + n - 1),
+                "lengths": np.full(len(niche), n), "niche": niche, "mainstream": mainstream}
+
+    def test_holt_tracks_a_linear_series(self):
+        y = np.vstack([np.arange(60) * 2.0 + 5])
+        level, trend, _ = holt_damped(y, np.array([60]), alpha=0.8, beta=0.2, phi=1.0)
+        self.assertAlmostEqual(level[0], y[0, -1], places=3)
+        self.assertAlmostEqual(trend[0], 2.0, places=3)
+
+    def test_projected_crossing(self):
+        days = np.arange(60)
+        result = forecast_matrix(self._matrix(
+            [np.full(60, 10), np.full(60, 10), np.full(60, 10)],
+            [days * 0.25, np.full(60, 2), np.full(60, 30)],
+        ), horizon=120)
+        rising, flat, already = result.itertuples(index=False)
+        self.assertGreater(rising.days_to_cringe, 0)
+        self.assertEqual(rising.cringe_date, str(np.datetime64("1970-01-01") + 20659 + int(rising.days_to_cringe)))
+        self.assertTrue(np.isnan(flat.days_to_cringe))
+        self.assertEqual(flat.cringe_date, "")
+        self.assertEqual(already.days_to_cringe, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import random
+import sys
+import time
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data.update_pipeline import FetchPlan, Job, UpdatePipeline
+
+POSTS = {
+    "slang": ["this rizz is unreal", "peak rizz energy", "mid vibes honestly"],
+    "trend": ["skibidi everywhere now", "skibidi again", "normal words here"],
+}
+
+
+def fake_fetch(subreddit, keyword, is_mainstream):
+    time.sleep(random.uniform(0, 0.003))   # finish out of order
+    posts = POSTS.get(keyword, [f"{keyword} spotted in {subreddit}"] if keyword != "ghost" else [])
+    return [(f"{subreddit}-{keyword}-{i}", keyword, subreddit, text, 0.0, is_mainstream)
+            for i, text in enumerate(posts)]
+
+
+def fake_score(candidates, workers=1):
+    return [{"is_slang": word in {"rizz", "skibidi", "yeet"}, "score": 0.9, "reasons": []}
+            for word, _context, _sub in candidates]
+
+
+def run(fetch_workers):
+    appended, recorded = [], []
+    known = {"aura", "peak"}
+    pipeline = UpdatePipeline(
+        known, pending=["yeet", "ghost", "aura"], fetch=fake_fetch, score=fake_score,
+        define=lambda word, timeout=None: None, append=appended.extend, record=recorded.extend,
+        seed_terms=["slang", "trend"], fetch_workers=fetch_workers, queue_size=2,
+        today="2099-01-01",
+    ).run()
+    return pipeline, known, appended, recorded
+
+
+class TestUpdatePipeline(unittest.TestCase):
+    def test_entries_and_rows(self):
+        pipeline, known, appended, recorded = run(fetch_workers=4)
+        self.assertEqual([e["word"] for e in pipeline.pending_entries], ["yeet"])
+        self.assertEqual([e["word"] for e in pipeline.new_entries], ["rizz", "skibidi"])
+        self.assertEqual([e["word"] for e in appended], ["yeet", "rizz", "skibidi"])
+        self.assertTrue({"yeet", "rizz", "skibidi"} <= known)
+
+        # Known words plus this run's new words, one row each, with every subreddit counted.
+        self.assertEqual([r["word"] for r in recorded], ["aura", "peak", "rizz", "skibidi", "yeet"])
+        self.assertEqual({(r["niche_count"], r["mainstream_count"]) for r in recorded}, {(3, 2)})
+        # pending, seed terms, mentions; "yeet" is searched once as pending and reused for its mentions
+        self.assertEqual(pipeline.stats["fetch"].items, (2 + 2 + 4) * 5)
+        self.assertIn("Stage timings", pipeline.report())
+
+    def test_result_independent_of_fetch_concurrency(self):
+        serial = run(fetch_workers=1)
+        concurrent = run(fetch_workers=6)
+        self.assertEqual(serial[2], concurrent[2])
+        self.assertEqual(serial[3], concurrent[3])
+
+    def test_seed_term_shared_with_mentions_is_fetched_once(self):
+        fetched, recorded = [], []
+
+        def counting_fetch(subreddit, keyword, is_mainstream):
+            fetched.append((subreddit, keyword))
+            return fake_fetch(subreddit, keyword, is_mainstream)
+
+        UpdatePipeline({"aura"}, fetch=counting_fetch, score=fake_score, define=lambda word, timeout=None: None,
+                       append=lambda entries: None, record=recorded.extend,
+                       seed_terms=["aura"], today="2099-01-01").run()
+        self.assertEqual(len(fetched), len(set(fetched)))
+        self.assertEqual(len(fetched), 5)
+        self.assertEqual([(r["word"], r["niche_count"], r["mainstream_count"]) for r in recorded],
+                         [("aura", 3, 2)])
+
+    def test_fetch_plan_fans_out(self):
+        plan = FetchPlan([Job("discover", 0, 0, "london", "vibe", False),
+                          Job("mention", 0, 0, "london", "vibe", False),
+                          Job("mention", 0, 1, "memes", "vibe", True)])
+        self.assertEqual(len(plan), 2)
+        self.assertEqual([len(r.consumers) for r in plan.requests()], [2, 1])
+        self.assertIn("2 request(s) for 3 job(s) (1 shared)", plan.summary())
+
+    def test_fetch_error_is_raised_not_hung(self):
+        def broken_fetch(subreddit, keyword, is_mainstream):
+            raise RuntimeError("boom")
+
+        pipeline = UpdatePipeline(set(), fetch=broken_fetch, score=fake_score, record=lambda rows: None,
+                                  append=lambda entries: None, seed_terms=["slang"], today="2099-01-01")
+        with self.assertRaises(RuntimeError):
+            pipeline.run()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data import archive
+from data.updater_benchmark import FixtureFetch, run_benchmark, synthetic_words
+from tests.test_update_pipeline import fake_score
+
+
+def score_everything(candidates, workers=1):
+    return [{"is_slang": True, "score": 1.0, "reasons": []} for _ in fake_score(candidates)]
+
+
+class TestUpdaterBenchmark(unittest.TestCase):
+    def test_report_without_touching_tracked_data(self):
+        before = os.stat(archive.MASTER_CSV_PATH)
+        with tempfile.TemporaryDirectory() as tmp:
+            report = run_benchmark(archive_size=40, pending_words=3, budget=20,
+                                   score=score_everything, data_dir=tmp)
+            kept = archive.load(os.path.join(tmp, "slang_master_2026.csv"))
+            self.assertEqual(len(kept), 40 + report["rows_written"]["archive"])
+            self.assertTrue(os.listdir(os.path.join(tmp, "mentions_history")))
+        after = os.stat(archive.MASTER_CSV_PATH)
+        self.assertEqual((before.st_mtime_ns, before.st_size), (after.st_mtime_ns, after.st_size))
+
+        json.dumps(report)
+        self.assertEqual(report["mention_words"], 20)
+        self.assertEqual(report["requests"], report["stages"]["fetch"]["items"])
+        self.assertGreater(report["requests"], 0)
+        self.assertGreater(report["rows_written"]["archive"], 0)
+        self.assertGreaterEqual(report["rows_written"]["history"], 20)
+        self.assertEqual(set(report["stages"]), {"fetch", "score", "write"})
+
+    def test_request_interval_caps_throughput(self):
+        report = run_benchmark(archive_size=10, pending_words=1, budget=5, request_interval=0.01,
+                               fetch_workers=4, score=score_everything)
+        self.assertEqual(report["requests_per_s_cap"], 100.0)
+        # n requests span (n - 1) intervals, however many fetchers run.
+        n = report["requests"]
+        self.assertLessEqual(report["requests_per_s"], 100.0 * n / (n - 1) + 1)
+
+    def test_fixtures_override_synthetic_posts(self):
+        fetch = FixtureFetch({"memes/rizz": ["rizz on memes"], "rizz": ["rizz anywhere"]})
+        self.assertEqual(fetch("memes", "rizz", True)[0][3], "rizz on memes")
+        self.assertEqual(fetch("london", "rizz", False)[0][3], "rizz anywhere")
+        self.assertEqual(fetch("london", "vibe", False), fetch("london", "vibe", False))
+        self.assertEqual(synthetic_words(5), synthetic_words(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data.urban_dictionary import fetch_definitions
+
+
+class TestFetchDefinitions(unittest.TestCase):
+    def test_concurrent_bounded_and_deadline_falls_back(self):
+        lock = threading.Lock()
+        active = [0, 0]     # current, peak
+        timeouts = []
+
+        def slow_define(word, timeout):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+                timeouts.append(timeout)
+            time.sleep(1.0 if word == "stuck" else 0.05)
+            with lock:
+                active[0] -= 1
+            if word == "broken":
+                raise RuntimeError("bad response")
+            return None if word == "unknown" else f"definition of {word}"
+
+        words = [f"w{i}" for i in range(8)] + ["unknown", "broken", "stuck", "w0"]
+        started = time.perf_counter()
+        found = fetch_definitions(words, deadline=0.5, max_workers=4, fetch=slow_define)
+        elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 0.9)                  # 11 lookups, not 11 x 50 ms serially, nor waiting on "stuck"
+        self.assertLessEqual(active[1], 4)
+        self.assertEqual(list(found), list(dict.fromkeys(words)))
+        self.assertEqual(found["w3"], "definition of w3")
+        self.assertIsNone(found["unknown"])
+        self.assertIsNone(found["broken"])
+        self.assertIsNone(found["stuck"])              # missed the deadline
+        self.assertTrue(all(0 < t <= 0.5 for t in timeouts))   # no request outlives the deadline
+
+    def test_empty_batch(self):
+        self.assertEqual(fetch_definitions([]), {})
+
+
+if __name__ == '__main__':
+    unittest.main()